@@ -0,0 +1,198 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+from lebedigital.calibration.calibrationWorkflow import estimate_youngs_modulus
+from lebedigital.calibration.sample_store import SAMPLE_STORE_DIR, load_samples
+from lebedigital.calibration.utils import read_exp_data_E_mod
+
+# environment variables controlling the number of threads used by the linear algebra backends
+THREAD_LIMIT_VARIABLES = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+logger = logging.getLogger(__name__)
+
+
+class BatchCalibrationError(RuntimeError):
+    """Raised after a batch calibration in which some calibrations failed
+
+    Attributes
+    ----------
+    posteriors : dict
+        The posterior samples of the successfully calibrated experiments, as returned by `calibrate_experiments`.
+    failed : dict
+        The exception of each failed calibration, keyed by experiment name.
+    """
+
+    def __init__(self, posteriors: dict, failed: dict):
+        self.posteriors = posteriors
+        self.failed = failed
+        super().__init__(
+            f"{len(failed)} of {len(posteriors) + len(failed)} calibrations failed: "
+            + ", ".join(f"{name} ({error!r})" for name, error in sorted(failed.items()))
+        )
+
+
+def load_experiments(experiment_records: list) -> list:
+    """
+    Loads the experimental data for a list of experiments, e.g. the result of a knowledge graph query.
+
+    Parameters
+    ----------
+    experiment_records : list of dict
+        Each entry must contain the arguments of `read_exp_data_E_mod`:
+        - path : Path to the folder where the experimental data in .csv format is stored.
+        - exp_name : the experiment name.csv
+        - length : the length of the specimen
+        - diameter : the diameter of the specimen
+
+    Returns
+    -------
+    experiments : list of dict
+        The experimental data dicts as returned by `read_exp_data_E_mod`.
+    """
+    return [
+        read_exp_data_E_mod(
+            path=record["path"], exp_name=record["exp_name"], length=record["length"], diameter=record["diameter"]
+        )
+        for record in experiment_records
+    ]
+
+
+@contextmanager
+def _thread_limit(threads_per_solve: int):
+    """
+    Temporarily sets the thread limits of the linear algebra backends, the spawned worker processes inherit them.
+    """
+    previous = {var: os.environ.get(var) for var in THREAD_LIMIT_VARIABLES}
+    os.environ.update({var: str(threads_per_solve) for var in THREAD_LIMIT_VARIABLES})
+    try:
+        yield
+    finally:
+        for var, value in previous.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def _calibrate_single(
+    experimental_data: dict,
+    calibration_metadata: dict,
+    calibrated_data_path: str,
+    sample_store_path: str,
+    profile_dir: str,
+    mode: str,
+):
+    """
+    Runs the E modulus calibration for one experiment, executed in a worker process.
+    The posterior samples are written to the sample store by `estimate_youngs_modulus`.
+
+    Returns
+    -------
+    str : the experiment name (without file extension)
+    """
+    experiment_name = os.path.splitext(experimental_data["exp_name"])[0]
+    profile_path = None if profile_dir is None else os.path.join(profile_dir, f"{experiment_name}_profile.json")
+    estimate_youngs_modulus(
+        experimental_data=experimental_data,
+        calibration_metadata=calibration_metadata,
+        calibrated_data_path=calibrated_data_path,
+        mode=mode,
+        sample_store_path=sample_store_path,
+        profile_path=profile_path,
+    )
+    return experiment_name
+
+
+def calibrate_experiments(
+    experiments: list,
+    calibration_metadata,
+    calibrated_data_path: str,
+    max_workers: int = None,
+    threads_per_solve: int = 1,
+    sample_store_path: str = None,
+    profile_dir: str = None,
+    mode="full",
+    raise_on_error: bool = True,
+) -> dict:
+    """
+    Calibrates the Young's modulus for a list of experiments. The inverse problems are independent and are scheduled
+    across a pool of worker processes, each worker runs `estimate_youngs_modulus` for one experiment at a time.
+
+    Each calibration writes its knowledge graph to `calibrated_data_path` as before, in addition the posterior samples
+    of all experiments are collected in one sample store (see `lebedigital.calibration.sample_store`).
+
+    Parameters
+    ----------
+    experiments : list of dict
+        Experimental data dicts, e.g. from `load_experiments` or `read_exp_data_E_mod`. The experiment names (without
+        file extension) must be unique.
+    calibration_metadata : dict or list of dict
+        Calibration metadata (E_loc, E_scale), either one dict used for all experiments or one dict per experiment.
+    calibrated_data_path : str
+        Path where the knowledge graphs are written.
+    max_workers : int, optional
+        Number of worker processes, this caps the number of concurrent FE solves on this node.
+        Defaults to the number of cores divided by `threads_per_solve`.
+    threads_per_solve : int
+        Number of threads each FE solve is allowed to use (OMP/BLAS), avoids oversubscription of the node.
+    sample_store_path : str, optional
+        The sample store for the posteriors of all experiments, defaults to 'posterior_samples' in
+        calibrated_data_path.
+    profile_dir : str, optional
+        If given, each calibration is profiled and its profile is written to '<experiment name>_profile.json' in
+        this directory.
+    mode : "full" or "cheap". For testing purposes.
+    raise_on_error : bool
+        If True, a BatchCalibrationError with the successful posteriors and the failures is raised after all
+        calibrations are finished, if any of them failed. If False, the failures are only logged.
+
+    Returns
+    -------
+    posteriors : dict
+        The posterior samples of E for each successfully calibrated experiment, keyed by experiment name
+        (memory-mapped from the sample store).
+    """
+    if isinstance(calibration_metadata, dict):
+        calibration_metadata = [calibration_metadata] * len(experiments)
+    assert len(calibration_metadata) == len(experiments), "One calibration metadata dict per experiment required"
+
+    experiment_names = [os.path.splitext(experiment["exp_name"])[0] for experiment in experiments]
+    assert len(set(experiment_names)) == len(experiment_names), "The experiment names must be unique"
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // threads_per_solve)
+    max_workers = max(1, min(max_workers, len(experiments)))
+
+    if sample_store_path is None:
+        sample_store_path = os.path.join(calibrated_data_path, SAMPLE_STORE_DIR)
+
+    posteriors = {}
+    failed = {}
+    # spawn fresh processes, FEniCS/MPI does not like to be forked
+    context = multiprocessing.get_context("spawn")
+    with _thread_limit(threads_per_solve), ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = {
+            pool.submit(
+                _calibrate_single, experiment, metadata, calibrated_data_path, sample_store_path, profile_dir, mode
+            ): name
+            for experiment, metadata, name in zip(experiments, calibration_metadata, experiment_names)
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                experiment_name = future.result()
+                posteriors[experiment_name] = load_samples(sample_store_path, experiment_name, "E")
+                logger.info("Calibration of %s done (%d/%d)", name, len(posteriors), len(experiments))
+            except Exception as error:
+                failed[name] = error
+                logger.error("Calibration of %s failed: %r", name, error)
+
+    if failed:
+        if raise_on_error:
+            raise BatchCalibrationError(posteriors, failed)
+        logger.warning("%d of %d calibrations failed: %s", len(failed), len(experiments), ", ".join(sorted(failed)))
+
+    return posteriors
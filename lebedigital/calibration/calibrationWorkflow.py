@@ -14,14 +14,18 @@ rc("text", usetex=True)
 # local imports (probeye)
 from probeye.definition.inverse_problem import InverseProblem
 from probeye.definition.likelihood_model import GaussianLikelihoodModel
-from probeye.inference.emcee.solver import EmceeSolver
 from probeye.ontology.knowledge_graph_export import (
     export_knowledge_graph, export_results_to_knowledge_graph)
-from probeye.ontology.knowledge_graph_import import import_parameter_samples
 
 # local imports (others)
 from lebedigital.calibration.forwardmodel_linear_elastic_cylinder import \
     LinearElasticityCylinder
+from lebedigital.calibration.sample_store import (SAMPLE_STORE_DIR,
+                                                  load_samples,
+                                                  samples_from_inference_data,
+                                                  write_samples)
+from lebedigital.calibration.vectorized_solver import VectorizedEmceeSolver
+from lebedigital.profiling import profiled, timer
 
 
 def _check_E_mod_calibration_metadata(calibration_metadata: dict):
@@ -59,8 +63,10 @@ def _check_E_mod_experimental_data(experimental_data: dict):
         return False
 
 
+@profiled("estimate_youngs_modulus")
 def estimate_youngs_modulus(
-    experimental_data: dict, calibration_metadata: dict, calibrated_data_path: str, mode="full"
+    experimental_data: dict, calibration_metadata: dict, calibrated_data_path: str, mode="full", n_walkers: int = 4,
+    sample_store_path: str = None, profile_path: str = None,
 ):
     """
     Function to solve an inverse problem using Bayesian inference to infer Young's Modulus (E), with experimental
@@ -86,6 +92,16 @@ def estimate_youngs_modulus(
         Path where the calibrated results needs to be stored. The calibration results along with the inverse problem
         setting is stored in this path as knowledge graph
     mode : "full" or "cheap". For testing purposes.
+    n_walkers : int
+        Number of emcee walkers. All walkers of a step are evaluated in one vectorised forward model call, the FE
+        problem is only solved once, so the cost per step does not grow with the number of walkers.
+    sample_store_path : str, optional
+        Sample store the posterior samples are written to, in addition to the knowledge graph. Defaults to the
+        directory 'posterior_samples' in calibrated_data_path. Use `load_samples` to read them without parsing the
+        knowledge graph.
+    profile_path : str, optional
+        If given, the run is profiled (FE construction and solves, likelihood evaluations, knowledge graph and sample
+        store I/O), the profile is written as json to this path and its summary table is logged.
 
     Returns
     -------
@@ -125,61 +141,62 @@ def estimate_youngs_modulus(
     #       Define the Inference Problem
     # =========================================
 
-    # initialize the inverse problem with a useful name
-    problem = InverseProblem("compression test calibration")
-
-    # add all parameters to the problem
-    problem.add_parameter(
-        "E",
-        "model",
-        tex="$E$",
-        info="Slope of the graph",
-        prior=("normal", {"mean": loc_E, "std": scale_E}),  # can add log_normal here
-    )
-
-    problem.add_parameter(
-        "sigma",
-        "likelihood",
-        tex=r"$\sigma$",
-        info="Std. dev, of 0-mean noise model",
-        prior=("uniform", {"low": low_sigma, "high": high_sigma}),
-    )
-
-    # Load the forward model and add it to the Inverse problem
-    linear_elasticity = LinearElasticityCylinder("linear_elasticity_cylinder")
-    problem.add_forward_model(linear_elasticity)
-
-    # ============================================
-    #     Add experimental data to the Inverse Problem
-    # ============================================
-    experiment_name = os.path.splitext(exp_output["exp_name"])[0]
-    y_test = exp_output["force"]  # in kN
-    # add the experimental data
-    problem.add_experiment(
-        experiment_name,
-        fwd_model_name="linear_elasticity_cylinder",
-        sensor_values={
-            "nu": 0.2,
-            "height": exp_output["height"],
-            "radius": exp_output["diameter"] / 2,
-            "displacement_list": exp_output["displacement"],
-            linear_elasticity.output_sensor.name: y_test,
-        },
-    )
+    with timer("calibration.problem_setup"):
+        # initialize the inverse problem with a useful name
+        problem = InverseProblem("compression test calibration")
+
+        # add all parameters to the problem
+        problem.add_parameter(
+            "E",
+            "model",
+            tex="$E$",
+            info="Slope of the graph",
+            prior=("normal", {"mean": loc_E, "std": scale_E}),  # can add log_normal here
+        )
 
-    # ==============================================
-    #       Add likelihood model(s)
-    # ==============================================
+        problem.add_parameter(
+            "sigma",
+            "likelihood",
+            tex=r"$\sigma$",
+            info="Std. dev, of 0-mean noise model",
+            prior=("uniform", {"low": low_sigma, "high": high_sigma}),
+        )
 
-    # add the likelihood model to the problem
-    problem.add_likelihood_model(
-        GaussianLikelihoodModel(
-            prms_def="sigma",
-            experiment_name=experiment_name,
-            model_error="additive",
-            name="SimpleLikelihoodModel",
+        # Load the forward model and add it to the Inverse problem
+        linear_elasticity = LinearElasticityCylinder("linear_elasticity_cylinder")
+        problem.add_forward_model(linear_elasticity)
+
+        # ============================================
+        #     Add experimental data to the Inverse Problem
+        # ============================================
+        experiment_name = os.path.splitext(exp_output["exp_name"])[0]
+        y_test = exp_output["force"]  # in kN
+        # add the experimental data
+        problem.add_experiment(
+            experiment_name,
+            fwd_model_name="linear_elasticity_cylinder",
+            sensor_values={
+                "nu": 0.2,
+                "height": exp_output["height"],
+                "radius": exp_output["diameter"] / 2,
+                "displacement_list": exp_output["displacement"],
+                linear_elasticity.output_sensor.name: y_test,
+            },
+        )
+
+        # ==============================================
+        #       Add likelihood model(s)
+        # ==============================================
+
+        # add the likelihood model to the problem
+        problem.add_likelihood_model(
+            GaussianLikelihoodModel(
+                prms_def="sigma",
+                experiment_name=experiment_name,
+                model_error="additive",
+                name="SimpleLikelihoodModel",
+            )
         )
-    )
 
     # give problem overview
     problem.info()
@@ -195,48 +212,59 @@ def estimate_youngs_modulus(
     # if the file name has extension, take only the base name.
     basename_owl = os.path.basename(__file__).split(".")[0] + experiment_name
     knowledge_graph_file = os.path.join(dir_path, basename_owl)
-    export_knowledge_graph(problem, knowledge_graph_file, data_dir=dir_path)
+    with timer("io.knowledge_graph_export"):
+        export_knowledge_graph(problem, knowledge_graph_file, data_dir=dir_path)
 
     # ========================================================================
     #        Solve problem with inference engine and write results to graph
     # ========================================================================
 
-    # run inference step using emcee
-    emcee_solver = EmceeSolver(problem, seed=10, show_progress=True)
-
-    if mode == "cheap":
-        inference_data = emcee_solver.run_mcmc(
-            n_walkers=4,
-            n_steps=6,
-            n_initial_steps=2,
-        )
-    elif mode == "test":
-        inference_data = emcee_solver.run_mcmc(
-            n_walkers=4,
-            n_steps=1,
-            n_initial_steps=1,
-        )
-    else:
-        inference_data = emcee_solver.run_mcmc(
-            n_walkers=4,
-            n_steps=100,
-            n_initial_steps=20,
-        )
+    # run inference step using emcee, all walkers of a step are evaluated in one call
+    emcee_solver = VectorizedEmceeSolver(problem, seed=10, show_progress=True)
+
+    with timer("calibration.sampling"):
+        if mode == "cheap":
+            inference_data = emcee_solver.run_mcmc(
+                n_walkers=n_walkers,
+                n_steps=6,
+                n_initial_steps=2,
+                vectorize=True,
+            )
+        elif mode == "test":
+            inference_data = emcee_solver.run_mcmc(
+                n_walkers=n_walkers,
+                n_steps=1,
+                n_initial_steps=1,
+                vectorize=True,
+            )
+        else:
+            inference_data = emcee_solver.run_mcmc(
+                n_walkers=n_walkers,
+                n_steps=100,
+                n_initial_steps=20,
+                vectorize=True,
+            )
 
     # export the results from the 'inference_data' object to the graph
-    export_results_to_knowledge_graph(
-        problem,
-        inference_data,
-        knowledge_graph_file,
-        data_dir=dir_path,
-    )
+    with timer("io.knowledge_graph_results_export"):
+        export_results_to_knowledge_graph(
+            problem,
+            inference_data,
+            knowledge_graph_file,
+            data_dir=dir_path,
+        )
 
     # =======================================================================
-    #                          Query the knowledge graph
+    #                          Write and query the sample store
     # =======================================================================
 
-    # get the samples from the knowledge graph
-    sample_dict = import_parameter_samples(knowledge_graph_file)
-    E_pos = sample_dict["E"]  # kN/mm2 ~ E_mean ~ 30E03N/mm2
+    # the samples are written to the sample store as well, reading them back does not require parsing the graph
+    if sample_store_path is None:
+        sample_store_path = os.path.join(dir_path, SAMPLE_STORE_DIR)
+    with timer("io.sample_store"):
+        write_samples(sample_store_path, experiment_name, samples_from_inference_data(problem, inference_data))
+
+        # get the samples from the sample store
+        E_pos = load_samples(sample_store_path, experiment_name, "E")  # kN/mm2 ~ E_mean ~ 30E03N/mm2
 
     return E_pos
@@ -1,12 +1,70 @@
+from functools import lru_cache
+
 import fenics_concrete
+import numpy as np
 # import probeye
 from probeye.definition.forward_model import ForwardModelBase
 from probeye.definition.sensor import Sensor
 
+from lebedigital.profiling import count, timed, timer
+
+
+@lru_cache(maxsize=None)
+def unit_stiffness(nu: float, radius: float, height: float, mesh_density: int) -> float:
+    """Computes the slope of the force-displacement curve of the cylinder for a Young's modulus of 1
+
+    The problem is linear elastic, therefore the reaction force scales linearly with E and the displacement.
+    The FE problem is only assembled and solved once per geometry/mesh, the result is cached.
+
+    Parameters
+    ----------
+        nu : Poisson's ratio
+        radius : radius of the cylinder in mm
+        height : height of the cylinder in mm
+        mesh_density : mesh density of the FE problem
+
+    Returns
+    -------
+        slope : reaction force per displacement for E = 1
+    """
+    parameters = fenics_concrete.Parameters()
+    # input parameters
+    parameters['E'] = 1.0
+    parameters['nu'] = nu
+    parameters['radius'] = radius
+    parameters['height'] = height
+    # problem parameters
+    parameters['mesh_density'] = mesh_density
+    parameters['log_level'] = 'WARNING'
+    parameters['bc_setting'] = 'free'
+    parameters['dim'] = 3
+
+    # a test load is applied and then interpolated to the load list
+    test_load = -0.05
+
+    # setup simulation
+    with timer("fe.construction"):
+        experiment = fenics_concrete.ConcreteCylinderExperiment(parameters)
+        problem = fenics_concrete.LinearElasticity(experiment, parameters)
+        # setup sensor
+        sensor = fenics_concrete.sensors.ReactionForceSensorBottom()
+        problem.add_sensor(sensor)
+        problem.experiment.apply_displ_load(test_load)
+    with timer("fe.solve"):
+        problem.solve()  # solving this
+
+    measured_test_force = problem.sensors[sensor.name].data[-1]
+
+    # compute slope of linear problem
+    return measured_test_force / test_load
+
 
 class LinearElasticityCylinder(ForwardModelBase):
     """Probeye forward model for a compression test on a linear elastic cylinder"""
 
+    height = 100  # gauge length in experiment in mm
+    mesh_density = 6
+
     def interface(self):
         """Definition of the variable parameter, the input and output sensors
         E                 : Young's modulus in N/mm²
@@ -22,6 +80,7 @@ class LinearElasticityCylinder(ForwardModelBase):
                               Sensor("displacement_list")]
         self.output_sensors = [Sensor('force_list', std_model="sigma")]
 
+    @timed("forward_model.response")
     def response(self, inp: dict) -> dict:
         """Setup of the FEM problem
 
@@ -35,38 +94,33 @@ class LinearElasticityCylinder(ForwardModelBase):
             dictionary
                 Returns "force_list" as output sensor
         """
-        # this method *must* be provided by the user
-        parameters = fenics_concrete.Parameters()
-        # input parameters
-        parameters['E'] = inp["E"]
-        parameters['nu'] = inp["nu"]
-        parameters['radius'] = inp["radius"]
-        parameters['height'] = 100  # gauge length in experiment in mm
-        # problem parameters
-        parameters['mesh_density'] = 6
-        parameters['log_level'] = 'WARNING'
-        parameters['bc_setting'] = 'free'
-        parameters['dim'] = 3
-
+        count("forward_model.evaluations")
         # as we know this problem is linear elastic, there is no point in solving it multiple times
-        # a test load is applied and then interpolated to the load list
-        test_load = -0.05
+        # the slope for E = 1 is computed once and scaled with E
+        slope = inp["E"] * unit_stiffness(inp["nu"], inp["radius"], self.height, self.mesh_density)
 
-        # setup simulation
-        experiment = fenics_concrete.ConcreteCylinderExperiment(parameters)
-        problem = fenics_concrete.LinearElasticity(experiment, parameters)
-        # setup sensor
-        sensor = fenics_concrete.sensors.ReactionForceSensorBottom()
-        problem.add_sensor(sensor)
-        problem.experiment.apply_displ_load(test_load)
-        problem.solve()  # solving this
+        # return a list with the interpolated reaction forces
+        force_list = inp["displacement_list"] *slope
 
-        measured_test_force = problem.sensors[sensor.name].data[-1]
+        return {'force_list': force_list}
 
-        # compute slope of linear problem
-        slope = measured_test_force/test_load
+    @timed("forward_model.response_vectorized")
+    def response_vectorized(self, inp: dict) -> dict:
+        """Evaluates the forward model for a whole ensemble of E values in one call
 
-        # return a list with the interpolated reaction forces
-        force_list = inp["displacement_list"] *slope
+        Parameters
+        ----------
+            inp : dictionary
+                Same as for response(), but "E" is an array with one value per ensemble member (e.g. emcee walker)
+
+        Returns
+        -------
+            dictionary
+                Returns "force_list" with shape (number of E values, number of displacements)
+        """
+        count("forward_model.evaluations", np.size(inp["E"]))
+        slope = np.asarray(inp["E"]) * unit_stiffness(inp["nu"], inp["radius"], self.height, self.mesh_density)
+
+        force_list = np.outer(slope, inp["displacement_list"])
 
         return {'force_list': force_list}
@@ -10,9 +10,7 @@ import numpy as np
 import seaborn as sns
 from matplotlib import rc
 
-# local imports (probeye)
-from probeye.ontology.knowledge_graph_import import import_parameter_samples
-
+from lebedigital.calibration.sample_store import load_samples
 from lebedigital.calibration.utils import PosteriorPredictive
 
 # local imports (others)
@@ -41,16 +39,37 @@ def wrapper_three_point_bending(parameter, known_input):
     return y.magnitude
 
 
-def perform_prediction(forward_solver: callable, parameter: list, nu: float = 0.2, no_sample: int = 50, mode="cheap"):
+def perform_prediction(
+    forward_solver: callable,
+    parameter: list = None,
+    nu: float = 0.2,
+    no_sample: int = 50,
+    mode="cheap",
+    sampling: str = "sequential",
+    rel_tol: float = None,
+    seed: int = None,
+    sample_store_path=None,
+    experiment_name: str = None,
+    knowledge_graph_file=None,
+):
     """
 
     Parameters
     ----------
     forward_solver : (callable) The solver through which parametric uncertainty needs to be propagated
-    parameter : (list) the samples of the parameter which was calibrated. (E for eg)
+    parameter : (list) the samples of the parameter which was calibrated. (E for eg), if not given the samples of E
+        are loaded from the sample store
     nu: Known input to the solver ie. nu
-    no_sample: total no of samples for the MC estimate
+    no_sample: total no of samples for the MC estimate, the maximum number if rel_tol is given
     mode : "full" or "cheap". For testing purposes.
+    sampling : "sequential", "random", "lhs" or "sobol", selection of the posterior samples (see
+        PosteriorPredictive.get_stats). "lhs" and "sobol" need far fewer samples for the same accuracy.
+    rel_tol : relative standard error of the mean and s.d. estimates at which the sampling is stopped early
+    seed : seed of the sampling, fix it to use common random numbers across predictions
+    sample_store_path : sample store with the posterior samples of the calibration (see `sample_store.load_samples`)
+    experiment_name : name of the calibrated experiment in the sample store
+    knowledge_graph_file : optional, knowledge graph of the calibration, only imported once if the store has no
+        samples for the experiment
 
     Returns
     -------
@@ -59,12 +78,13 @@ def perform_prediction(forward_solver: callable, parameter: list, nu: float = 0.
     """
 
     # =======================================================================
-    #                          Query the knowledge graph
+    #                          Load the posterior samples
     # =======================================================================
 
-    # get the samples from the knowledge graph
-    # sample_dict = import_parameter_samples(knowledge_graph_file)'
-    # ignoring the knowledge graph
+    # memory-mapped from the sample store, the knowledge graph is not parsed
+    if parameter is None:
+        assert sample_store_path is not None and experiment_name is not None, "samples or a sample store required"
+        parameter = load_samples(sample_store_path, experiment_name, "E", knowledge_graph_file=knowledge_graph_file)
 
     # ========================================================================
     #       Posterior Predictive
@@ -75,9 +95,10 @@ def perform_prediction(forward_solver: callable, parameter: list, nu: float = 0.
     pos_pred = PosteriorPredictive(forward_solver, known_input_solver=nu, parameter=np.array(parameter))
 
     if mode == "cheap":
-        mean, sd = pos_pred.get_stats(samples=5)  # mean : ~365 N/mm2, sd = 30
-    else:
-        mean, sd = pos_pred.get_stats(samples=no_sample)  # mean : ~365 N/mm2, sd = 30
+        no_sample = 5
+    mean, sd = pos_pred.get_stats(
+        samples=no_sample, sampling=sampling, rel_tol=rel_tol, seed=seed
+    )  # mean : ~365 N/mm2, sd = 30
     # ---- visualize posterior predictive
     posterior_pred_samples = pos_pred._samples
 
@@ -0,0 +1,102 @@
+import os
+from pathlib import Path
+
+import numpy as np
+from probeye.subroutines import add_index_to_tex_prm_name
+
+# name of the default store directory, written next to the knowledge graph export
+SAMPLE_STORE_DIR = "posterior_samples"
+
+
+def samples_from_inference_data(problem, inference_data) -> dict:
+    """
+    Extracts the posterior samples of all latent parameters from the arviz inference data, in the same way
+    probeye's `export_results_to_knowledge_graph` does (the samples of all walkers are concatenated).
+
+    Parameters
+    ----------
+    problem : probeye InverseProblem that was solved
+    inference_data : arviz InferenceData returned by the solver
+
+    Returns
+    -------
+    samples : dict
+        parameter name -> np.array with the samples (one row per component for vector valued parameters)
+    """
+    samples = {}
+    for prm_name in problem.latent_prms:
+        tex_name = problem.parameters[prm_name].tex
+        if problem.parameters[prm_name].dim == 1:
+            samples[prm_name] = inference_data["posterior"][tex_name].values.flatten()
+        else:
+            samples[prm_name] = np.array(
+                [
+                    inference_data["posterior"][add_index_to_tex_prm_name(tex_name, i)].values.flatten()
+                    for i in range(1, problem.parameters[prm_name].dim + 1)
+                ]
+            )
+    return samples
+
+
+def write_samples(store_path, experiment_name: str, samples: dict):
+    """
+    Writes the posterior samples of one experiment to the sample store.
+
+    The store is a directory with one sub directory per experiment and one uncompressed .npy file per parameter,
+    so that single parameters can be memory-mapped without reading the rest of the store.
+
+    Parameters
+    ----------
+    store_path : path to the sample store directory, created if required
+    experiment_name : name of the experiment (key of the store)
+    samples : dict, parameter name -> array of samples
+    """
+    experiment_path = Path(store_path) / experiment_name
+    experiment_path.mkdir(parents=True, exist_ok=True)
+    for prm_name, values in samples.items():
+        np.save(experiment_path / f"{prm_name}.npy", np.asarray(values))
+
+
+def list_experiments(store_path) -> list:
+    """
+    Returns the names of all experiments in the sample store.
+    """
+    if not os.path.isdir(store_path):
+        return []
+    return sorted(entry.name for entry in os.scandir(store_path) if entry.is_dir())
+
+
+def load_samples(store_path, experiment_name: str, parameter: str = None, knowledge_graph_file=None):
+    """
+    Loads posterior samples from the sample store, the arrays are memory-mapped and only read on access.
+
+    If the experiment is not in the store but a knowledge graph file is given, the samples are imported from the
+    knowledge graph once and written to the store, subsequent calls do not parse the graph again.
+
+    Parameters
+    ----------
+    store_path : path to the sample store directory
+    experiment_name : name of the experiment
+    parameter : str, optional
+        name of the parameter, if not given all parameters of the experiment are returned
+    knowledge_graph_file : optional
+        knowledge graph with the calibration results, used when the store has no samples for the experiment
+
+    Returns
+    -------
+    samples : np.array (memory-mapped) for the given parameter, or dict parameter name -> np.array
+    """
+    experiment_path = Path(store_path) / experiment_name
+
+    if not experiment_path.is_dir():
+        if knowledge_graph_file is None:
+            raise KeyError(f"No samples for experiment '{experiment_name}' in {store_path}")
+        # the knowledge graph import is slow, it is only done once
+        from probeye.ontology.knowledge_graph_import import import_parameter_samples
+
+        write_samples(store_path, experiment_name, import_parameter_samples(knowledge_graph_file))
+
+    if parameter is not None:
+        return np.load(experiment_path / f"{parameter}.npy", mmap_mode="r")
+
+    return {file.stem: np.load(file, mmap_mode="r") for file in sorted(experiment_path.glob("*.npy"))}
@@ -5,6 +5,7 @@ from pathlib import Path
 import fenics_concrete
 import numpy as np
 import pandas as pd
+from scipy.stats import qmc
 
 baseDir1 = Path(__file__).resolve().parents[1]
 baseDir1 = baseDir1 / "knowledgeGraph" / "emodul" / "Data"
@@ -68,13 +69,27 @@ class PosteriorPredictive:
         self._std = None
         self._samples = None
 
-    def get_stats(self, samples: int) -> tuple:
+    def get_stats(
+        self, samples: int, sampling: str = "sequential", rel_tol: float = None, batch_size: int = 4, seed: int = None
+    ) -> tuple:
         """
-        Returns mean and s.d of the posterior predictive. Simple Monte Carlo based approximation
+        Returns mean and s.d of the posterior predictive. Monte Carlo based approximation, the posterior samples can be
+        subsampled with (quasi) random designs and the number of forward solves can be controlled by a stopping rule.
 
         Parameters
         ----------
-        samples : the number of samples
+        samples : the (maximum) number of samples
+        sampling : how the parameter samples are selected from the posterior samples
+            "sequential" : the first `samples` posterior samples
+            "random" : random subsample, without replacement
+            "lhs" : Latin hypercube design over the quantiles of the posterior samples
+            "sobol" : scrambled Sobol sequence over the quantiles of the posterior samples
+        rel_tol : float, optional
+            If given, the forward solver is evaluated in batches of `batch_size` and the estimation stops as soon as
+            the relative standard errors of the mean (sd/sqrt(n)) and of the s.d. (sd/sqrt(2(n-1))) are below rel_tol.
+        batch_size : number of forward solves between two checks of the stopping rule
+        seed : seed for "random", "lhs" and "sobol". Keep it fixed to use common random numbers, i.e. the same
+            subsample, when comparing predictions.
 
         Returns
         -------
@@ -82,12 +97,20 @@ class PosteriorPredictive:
         sd : sd of the posterior
 
         """
+        parameter = self._select_parameters(samples, sampling, batch_size, seed)
+
         # Monte carlo step
         output = []
         for i in range(0, samples):
-            y = self._forward_solver(self._parameter[i], self._known_input)
+            y = self._forward_solver(parameter[i], self._known_input)
             output.append(y)
 
+            # stopping rule, checked after each batch
+            n = len(output)
+            if rel_tol is not None and n > 1 and n % batch_size == 0:
+                if _standard_error_converged(output, rel_tol):
+                    break
+
         # get the posterior pred stats
         mean = np.mean(output, axis=0)
         sd = np.std(output, axis=0)
@@ -97,6 +120,52 @@ class PosteriorPredictive:
         self._samples = output
         return mean, sd
 
+    def _select_parameters(self, samples: int, sampling: str, batch_size: int, seed: int = None) -> np.ndarray:
+        """
+        Selects `samples` parameter values from the posterior samples according to the sampling strategy.
+        """
+        parameter = np.asarray(self._parameter)
+        if samples > len(parameter):
+            raise ValueError(f"Requested {samples} samples, but only {len(parameter)} posterior samples are given")
+
+        if sampling == "sequential":
+            return parameter[:samples]
+        if sampling == "random":
+            return np.random.default_rng(seed).permutation(parameter)[:samples]
+        if sampling not in ("lhs", "sobol"):
+            raise ValueError(f"Unknown sampling '{sampling}', use 'sequential', 'random', 'lhs' or 'sobol'")
+        if parameter.ndim != 1:
+            raise ValueError(f"'{sampling}' sampling is only implemented for scalar parameters")
+
+        if sampling == "lhs":
+            # one Latin hypercube per batch, every prefix of full batches used by the stopping rule is stratified
+            sampler = qmc.LatinHypercube(d=1, seed=seed)
+            n_batches = int(np.ceil(samples / batch_size))
+            u = np.concatenate([sampler.random(batch_size) for _ in range(n_batches)])[:samples, 0]
+        else:
+            # balanced for powers of two, prefixes of the sequence are low discrepancy as well
+            u = qmc.Sobol(d=1, seed=seed).random_base2(int(np.ceil(np.log2(samples))))[:samples, 0]
+
+        # map the uniform design to the empirical quantiles of the posterior samples
+        sorted_parameter = np.sort(parameter)
+        index = np.minimum((u * len(sorted_parameter)).astype(int), len(sorted_parameter) - 1)
+        return sorted_parameter[index]
+
+
+def _standard_error_converged(output: list, rel_tol: float) -> bool:
+    """
+    Checks if the relative standard errors of the Monte Carlo estimates of the mean and the s.d. are below rel_tol.
+    """
+    n = len(output)
+    mean = np.abs(np.mean(output, axis=0))
+    sd = np.std(output, axis=0, ddof=1)
+    se_mean = sd / np.sqrt(n)
+    se_sd = sd / np.sqrt(2 * (n - 1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        converged_mean = np.all((se_mean == 0) | (se_mean / mean <= rel_tol))
+        converged_sd = np.all((se_sd == 0) | (se_sd / sd <= rel_tol))
+    return bool(converged_mean and converged_sd)
+
 
 def extract_third_load_cycle(data_path: str, threshold=1) -> pd.DataFrame:
     """
@@ -0,0 +1,90 @@
+import numpy as np
+from probeye.inference.emcee.solver import EmceeSolver
+from probeye.subroutines import vectorize_numpy_dict
+
+from lebedigital.profiling import timed
+
+
+class VectorizedEmceeSolver(EmceeSolver):
+    """EmceeSolver that evaluates the whole ensemble of walkers per step in one call
+
+    Use it with `run_mcmc(..., vectorize=True)`, emcee then passes all walker positions at once (shape
+    (n_walkers, n_parameters)) to the log-probability function. Forward models providing a
+    `response_vectorized(inp)` method are called once per step with arrays of parameter values, all other forward
+    models are evaluated walker by walker. For single parameter vectors the solver behaves like EmceeSolver.
+    """
+
+    @timed("probeye.logprior")
+    def logprior(self, theta: np.ndarray):
+        """
+        Evaluates the log-prior for a single parameter vector or for each row of a 2D array of parameter vectors.
+        """
+        theta = np.asarray(theta)
+        if theta.ndim == 1:
+            return super().logprior(theta)
+        return np.array([super(VectorizedEmceeSolver, self).logprior(theta_i) for theta_i in theta])
+
+    def evaluate_model_response_vectorized(self, theta: np.ndarray, forward_model, experiment_name: str) -> tuple:
+        """
+        Evaluates the model response of one forward model and experiment for each row of theta.
+
+        Parameters
+        ----------
+        theta : 2D array with one parameter vector per row
+        forward_model : the forward model that should be evaluated
+        experiment_name : the experiment, the forward model should be evaluated for
+
+        Returns
+        -------
+        model_responses : 2D array, one response vector (concatenated over output sensors) per row of theta
+        residuals : 2D array, the corresponding residuals
+        """
+        if not hasattr(forward_model, "response_vectorized"):
+            responses = [self.evaluate_model_response(theta_i, forward_model, experiment_name) for theta_i in theta]
+            return np.array([r[0] for r in responses]), np.array([r[1] for r in responses])
+
+        # prepare the input dictionary, the parameter values are stacked to one array per parameter
+        prms = [self.problem.get_parameters(theta_i, forward_model.prms_def) for theta_i in theta]
+        prms_model = {name: np.array([prm[name] for prm in prms]) for name in prms[0]}
+        exp_inp = forward_model.input_from_experiments[experiment_name]
+        inp = {**exp_inp, **prms_model}
+
+        # evaluate the forward model for all rows at once, concatenated over the output sensors
+        model_response_dict = forward_model.response_vectorized(inp)
+        model_responses = np.hstack(
+            [np.reshape(response, (len(theta), -1)) for response in model_response_dict.values()]
+        )
+
+        # compute the residuals by comparing to the experimental response
+        exp_response_vector = vectorize_numpy_dict(forward_model.output_from_experiments[experiment_name])
+        residuals = exp_response_vector - model_responses
+
+        return model_responses, residuals
+
+    @timed("probeye.loglike")
+    def loglike(self, theta: np.ndarray):
+        """
+        Evaluates the log-likelihood for a single parameter vector or for each row of a 2D array of parameter vectors.
+        """
+        theta = np.asarray(theta)
+        if theta.ndim == 1:
+            return super().loglike(theta)
+
+        # parameter vectors outside the parameter domains are not evaluated
+        ll = np.full(len(theta), -np.inf)
+        valid = np.array([self.problem.check_parameter_domains(theta_i) for theta_i in theta])
+        if not np.any(valid):
+            return ll
+        theta_valid = theta[valid]
+
+        ll_valid = np.zeros(len(theta_valid))
+        for likelihood_model in self.likelihood_models:
+            responses, residuals = self.evaluate_model_response_vectorized(
+                theta_valid, likelihood_model.forward_model, likelihood_model.experiment_name
+            )
+            for i, theta_i in enumerate(theta_valid):
+                prms_likelihood = self.problem.get_parameters(theta_i, likelihood_model.prms_def)
+                ll_valid[i] += likelihood_model.loglike(responses[i], residuals[i], prms_likelihood)
+        ll[valid] = ll_valid
+
+        return ll
@@ -8,12 +8,12 @@ def approximate_max_degree_of_hydration(wc):
 
     Parameters
     ----------
-    wc : float
+    wc : float or np.array / pint unitless
         water to cement ratio
 
     Returns
     -------
-    alpha_max : float
+    alpha_max : float or np.array / pint unitless, as the input
         maximum degree of hydration
     """
 
@@ -1,6 +1,33 @@
+from lebedigital.memoization import memoized
 from lebedigital.unit_registry import ureg
 import numpy as np
 
+def approximate_tensile_strength_raw(compressive_strength):
+    """
+    mean tensile strength from the characteristic compressive strength as in Eurocode 2 (table 3.1), in MPa
+
+    Parameters
+    ----------
+    compressive_strength : float or np.array
+        characteristic compressive stength of a concrete cylinder in MPa
+
+    Returns
+    -------
+    tensile_strength : float or np.array
+        concrete tensile strength in MPa
+    """
+    # without a float dtype, so the equations also run on dual numbers (see `gradients.evaluate_with_gradients`)
+    compressive_strength = np.asarray(compressive_strength)
+
+    tensile_strength = np.where(compressive_strength <= 50,
+                                0.3 * compressive_strength**(2/3),
+                                2.12 * np.log(1+((compressive_strength+8)/10)))
+
+    # scalar for scalar input
+    return tensile_strength[()]
+
+
+@memoized("approximate_tensile_strength")
 @ureg.wraps('MPa', 'MPa')
 def approximate_tensile_strength(compressive_strength):
     """
@@ -12,18 +39,13 @@ def approximate_tensile_strength(compressive_strength):
 
     Parameters
     ----------
-    compressive_strength : float / pint stress unit
+    compressive_strength : float or np.array / pint stress unit
         characteristic compressive stength of a concrete cylinder
 
     Returns
     -------
-    tensile_strength : float / pint stress unit, the same unit as the input
-        concrete compressive strength
+    tensile_strength : float or np.array / pint stress unit, will be in 'MPa'
+        concrete tensile strength
     """
 
-    if compressive_strength <= 50:
-        tensile_strength = 0.3 * compressive_strength**(2/3)
-    else:
-        tensile_strength = 2.12 * np.log(1+((compressive_strength+8)/10))
-
-    return tensile_strength
\ No newline at end of file
+    return approximate_tensile_strength_raw(compressive_strength)
\ No newline at end of file
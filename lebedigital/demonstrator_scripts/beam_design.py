@@ -1,10 +1,24 @@
-import math
-
 import numpy as np
 import pint
 
+from lebedigital.memoization import memoized
 from lebedigital.unit_registry import ureg
 
+# possible diameters of the longitudinal reinforcement in mm
+ACCEPTABLE_REINFORCEMENT_DIAMETERS = [6.0, 8.0, 10.0, 12.0, 14.0, 16.0, 20.0, 25.0, 28.0, 32.0, 40.0]
+
+
+def section_dimension_rule_of_thumb_raw(span: float) -> tuple[float, float]:
+    """
+    height as span/15 rounded to 50 mm and width as half of the height, span, width and height in mm
+    """
+    # span/depth ratio for simply supported beam is 15
+    height = 50 * round((span / 15) / 50)
+    # width of beam
+    width = 0.5 * height
+
+    return width, height
+
 
 @ureg.wraps(("mm", "mm"), "mm")
 def section_dimension_rule_of_thumb(span: pint.Quantity) -> tuple[pint.Quantity, pint.Quantity]:
@@ -25,12 +39,20 @@ def section_dimension_rule_of_thumb(span: pint.Quantity) -> tuple[pint.Quantity,
     tuple :
         tuple of width and height of the beam in mm.
     """
-    # span/depth ratio for simply supported beam is 15
-    height = 50 * round((span / 15) / 50)
-    # width of beam
-    width = 0.5 * height
+    return section_dimension_rule_of_thumb_raw(span)
 
-    return width, height
+
+def max_bending_moment_and_shear_force_raw(span, point_load, distributed_load):
+    """
+    maximum moment and shear force of a simply supported beam with a point load at mid span and a distributed load,
+    floats or numpy arrays in consistent units (e.g. mm, N and N/mm, giving N*mm and N)
+    """
+    max_moment_dist_load = distributed_load * span**2 / 8
+    max_shear_force_dist_load = distributed_load * span / 2
+    max_moment_point_load = point_load * span / 4
+    max_shear_force_point_load = point_load / 2
+
+    return (max_moment_point_load + max_moment_dist_load, max_shear_force_dist_load + max_shear_force_point_load)
 
 
 @ureg.check("[length]", "[force]", "[force]/[length]")
@@ -57,13 +79,49 @@ def max_bending_moment_and_shear_force(
     tuple :  pint force and moment units, specific units depending on input
         tuple of  maximum moment and maximum shear force
     """
+    return max_bending_moment_and_shear_force_raw(span, point_load, distributed_load)
 
-    max_moment_dist_load = distributed_load * span**2 / 8
-    max_shear_force_dist_load = distributed_load * span / 2
-    max_moment_point_load = point_load * span / 4
-    max_shear_force_point_load = point_load / 2
 
-    return (max_moment_point_load + max_moment_dist_load, max_shear_force_dist_load + max_shear_force_point_load)
+def beam_required_steel_raw(width, height, max_moment, fck, fyk, steel_dia, steel_dia_bu, cover):
+    """
+    required area of the tensile reinforcement of a rectangular section and the constraint of the compressive zone,
+    for floats or numpy arrays
+
+    Parameters
+    ----------
+    width, height : beam width and depth in mm
+    max_moment : maximum bending moment in N*mm
+    fck, fyk : charateristic compressive strength of concrete and yield strength of steel in N/mm^2
+    steel_dia, steel_dia_bu : diameters of the longitudinal reinforcement and the stirrups in mm
+    cover : depth of the cover in mm
+
+    Returns
+    -------
+    req_steel : required steel area in mm^2
+    fc_constraint : checks if fc is fallen below the minimum. negative values are bad
+    """
+    # effective section depth
+    deff = height - cover - steel_dia_bu - steel_dia / 2
+    # fcd=Design compressive strength
+    a_cc = 0.85
+    gamma_c = 1.5  # Concrete partial material safety factor
+    fcd = a_cc * fck / gamma_c  # N/mm^2
+    gamma_s = 1.15
+    fywd = fyk / gamma_s  # N/mm^2
+    # Bending measurement (here with stress block) (Biegebemessung (hier mit Spannungsblock))
+    mued = max_moment / (width * deff**2 * fcd)
+
+    # when mued >= 0.5, xi cannot be computed, the compressive strength is to low
+    # this causes problems for the optimization scheme
+    # therefore we set an effective mued, which is wrong, but we have a constraint to check for that
+    mued_eff = np.minimum(mued, 0.5)
+
+    fc_constraint = mued - 0.5
+
+    xi = 0.5 * (1 + np.sqrt(1 - 2 * mued_eff))
+    req_steel = 1 / fywd * max_moment / (xi * deff)
+
+    return req_steel, fc_constraint
 
 
 @ureg.wraps(("mm^2", ""), ("mm", "mm", "N*mm", "N/mm^2", "N/mm^2", "mm", "mm", "mm"))
@@ -108,31 +166,7 @@ def beam_required_steel(
         Design of the reinforced beam section.
     fc_constraint : checks if fc is fallen below the minimum. negative values are bad
     """
-    # effective section depth
-    deff = height - cover - steel_dia_bu - steel_dia / 2
-    # fcd=Design compressive strength
-    a_cc = 0.85
-    gamma_c = 1.5  # Concrete partial material safety factor
-    fcd = a_cc * fck / gamma_c  # N/mm^2
-    gamma_s = 1.15
-    fywd = fyk / gamma_s  # N/mm^2
-    # Bending measurement (here with stress block) (Biegebemessung (hier mit Spannungsblock))
-    mued = max_moment / (width * deff**2 * fcd)
-
-    # when mued >= 0.5, xi cannot be computed, the compressive strength is to low
-    # this causes problems for the optimization scheme
-    # therefore we set an effective mued, which is wrong, but we have a constraint to check for that
-    if mued >= 0.5:
-        mued_eff = 0.5
-    else:
-        mued_eff = mued
-
-    fc_constraint = mued - 0.5
-
-    xi = 0.5 * (1 + math.sqrt(1 - 2 * mued_eff))
-    req_steel = 1 / fywd * max_moment / (xi * deff)
-
-    return req_steel, fc_constraint
+    return beam_required_steel_raw(width, height, max_moment, fck, fyk, steel_dia, steel_dia_bu, cover)
 
 
 @ureg.check("[length]", "[length]", "[length]", "[length]")
@@ -151,27 +185,16 @@ def get_max_reinforcement(acceptable_reinforcement_diameters: list, width, cover
     -------
     max_area: maximum area of steel reinforcement
     """
-    for diameter in reversed(acceptable_reinforcement_diameters):
-        max_area = 0.0 * ureg("mm^2")
-        if cover_min < diameter:
-            cover = diameter
-        else:
-            cover = cover_min
-
-        n_steel = 2 * ureg("")
-        # if two bars are too much, go to the lower diameter
-        if not beam_check_spacing(diameter, n_steel, steel_dia_bu, width, cover):
-            continue
-
-        # for a level, that fits at least two bars, see what the maximum is
-        while beam_check_spacing(diameter, n_steel, steel_dia_bu, width, cover):
-            max_area = n_steel * np.pi * (diameter / 2) ** 2
-            n_steel += 1 * ureg("")
-
-        break
-    return max_area
+    max_area = get_max_reinforcement_raw(
+        acceptable_reinforcement_diameters.to("mm").magnitude,
+        width.to("mm").magnitude,
+        cover_min.to("mm").magnitude,
+        steel_dia_bu.to("mm").magnitude,
+    )
+    return float(max_area) * ureg("mm^2")
 
 
+@memoized("check_beam_design")
 @ureg.check(
     "[length]", "[length]", "[length]", "[force]", "[force]/[length]", "[stress]", "[stress]", "[length]", "[length]"
 )
@@ -187,7 +210,7 @@ def check_beam_design(
     cover_min: pint.Quantity,
 ) -> dict[str, pint.Quantity]:
     """
-    Function to check specified design for area of steel
+    Function to check specified design for area of steel, see `beam_design_arrays` for the float version
 
     The input is checked to be using the python pint package: https://pint.readthedocs.io/
     This requires units to be attached to the input values.
@@ -224,7 +247,7 @@ def check_beam_design(
 
     discrete_reinforcement = {"crosssection": np.nan, "n_steel_bars": np.nan, "diameter": np.nan}
 
-    acceptable_reinforcement_diameters = [6.0, 8.0, 10.0, 12.0, 14.0, 16.0, 20.0, 25.0, 28.0, 32.0, 40.0] * ureg("mm")
+    acceptable_reinforcement_diameters = ACCEPTABLE_REINFORCEMENT_DIAMETERS * ureg("mm")
 
     # get max reinforcement
     max_reinforcement = get_max_reinforcement(acceptable_reinforcement_diameters, width, cover_min, steel_dia_bu)
@@ -282,6 +305,26 @@ def beam_check_spacing(diameter_l, n_steel, diameter_bu, width, cover) -> bool:
     bool : True when there is space for the given reinforcement, False, when not
     """
     assert n_steel >= 2 * ureg("")
+    return bool(
+        beam_check_spacing_raw(
+            diameter_l.to("mm").magnitude,
+            ureg.Quantity(n_steel).to("").magnitude,
+            diameter_bu.to("mm").magnitude,
+            width.to("mm").magnitude,
+            cover.to("mm").magnitude,
+        )
+    )
+
+
+def beam_check_spacing_raw(diameter_l, n_steel, diameter_bu, width, cover):
+    """
+    checks the clear spacing between n_steel bars in the width within the cover and the stirrups, floats or numpy
+    arrays in mm that are broadcast
+
+    Returns
+    -------
+    bool or np.array of bool : True when there is space for the given reinforcement, False, when not
+    """
     # effective width for reinforcements
     b_eff = width - 2 * cover - 2 * diameter_bu
     # compute spacing
@@ -289,11 +332,193 @@ def beam_check_spacing(diameter_l, n_steel, diameter_bu, width, cover) -> bool:
 
     # set minimum spacing
     # currently ignoring aggregate size, diameter_largest_rock + 5mm is another constraint
-    s_min = 20 * ureg("mm")
-    if diameter_l > 20 * ureg("mm"):
-        s_min = diameter_l
-
-    if s_min > s:
-        return False
-    else:
-        return True
+    s_min = np.maximum(20.0, diameter_l)
+    return s >= s_min
+
+
+def max_number_of_bars(diameter, steel_dia_bu, width, cover):
+    """
+    Closed form of the maximum number of bars that pass `beam_check_spacing`, on floats or arrays in mm.
+
+    The spacing condition (b_eff - n * d) / (n - 1) >= s_min is equivalent to n <= (b_eff + s_min) / (d + s_min).
+
+    Parameters
+    ----------
+    diameter : diameter of the longitudinal reinforcement
+    steel_dia_bu : diameter of the stirrups
+    width : width of the beam
+    cover : concrete cover
+
+    Returns
+    -------
+    n_max : np.array of floats, values below 2 mean that two bars do not fit
+    """
+    b_eff = width - 2 * cover - 2 * steel_dia_bu
+    s_min = np.maximum(20.0, diameter)
+    n_max = np.floor((b_eff + s_min) / (diameter + s_min))
+
+    # correct the rounding at the bounds, such that the result equals the spacing check
+    with np.errstate(divide="ignore", invalid="ignore"):
+        one_more_fits = (n_max >= 1) & beam_check_spacing_raw(diameter, n_max + 1, steel_dia_bu, width, cover)
+        n_max = np.where(one_more_fits, n_max + 1, n_max)
+        too_many = (n_max >= 2) & ~beam_check_spacing_raw(diameter, n_max, steel_dia_bu, width, cover)
+        n_max = np.where(too_many, n_max - 1, n_max)
+    return n_max
+
+
+def get_max_reinforcement_raw(diameters, width, cover_min, steel_dia_bu):
+    """
+    maximum reinforcement area in mm^2 that fits in a beam, floats or numpy arrays in mm with the available
+    diameters along the last axis.
+
+    For each beam the largest diameter that fits two bars is used with the largest number of bars that fits.
+    """
+    diameters = np.asarray(diameters, dtype=float)
+    width = np.asarray(width, dtype=float)[..., np.newaxis]
+    cover = np.maximum(np.asarray(cover_min, dtype=float)[..., np.newaxis], diameters)
+    steel_dia_bu = np.asarray(steel_dia_bu, dtype=float)[..., np.newaxis]
+
+    n_max = max_number_of_bars(diameters, steel_dia_bu, width, cover)
+
+    # largest diameter that fits two bars
+    fits_two = n_max >= 2
+    reversed_index = np.argmax(fits_two[..., ::-1], axis=-1)
+    index = diameters.shape[-1] - 1 - reversed_index
+    n_selected = np.take_along_axis(n_max, index[..., np.newaxis], axis=-1)[..., 0]
+    area = n_selected * np.pi * (diameters[index] / 2) ** 2
+    return np.where(fits_two.any(axis=-1), area, 0.0)
+
+
+def beam_design_arrays(
+    span, width, height, point_load, distributed_load, compr_str_concrete, yield_str_steel, steel_dia_bu, cover_min
+) -> dict:
+    """
+    Float version of `check_beam_design`, all inputs can be arrays and are broadcast against each other, all
+    reinforcement diameters and bar counts are evaluated at once with numpy.
+
+    Parameters
+    ----------
+    span, width, height : floats or arrays in mm
+    point_load : floats or arrays in N
+    distributed_load : floats or arrays in N/mm
+    compr_str_concrete, yield_str_steel : floats or arrays in N/mm^2
+    steel_dia_bu, cover_min : floats or arrays in mm
+
+    Returns
+    -------
+    dict : np.arrays with the broadcast shape of the inputs, same keys as `check_beam_design`
+        crosssection in mm^2, n_steel_bars, diameter in mm and the constraints
+    """
+    span, width, height, point_load, distributed_load, fck, fyk, steel_dia_bu, cover_min = np.broadcast_arrays(
+        *[
+            np.asarray(value, dtype=float)
+            for value in (
+                span,
+                width,
+                height,
+                point_load,
+                distributed_load,
+                compr_str_concrete,
+                yield_str_steel,
+                steel_dia_bu,
+                cover_min,
+            )
+        ]
+    )
+    diameters = np.asarray(ACCEPTABLE_REINFORCEMENT_DIAMETERS)
+
+    max_moment, _ = max_bending_moment_and_shear_force_raw(span, point_load, distributed_load)
+    max_reinforcement = get_max_reinforcement_raw(diameters, width, cover_min, steel_dia_bu)
+
+    # all diameters along the last axis
+    def expand(value):
+        return value[..., np.newaxis]
+
+    cover = np.maximum(expand(cover_min), diameters)
+
+    required_area, fc_error = beam_required_steel_raw(
+        expand(width),
+        expand(height),
+        expand(max_moment),
+        expand(fck),
+        expand(fyk),
+        diameters,
+        expand(steel_dia_bu),
+        cover,
+    )
+
+    area = np.pi * (diameters / 2) ** 2
+    n_steel = np.maximum(2.0, np.rint(required_area / area))
+    fits = beam_check_spacing_raw(diameters, n_steel, expand(steel_dia_bu), expand(width), cover)
+
+    # smallest diameter with correct spacing, the last one if none fits
+    found = fits.any(axis=-1)
+    index = np.where(found, np.argmax(fits, axis=-1), diameters.size - 1)[..., np.newaxis]
+
+    def select(value):
+        return np.take_along_axis(np.broadcast_to(value, fits.shape), index, axis=-1)[..., 0]
+
+    selected_required_area = select(required_area)
+    constraint_min_fc = select(fc_error)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        constraint_max_steel_area = (selected_required_area - max_reinforcement) / max_reinforcement
+
+    return {
+        "crosssection": np.where(found, select(area * n_steel), selected_required_area),
+        "n_steel_bars": np.where(found, select(n_steel), 2.0),
+        "diameter": np.where(found, select(diameters), 2 * np.sqrt(selected_required_area / 2 / np.pi)),
+        "constraint_min_fc": constraint_min_fc,
+        "constraint_max_steel_area": constraint_max_steel_area,
+        "constraint_beam_design": np.maximum(constraint_min_fc, constraint_max_steel_area),
+    }
+
+
+@ureg.check(
+    "[length]", "[length]", "[length]", "[force]", "[force]/[length]", "[stress]", "[stress]", "[length]", "[length]"
+)
+def check_beam_design_vectorized(
+    span: pint.Quantity,
+    width: pint.Quantity,
+    height: pint.Quantity,
+    point_load: pint.Quantity,
+    distributed_load: pint.Quantity,
+    compr_str_concrete: pint.Quantity,
+    yield_str_steel: pint.Quantity,
+    steel_dia_bu: pint.Quantity,
+    cover_min: pint.Quantity,
+) -> dict[str, pint.Quantity]:
+    """
+    Vectorized version of `check_beam_design`, the inputs can be pint quantities with array magnitudes, e.g. for
+    design space scans over many beams. The results are the same as calling `check_beam_design` for each beam.
+
+    Parameters
+    ----------
+    see `check_beam_design`
+
+    Returns
+    -------
+    dict : pint quantities with the broadcast shape of the inputs
+        crosssection, n_steel_bars, diameter and the constraints as in `check_beam_design`
+    """
+    results = beam_design_arrays(
+        span.to("mm").magnitude,
+        width.to("mm").magnitude,
+        height.to("mm").magnitude,
+        point_load.to("N").magnitude,
+        distributed_load.to("N/mm").magnitude,
+        compr_str_concrete.to("N/mm^2").magnitude,
+        yield_str_steel.to("N/mm^2").magnitude,
+        steel_dia_bu.to("mm").magnitude,
+        cover_min.to("mm").magnitude,
+    )
+
+    units = {
+        "crosssection": "mm^2",
+        "n_steel_bars": "",
+        "diameter": "mm",
+        "constraint_min_fc": "",
+        "constraint_max_steel_area": "",
+        "constraint_beam_design": "",
+    }
+    # scalars for scalar input
+    return {key: results[key][()] * ureg(unit) for key, unit in units.items()}
@@ -0,0 +1,109 @@
+import numpy as np
+
+from lebedigital.unit_registry import ureg
+
+
+def gwp_mixes(contents, gwp_factors):
+    """
+    This function computes the global warming potential per cubic meter for many mixes with one matrix product,
+    the array version of `computation_GWP_mix`
+
+    Parameters
+    ----------
+    contents : array (n_mixes x n_constituents), in kg/m^3
+        content of each constituent in each mix
+    gwp_factors : array (n_constituents), in kg_CO2_eq/kg
+        GWP of each constituent
+
+    Returns
+    -------
+    gwp_mix : array (n_mixes), in kg_CO2_eq/m^3
+        GWP of one cubic meter of each mix
+    """
+    return np.asarray(contents, dtype=float) @ np.asarray(gwp_factors, dtype=float)
+
+
+def part_volumes(width, height, length, n_steel, diameter_steel):
+    """
+    This function computes the concrete and steel volumes of beams, with the simplifications of
+    `computation_GWP_per_part`, the inputs are broadcast
+
+    Parameters
+    ----------
+    width, height, length : arrays, in m
+        dimensions of the beams
+    n_steel : array
+        number of steel rebars
+    diameter_steel : array, in m
+        diameter of the steel rebars
+
+    Returns
+    -------
+    volumes : array (..., 2), in m^3
+        concrete and steel volume of each beam along the last axis
+    """
+    length = np.asarray(length, dtype=float)
+    # removing the volume of the reinforcement form the concrete calculation is ignored
+    concrete_volume = np.asarray(width, dtype=float) * np.asarray(height, dtype=float) * length
+    # difference between rebar length and beam length is ignored
+    steel_area = np.pi * (np.asarray(diameter_steel, dtype=float) / 2) ** 2
+    steel_volume = np.asarray(n_steel, dtype=float) * steel_area * length
+    return np.stack(np.broadcast_arrays(concrete_volume, steel_volume), axis=-1)
+
+
+@ureg.wraps("kg_CO2_eq", ("kg/m^3", "kg_CO2_eq/kg", "kg_CO2_eq/m^3", "m", "m", "m", "", "m"))
+def computation_GWP_catalogue(contents, gwp_factors, gwp_steel, width, height, length, n_steel, diameter_steel):
+    """
+    This function computes the global warming potential of all combinations of mixes and beams, e.g. to rank a
+    catalogue of variants by their embodied carbon
+
+    The input and output is wrapped by the python pint package: https://pint.readthedocs.io/
+    This requires units to be attached to the input values.
+
+    Parameters
+    ----------
+    contents : array (n_mixes x n_constituents) / pint unit, will be converted to kg/m^3
+        content of each constituent in each mix
+    gwp_factors : array (n_constituents) / pint unit, will be converted to kg_CO2_eq/kg
+        GWP of each constituent
+    gwp_steel : float / pint unit in kg_CO2_eq/m^3
+        GWP per cubic meter of used reinforcement steel, see `computation_GWP_steel_per_volume`
+    width, height, length : arrays (n_beams) / pint unit length
+        dimensions of the beams
+    n_steel : array (n_beams)
+        number of used steel rebars
+    diameter_steel : array (n_beams) / pint unit length
+        diameter of used steel rebars
+
+    Returns
+    -------
+    gwp : array (n_mixes x n_beams) / pint unit, will be in 'kg_CO2_eq'
+       GWP of each beam made of each mix
+    """
+    # GWP per volume of concrete and steel, for each mix
+    gwp_mix = gwp_mixes(contents, gwp_factors)
+    gwp_per_volume = np.stack(np.broadcast_arrays(gwp_mix, gwp_steel), axis=-1)
+
+    # concrete and steel volume of each beam
+    volumes = part_volumes(width, height, length, n_steel, diameter_steel)
+
+    return gwp_per_volume @ np.swapaxes(volumes, -1, -2)
+
+
+def rank_catalogue(gwp):
+    """
+    This function ranks the mix/beam combinations of `computation_GWP_catalogue` by their GWP
+
+    Parameters
+    ----------
+    gwp : array (n_mixes x n_beams)
+        GWP of each combination, nan values (e.g. for invalid designs) are ranked last
+
+    Returns
+    -------
+    mix_index, beam_index : arrays
+        indices of the combinations, from the lowest to the highest GWP
+    """
+    gwp = np.asarray(getattr(gwp, "magnitude", gwp))
+    order = np.argsort(gwp, axis=None, kind="stable")
+    return np.unravel_index(order, gwp.shape)
@@ -3,6 +3,38 @@ import numpy as np
 from lebedigital.unit_registry import ureg
 
 
+def computation_GWP_per_part_raw(gwp_mix, gwp_steel, width, height, length, n_steel, diameter_steel):
+    """
+    GWP of a beam as the sum of its concrete volume and its rebar volume times their GWP per volume, for floats or
+    numpy arrays
+
+    Parameters
+    ----------
+    gwp_mix, gwp_steel : float
+        GWP per cubic meter of used mix and reinforcement steel in kg_CO2_eq/m^3
+    width, height, length : float
+        dimensions of the beam in m
+    n_steel : float
+        number of used steel rebars
+    diameter_steel : float
+        diameter of used steel rebars in m
+
+    Returns
+    -------
+    beam_gwp : float
+       GWP of one beam in kg_CO2_eq
+    """
+
+    # concrete
+    # removing the volume of the reinforcement form the concrete calculation is ignored
+    beam_gwp = width * height * length * gwp_mix
+    # steel
+    # difference between rebar length and beam length is ignored
+    beam_gwp += n_steel * (np.pi * (diameter_steel / 2) ** 2) * length * gwp_steel
+
+    return beam_gwp
+
+
 @ureg.wraps("kg_CO2_eq", ("kg_CO2_eq/m^3", "kg_CO2_eq/m^3", "m", "m", "m", "", "m"))
 def computation_GWP_per_part(gwp_mix, gwp_steel, width, height, length, n_steel, diameter_steel):
     """
@@ -31,11 +63,4 @@ def computation_GWP_per_part(gwp_mix, gwp_steel, width, height, length, n_steel,
        GWP of one beam
     """
 
-    # concrete
-    # removing the volume of the reinforcement form the concrete calculation is ignored
-    beam_gwp = width * height * length * gwp_mix
-    # steel
-    # difference between rebar length and beam length is ignored
-    beam_gwp += n_steel * (np.pi * (diameter_steel / 2) ** 2) * length * gwp_steel
-
-    return beam_gwp
+    return computation_GWP_per_part_raw(gwp_mix, gwp_steel, width, height, length, n_steel, diameter_steel)
@@ -1,6 +1,13 @@
 from lebedigital.unit_registry import ureg
 
 
+def computation_GWP_steel_per_volume_raw(gwp_steel, density_steel):
+    """
+    GWP per volume of steel, the GWP per mass (kg_CO2_eq/kg) times the density (kg/m^3), in kg_CO2_eq/m^3
+    """
+    return gwp_steel * density_steel
+
+
 @ureg.wraps("kg_CO2_eq/m^3", ("kg_CO2_eq/kg", "kg/m^3"))
 def computation_GWP_steel_per_volume(gwp_steel, density_steel):
     """
@@ -18,6 +25,4 @@ def computation_GWP_steel_per_volume(gwp_steel, density_steel):
     gwp_steel_per_volume : float / pint unit, will be in 'kg_CO2_eq/m^3'
     """
 
-    gwp_steel_per_volume = gwp_steel * density_steel
-
-    return gwp_steel_per_volume
+    return computation_GWP_steel_per_volume_raw(gwp_steel, density_steel)
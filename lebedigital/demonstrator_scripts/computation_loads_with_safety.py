@@ -1,6 +1,28 @@
 from lebedigital.unit_registry import ureg
 
 
+def computation_loads_with_safety_raw(
+    safety_factor_permanent,
+    safety_factor_variable,
+    distributed_load_permanent,
+    distributed_load_variable,
+    point_load_permanent,
+    point_load_variable,
+):
+    """
+    This function computes the loads with safety factors, without unit checks.
+
+    The loads are floats or numpy arrays in consistent units (e.g. N/m and N), the results have the same units.
+    The pint version `computation_loads_with_safety` passes its quantities to this function.
+    """
+    distributed_load = (
+        distributed_load_permanent * safety_factor_permanent + distributed_load_variable * safety_factor_variable
+    )
+    point_load = point_load_permanent * safety_factor_permanent + point_load_variable * safety_factor_variable
+
+    return distributed_load, point_load
+
+
 @ureg.check("", "", "N/m", "N/m", "N", "N")
 def computation_loads_with_safety(
     safety_factor_permanent,
@@ -25,9 +47,11 @@ def computation_loads_with_safety(
         distributed_load:
         point_load:
     """
-    distributed_load = (
-        distributed_load_permanent * safety_factor_permanent + distributed_load_variable * safety_factor_variable
+    return computation_loads_with_safety_raw(
+        safety_factor_permanent,
+        safety_factor_variable,
+        distributed_load_permanent,
+        distributed_load_variable,
+        point_load_permanent,
+        point_load_variable,
     )
-    point_load = point_load_permanent * safety_factor_permanent + point_load_variable * safety_factor_variable
-
-    return distributed_load, point_load
@@ -1,6 +1,46 @@
 from lebedigital.unit_registry import ureg
 
 
+def computation_specific_heat_capacity_paste_raw(
+    vol_frac_cement,
+    vol_frac_sub,
+    vol_frac_water,
+    shc_cement,
+    shc_sub,
+    shc_water,
+    density_cem,
+    density_sub,
+    density_water,
+):
+    """
+    specific heat capacity of the paste as the mass weighted average of cement, substitute and water, for floats or
+    numpy arrays
+
+    Parameters
+    ----------
+    vol_frac_cement, vol_frac_sub, vol_frac_water :
+        volume fractions of cement, substitute (slag) and water for 1m^3 of concrete
+    shc_cement, shc_sub, shc_water :
+        specific heat capacities of cement, substitute (slag) and water in J/kg/K
+    density_cem, density_sub, density_water :
+        densities of cement, substitute (slag) and water in kg/m^3
+
+    Returns
+    -------
+    specific_heat_capacity_paste : float in J/kg/K
+    """
+    mass_cement = vol_frac_cement * density_cem
+    mass_sub = vol_frac_sub * density_sub
+    mass_water = vol_frac_water * density_water
+
+    # average wrt mass
+    specific_heat_capacity_paste = (mass_cement * shc_cement + mass_sub * shc_sub + mass_water * shc_water) / (
+        mass_cement + mass_sub + mass_water
+    )
+
+    return specific_heat_capacity_paste
+
+
 @ureg.wraps("J/kg/K", ("", "", "", "J/kg/K", "J/kg/K", "J/kg/K", "kg/m^3", "kg/m^3", "kg/m^3"))
 def computation_specific_heat_capacity_paste(
     vol_frac_cement,
@@ -41,13 +81,14 @@ def computation_specific_heat_capacity_paste(
     -------
     specific_heat_capacity_paste : float / pint unit
     """
-    mass_cement = vol_frac_cement * density_cem
-    mass_sub = vol_frac_sub * density_sub
-    mass_water = vol_frac_water * density_water
-
-    # average wrt mass
-    specific_heat_capacity_paste = (mass_cement * shc_cement + mass_sub * shc_sub + mass_water * shc_water) / (
-        mass_cement + mass_sub + mass_water
+    return computation_specific_heat_capacity_paste_raw(
+        vol_frac_cement,
+        vol_frac_sub,
+        vol_frac_water,
+        shc_cement,
+        shc_sub,
+        shc_water,
+        density_cem,
+        density_sub,
+        density_water,
     )
-
-    return specific_heat_capacity_paste
@@ -1,8 +1,59 @@
-import pytest
+import numpy as np
+import pandas as pd
 
+from lebedigital.memoization import memoized
 from lebedigital.unit_registry import ureg
-
-
+from lebedigital.unit_schema import UnitSchema
+
+# units of the columns of the mix tables in the batch functions
+MIX_TABLE_UNITS = {
+    "density_cem": "kg/m^3",
+    "density_sub": "kg/m^3",
+    "density_water": "kg/m^3",
+    "density_plasticizer": "kg/m^3",
+    "density_aggregates": "kg/m^3",
+    "wb_mass_ratio": "dimensionless",
+    "sc_mass_fraction": "dimensionless",
+    "aggregates_volume_fraction": "dimensionless",
+    "plasticizer_volume_content": "kg/m^3",
+    "cem_mass_per_cubic_meter_concrete": "kg/m^3",
+    "sub_mass_per_cubic_meter_concrete": "kg/m^3",
+    "water_mass_per_cubic_meter_concrete": "kg/m^3",
+    "aggregates_mass_per_cubic_meter_concrete": "kg/m^3",
+}
+
+# units of the inputs and outputs of `computation_volume_content`
+VOLUME_CONTENT_UNITS = UnitSchema(
+    {
+        name: MIX_TABLE_UNITS[name]
+        for name in [
+            "density_cem",
+            "density_sub",
+            "density_water",
+            "density_aggregates",
+            "wb_mass_ratio",
+            "sc_mass_fraction",
+            "aggregates_volume_fraction",
+            "plasticizer_volume_content",
+            "density_plasticizer",
+        ]
+    }
+)
+VOLUME_CONTENT_OUTPUT_UNITS = {
+    "sc_volume_fraction": "dimensionless",
+    "plasticizer_vol_fraction": "dimensionless",
+    "water_vol_fraction": "dimensionless",
+    "sub_vol_fraction": "dimensionless",
+    "cem_vol_fraction": "dimensionless",
+    "cem_mass_per_cubic_meter_concrete": "kg/m^3",
+    "sub_mass_per_cubic_meter_concrete": "kg/m^3",
+    "water_mass_per_cubic_meter_concrete": "kg/m^3",
+    "aggregates_mass_per_cubic_meter_concrete": "kg/m^3",
+    "density_paste": "kg/m^3",
+}
+
+
+@memoized("computation_volume_content")
 def computation_volume_content(input_dic):
     """
     This is the function to compute volume contents based on mass or volume ratios
@@ -39,99 +90,27 @@ def computation_volume_content(input_dic):
              - 'water_mass_per_cubic_meter_concrete'
              - 'aggregates_mass_per_cubic_meter_concrete'
              - 'density_paste'
-    """
 
-    # initialize output dictionary
-    output = {}
+    The equations are the ones of `volume_content_arrays`, a ValueError is raised if the volume fractions do not add
+    up to 1.
+    """
 
     # optional parameter
     if "plasticizer_volume_content" not in input_dic.keys():
-        input_dic["plasticizer_volume_content"] = 0 * ureg("kg/m^3")
-        input_dic["density_plasticizer"] = 42 * ureg("kg/m^3")  # dummy value
+        input_dic = {
+            **input_dic,
+            "plasticizer_volume_content": 0 * ureg("kg/m^3"),
+            "density_plasticizer": 42 * ureg("kg/m^3"),  # dummy value
+        }
 
-    # converting to correct pint units / automatic check for pint input / check for required input values
-    input_dic["density_sub"].ito("kg/m^3")
-    input_dic["density_cem"].ito("kg/m^3")
-    input_dic["density_water"].ito("kg/m^3")
-    input_dic["density_plasticizer"].ito("kg/m^3")
-    input_dic["density_aggregates"].ito("kg/m^3")
+    # converting to correct pint units / automatic check for pint input / check for required input values, the input
+    # is not modified (the results may be memoized)
+    magnitudes = VOLUME_CONTENT_UNITS.to_magnitudes(input_dic)
 
-    # compute volume fraction of substitute to cement
-    if input_dic["sc_mass_fraction"] == 0.0 * ureg("dimensionless"):
-        output["sc_volume_fraction"] = 0.0 * ureg("dimensionless")
-    else:
-        mass_sub = input_dic["sc_mass_fraction"] * ureg("kg")
-        mass_cem = 1 * ureg("kg") - mass_sub
-        vol_sub = mass_sub / input_dic["density_sub"]
-        vol_cem = mass_cem / input_dic["density_cem"]
-        output["sc_volume_fraction"] = vol_sub / (vol_sub + vol_cem)
-
-    # compute binder density
-
-    density_binder = (
-        output["sc_volume_fraction"] * input_dic["density_sub"]
-        + (1 - output["sc_volume_fraction"]) * input_dic["density_cem"]
-    )
+    # the equations of the batch version, for one mix
+    output = volume_content_arrays(**{name: [magnitudes[name]] for name in VOLUME_CONTENT_UNITS.units})
 
-    # compute volume ratio of water to binder (cement and slag)
-    water_vol_fraction_to_binder = (
-        input_dic["wb_mass_ratio"]
-        * density_binder
-        / (input_dic["density_water"] + input_dic["wb_mass_ratio"] * density_binder)
-    )
-
-    # volume fractions
-    ## plasticizer
-    output["plasticizer_vol_fraction"] = input_dic["plasticizer_volume_content"] / input_dic["density_plasticizer"]
-    ## water
-    output["water_vol_fraction"] = (
-        1 - input_dic["aggregates_volume_fraction"]
-    ) * water_vol_fraction_to_binder - output["plasticizer_vol_fraction"]
-    ## binder
-    binder_vol_fraction = (1 - input_dic["aggregates_volume_fraction"]) * (1 - water_vol_fraction_to_binder)
-
-    output["sub_vol_fraction"] = binder_vol_fraction * output["sc_volume_fraction"]
-    output["cem_vol_fraction"] = binder_vol_fraction * (1 - output["sc_volume_fraction"])
-
-    # sanity check, the volume fractions add up to 1
-    assert 1 == pytest.approx(
-        (
-            output["plasticizer_vol_fraction"]
-            + output["water_vol_fraction"]
-            + output["sub_vol_fraction"]
-            + output["cem_vol_fraction"]
-            + input_dic["aggregates_volume_fraction"]
-        ).magnitude
-    )
-
-    # computation of mass per cubic meter concrete
-    output["cem_mass_per_cubic_meter_concrete"] = output["cem_vol_fraction"] * input_dic["density_cem"]
-    output["sub_mass_per_cubic_meter_concrete"] = output["sub_vol_fraction"] * input_dic["density_sub"]
-    output["water_mass_per_cubic_meter_concrete"] = output["water_vol_fraction"] * input_dic["density_water"]
-    output["aggregates_mass_per_cubic_meter_concrete"] = (
-        input_dic["aggregates_volume_fraction"] * input_dic["density_aggregates"]
-    )
-
-    # sanity check, the total volume adds up to 1
-    assert 1 == pytest.approx(
-        (
-            input_dic["plasticizer_volume_content"] / input_dic["density_plasticizer"]
-            + output["water_mass_per_cubic_meter_concrete"] / input_dic["density_water"]
-            + output["sub_mass_per_cubic_meter_concrete"] / input_dic["density_sub"]
-            + output["cem_mass_per_cubic_meter_concrete"] / input_dic["density_cem"]
-            + output["aggregates_mass_per_cubic_meter_concrete"] / input_dic["density_aggregates"]
-        ).magnitude
-    )
-
-    # paste density
-    output["density_paste"] = (
-        output["cem_mass_per_cubic_meter_concrete"]
-        + output["sub_mass_per_cubic_meter_concrete"]
-        + output["water_mass_per_cubic_meter_concrete"]
-        + input_dic["plasticizer_volume_content"]
-    ) / (1 - input_dic["aggregates_volume_fraction"])
-
-    return output
+    return {name: float(output[name][0]) * ureg(unit) for name, unit in VOLUME_CONTENT_OUTPUT_UNITS.items()}
 
 
 def computation_ratios(input_dic):
@@ -219,3 +198,247 @@ def computation_ratios(input_dic):
     output["sc_volume_fraction"] = sub_vol / (sub_vol + cem_vol)
 
     return output
+
+
+def _mix_column(mixes, name: str, default: float = None) -> np.ndarray:
+    """
+    Returns a column of a mix table as float array in the unit of MIX_TABLE_UNITS, pint-pandas columns are converted.
+    Missing columns are filled with the default value, if one is given.
+    """
+    names = mixes.columns if isinstance(mixes, pd.DataFrame) else mixes.dtype.names
+    if name not in names:
+        if default is None:
+            raise KeyError(f"The mix table has no column '{name}'")
+        return np.full(len(mixes), default, dtype=float)
+
+    column = mixes[name]
+    if isinstance(column, pd.Series) and str(column.dtype).startswith("pint["):
+        return column.pint.to(MIX_TABLE_UNITS[name]).values.quantity.magnitude.astype(float)
+    return np.asarray(column, dtype=float)
+
+
+def _check_sums(total: np.ndarray, message: str):
+    """
+    Raises a ValueError listing the rows whose total is not 1.
+    """
+    wrong = np.flatnonzero(~np.isclose(total, 1, rtol=1e-6, atol=1e-12))
+    if wrong.size > 0:
+        raise ValueError(f"{message} for the mixes with the positions {wrong.tolist()}")
+
+
+def computation_volume_content_batch(mixes) -> pd.DataFrame:
+    """
+    Batch version of `computation_volume_content` for a table of mixes, all mixes are computed column-wise.
+
+    Parameters
+    ----------
+    mixes : pd.DataFrame or structured np.array
+        one row per mix with the columns of `computation_volume_content`, either as pint-pandas columns or as floats
+        in the units of MIX_TABLE_UNITS (kg/m^3 and dimensionless). The plasticizer columns are optional.
+
+    Returns
+    -------
+    output : pd.DataFrame
+        one row per mix (same index as a DataFrame input) with the outputs of `computation_volume_content` as floats
+        in kg/m^3 and dimensionless
+    """
+    output = volume_content_arrays(
+        density_cem=_mix_column(mixes, "density_cem"),
+        density_sub=_mix_column(mixes, "density_sub"),
+        density_water=_mix_column(mixes, "density_water"),
+        density_aggregates=_mix_column(mixes, "density_aggregates"),
+        wb_mass_ratio=_mix_column(mixes, "wb_mass_ratio"),
+        sc_mass_fraction=_mix_column(mixes, "sc_mass_fraction"),
+        aggregates_volume_fraction=_mix_column(mixes, "aggregates_volume_fraction"),
+        # optional parameter
+        plasticizer_volume_content=_mix_column(mixes, "plasticizer_volume_content", default=0.0),
+        density_plasticizer=_mix_column(mixes, "density_plasticizer", default=42.0),  # dummy value
+    )
+
+    index = mixes.index if isinstance(mixes, pd.DataFrame) else None
+    return pd.DataFrame(output, index=index)
+
+
+def volume_content_equations(
+    density_cem,
+    density_sub,
+    density_water,
+    density_aggregates,
+    wb_mass_ratio,
+    sc_mass_fraction,
+    aggregates_volume_fraction,
+    plasticizer_volume_content,
+    density_plasticizer,
+) -> dict:
+    """
+    The mix equations of `computation_volume_content` in the units of MIX_TABLE_UNITS, without sanity checks.
+
+    Only arithmetic is used, so the inputs can be floats, numpy arrays of the same shape or dual numbers (see
+    `gradients.evaluate_with_gradients`).
+
+    Returns
+    -------
+    output : dict
+        the outputs of `computation_volume_content` in kg/m^3 and dimensionless
+    """
+    output = {}
+
+    # volume fraction of substitute to cement, per kg of binder
+    vol_sub = sc_mass_fraction / density_sub
+    vol_cem = (1 - sc_mass_fraction) / density_cem
+    output["sc_volume_fraction"] = vol_sub / (vol_sub + vol_cem)
+
+    density_binder = output["sc_volume_fraction"] * density_sub + (1 - output["sc_volume_fraction"]) * density_cem
+
+    # volume ratio of water to binder (cement and slag)
+    water_vol_fraction_to_binder = wb_mass_ratio * density_binder / (density_water + wb_mass_ratio * density_binder)
+
+    # volume fractions
+    output["plasticizer_vol_fraction"] = plasticizer_volume_content / density_plasticizer
+    output["water_vol_fraction"] = (1 - aggregates_volume_fraction) * water_vol_fraction_to_binder - output[
+        "plasticizer_vol_fraction"
+    ]
+    binder_vol_fraction = (1 - aggregates_volume_fraction) * (1 - water_vol_fraction_to_binder)
+    output["sub_vol_fraction"] = binder_vol_fraction * output["sc_volume_fraction"]
+    output["cem_vol_fraction"] = binder_vol_fraction * (1 - output["sc_volume_fraction"])
+
+    # mass per cubic meter concrete
+    output["cem_mass_per_cubic_meter_concrete"] = output["cem_vol_fraction"] * density_cem
+    output["sub_mass_per_cubic_meter_concrete"] = output["sub_vol_fraction"] * density_sub
+    output["water_mass_per_cubic_meter_concrete"] = output["water_vol_fraction"] * density_water
+    output["aggregates_mass_per_cubic_meter_concrete"] = aggregates_volume_fraction * density_aggregates
+
+    # paste density
+    output["density_paste"] = (
+        output["cem_mass_per_cubic_meter_concrete"]
+        + output["sub_mass_per_cubic_meter_concrete"]
+        + output["water_mass_per_cubic_meter_concrete"]
+        + plasticizer_volume_content
+    ) / (1 - aggregates_volume_fraction)
+
+    return output
+
+
+def volume_content_arrays(
+    density_cem,
+    density_sub,
+    density_water,
+    density_aggregates,
+    wb_mass_ratio,
+    sc_mass_fraction,
+    aggregates_volume_fraction,
+    plasticizer_volume_content=0.0,
+    density_plasticizer=42.0,
+) -> dict:
+    """
+    Array version of `computation_volume_content`, the inputs are floats or arrays in the units of MIX_TABLE_UNITS and
+    are broadcast against each other.
+
+    Returns
+    -------
+    output : dict
+        arrays with the outputs of `computation_volume_content` in kg/m^3 and dimensionless
+    """
+    (
+        density_cem,
+        density_sub,
+        density_water,
+        density_aggregates,
+        wb_mass_ratio,
+        sc_mass_fraction,
+        aggregates_volume_fraction,
+        plasticizer_volume_content,
+        density_plasticizer,
+    ) = np.broadcast_arrays(
+        *[
+            np.asarray(value, dtype=float)
+            for value in (
+                density_cem,
+                density_sub,
+                density_water,
+                density_aggregates,
+                wb_mass_ratio,
+                sc_mass_fraction,
+                aggregates_volume_fraction,
+                plasticizer_volume_content,
+                density_plasticizer,
+            )
+        ]
+    )
+
+    output = volume_content_equations(
+        density_cem,
+        density_sub,
+        density_water,
+        density_aggregates,
+        wb_mass_ratio,
+        sc_mass_fraction,
+        aggregates_volume_fraction,
+        plasticizer_volume_content,
+        density_plasticizer,
+    )
+
+    # sanity check, the volume fractions add up to 1
+    _check_sums(
+        output["plasticizer_vol_fraction"]
+        + output["water_vol_fraction"]
+        + output["sub_vol_fraction"]
+        + output["cem_vol_fraction"]
+        + aggregates_volume_fraction,
+        "The volume fractions do not add up to 1",
+    )
+
+    # sanity check, the total volume adds up to 1
+    _check_sums(
+        plasticizer_volume_content / density_plasticizer
+        + output["water_mass_per_cubic_meter_concrete"] / density_water
+        + output["sub_mass_per_cubic_meter_concrete"] / density_sub
+        + output["cem_mass_per_cubic_meter_concrete"] / density_cem
+        + output["aggregates_mass_per_cubic_meter_concrete"] / density_aggregates,
+        "The volumes do not add up to 1 m^3",
+    )
+
+    return output
+
+
+def computation_ratios_batch(mixes) -> pd.DataFrame:
+    """
+    Batch version of `computation_ratios` for a table of mixes, all mixes are computed column-wise.
+
+    Parameters
+    ----------
+    mixes : pd.DataFrame or structured np.array
+        one row per mix with the columns of `computation_ratios`, either as pint-pandas columns or as floats in the
+        units of MIX_TABLE_UNITS. The substitute, aggregate and plasticizer columns are optional.
+
+    Returns
+    -------
+    output : pd.DataFrame
+        one row per mix with the columns 'wb_mass_ratio', 'aggregates_volume_fraction' and 'sc_volume_fraction'
+    """
+    density_cem = _mix_column(mixes, "density_cem")
+    density_water = _mix_column(mixes, "density_water")
+    cem_content = _mix_column(mixes, "cem_mass_per_cubic_meter_concrete")
+    water_content = _mix_column(mixes, "water_mass_per_cubic_meter_concrete")
+    # optional parameters, with dummy densities
+    plasticizer_content = _mix_column(mixes, "plasticizer_volume_content", default=0.0)
+    density_plasticizer = _mix_column(mixes, "density_plasticizer", default=42.0)
+    sub_content = _mix_column(mixes, "sub_mass_per_cubic_meter_concrete", default=0.0)
+    density_sub = _mix_column(mixes, "density_sub", default=42.0)
+    aggregates_content = _mix_column(mixes, "aggregates_mass_per_cubic_meter_concrete", default=0.0)
+    density_aggregates = _mix_column(mixes, "density_aggregates", default=42.0)
+
+    output = {}
+
+    # plasticizer is counted as water volume, see `computation_ratios`
+    pl_as_water_content = plasticizer_content / density_plasticizer * density_water
+    output["wb_mass_ratio"] = (water_content + pl_as_water_content) / (cem_content + sub_content)
+
+    output["aggregates_volume_fraction"] = aggregates_content / density_aggregates
+
+    sub_vol = sub_content / density_sub
+    cem_vol = cem_content / density_cem
+    output["sc_volume_fraction"] = sub_vol / (sub_vol + cem_vol)
+
+    index = mixes.index if isinstance(mixes, pd.DataFrame) else None
+    return pd.DataFrame(output, index=index)
@@ -3,6 +3,43 @@ import numpy as np
 from lebedigital.unit_registry import ureg
 
 
+def dummy_hydration_parameters_raw(slag_ratio):
+    """
+    hydration parameters of the paste, B1 and Q_pot are interpolated linearly between pure cement (slag_ratio 0) and
+    pure slag (1), the others are constant
+
+    Parameters
+    ----------
+    slag_ratio : float or np.array
+        amount of slag compared to cement, value from 0 to 1
+
+    Returns
+    -------
+    B1 : float or np.array in 1/s
+    B2 : float or np.array
+    eta : float or np.array
+    E_act : float or np.array in J/mol
+    Q_pot : float or np.array in J/kg
+    T_ref : float or np.array in degree Celsius
+    """
+    # the constant parameters get the shape of slag_ratio
+    zeros = np.zeros_like(slag_ratio, dtype=float)
+
+    B1_min = 1.5e-4
+    B1_max = 2.916e-4
+    B1 = B1_max - (B1_max - B1_min) * slag_ratio
+    B2 = 0.0024229 + zeros  # -
+    eta = 5.554 + zeros  # something about diffusion
+    E_act = 5653 * 8.3145 + zeros  # activation energy in Jmol^-1
+    T_ref = 25.0 + zeros
+
+    Q_pot_min = 100000
+    Q_pot_max = 300000
+    Q_pot = Q_pot_max - (Q_pot_max - Q_pot_min) * slag_ratio
+
+    return B1, B2, eta, E_act, Q_pot, T_ref
+
+
 @ureg.check("", "")
 def dummy_hydration_parameters(slag_ratio, phi_hydration):
     """
@@ -11,8 +48,8 @@ def dummy_hydration_parameters(slag_ratio, phi_hydration):
 
     Parameters
     ----------
-    slag_ratio : float / pint unitless
-        amount of slag compared to cement, value from 0 to 1
+    slag_ratio : float or np.array / pint unitless
+        amount of slag compared to cement, value from 0 to 1, an array gives arrays of all parameters
     phi_hydration: ??
         input from Atuls parameter identification
 
@@ -31,18 +68,14 @@ def dummy_hydration_parameters(slag_ratio, phi_hydration):
     Q_pot : float / pint unit, will be in 'J/kg'
         maximum potential hydration parameter
     """
-
-    B1_min = 1.5e-4
-    B1_max = 2.916e-4
-    B1 = (B1_max - (B1_max - B1_min) * slag_ratio) * ureg("1/s")
-    B2 = 0.0024229 * ureg("")  # -
-    eta = 5.554 * ureg("")  # something about diffusion
-    E_act = 5653 * 8.3145 * ureg("J/mol")  # activation energy in Jmol^-1
     Q_ = ureg.Quantity
-    T_ref = Q_(25, ureg.degC)
+    B1, B2, eta, E_act, Q_pot, T_ref = dummy_hydration_parameters_raw(Q_(slag_ratio).to("").magnitude)
 
-    Q_pot_min = 100000 * ureg("J/kg")
-    Q_pot_max = 300000 * ureg("J/kg")
-    Q_pot = Q_pot_max - (Q_pot_max - Q_pot_min) * slag_ratio
-
-    return B1, B2, eta, E_act, Q_pot, T_ref
+    return (
+        B1 * ureg("1/s"),
+        B2 * ureg(""),
+        eta * ureg(""),
+        E_act * ureg("J/mol"),
+        Q_pot * ureg("J/kg"),
+        Q_(T_ref, ureg.degC),
+    )
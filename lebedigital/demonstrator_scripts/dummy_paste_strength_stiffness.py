@@ -3,6 +3,33 @@ import numpy as np
 from lebedigital.unit_registry import ureg
 
 
+def dummy_paste_strength_stiffness_raw(slag_ratio):
+    """
+    paste stiffness and strength interpolated linearly between pure cement (slag_ratio 0) and pure slag (1)
+
+    Parameters
+    ----------
+    slag_ratio : float
+        amount of slag compared to cement, value from 0 to 1
+
+    Returns
+    -------
+    paste_youngs_modulus : float in GPa
+    paste_strength : float in MPa
+    """
+    paste_youngs_modulus_min = 30
+    paste_youngs_modulus_max = 60
+    paste_youngs_modulus = (
+        paste_youngs_modulus_max - (paste_youngs_modulus_max - paste_youngs_modulus_min) * slag_ratio
+    )
+
+    paste_strength_min = 5
+    paste_strength_max = 40
+    paste_strength = paste_strength_max - (paste_strength_max - paste_strength_min) * slag_ratio
+
+    return paste_youngs_modulus, paste_strength
+
+
 @ureg.check("", "")
 def dummy_paste_strength_stiffness(slag_ratio, phi_paste):
     """
@@ -23,15 +50,8 @@ def dummy_paste_strength_stiffness(slag_ratio, phi_paste):
     paste_strength : float / pint stress unit, will be in 'MPa'
         approximated compressive strength of paste
     """
-
-    paste_youngs_modulus_min = 30 * ureg("GPa")
-    paste_youngs_modulus_max = 60 * ureg("GPa")
-    paste_youngs_modulus = (
-        paste_youngs_modulus_max - (paste_youngs_modulus_max - paste_youngs_modulus_min) * slag_ratio
+    paste_youngs_modulus, paste_strength = dummy_paste_strength_stiffness_raw(
+        ureg.Quantity(slag_ratio).to("").magnitude
     )
 
-    paste_strength_min = 5 * ureg("MPa")
-    paste_strength_max = 40 * ureg("MPa")
-    paste_strength = paste_strength_max - (paste_strength_max - paste_strength_min) * slag_ratio
-
-    return paste_youngs_modulus, paste_strength
+    return paste_youngs_modulus * ureg("GPa"), paste_strength * ureg("MPa")
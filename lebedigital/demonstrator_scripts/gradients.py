@@ -0,0 +1,274 @@
+import numpy as np
+
+from lebedigital.demonstrator_scripts.approximate_tensile_strength import approximate_tensile_strength_raw
+from lebedigital.demonstrator_scripts.beam_design import beam_required_steel_raw
+from lebedigital.demonstrator_scripts.computation_GWP_per_part import computation_GWP_per_part_raw
+from lebedigital.demonstrator_scripts.computation_volume_content import volume_content_equations
+from lebedigital.unit_registry import ureg
+from lebedigital.unit_schema import UnitSchema
+
+
+class _Dual:
+    """A value with its gradient with respect to all inputs, for forward mode differentiation
+
+    Supports the arithmetic of the demonstrator functions, the operands can be _Dual or float. Comparisons use the
+    value. numpy handles a _Dual as object, its ufuncs call the methods of the same name (e.g. `np.sqrt` calls
+    `sqrt`), so the float cores of the demonstrator functions run on _Dual inputs as well.
+    """
+
+    __slots__ = ("value", "grad")
+
+    def __init__(self, value: float, grad: np.ndarray):
+        self.value = value
+        self.grad = grad
+
+    def __lt__(self, other):
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        return self.value >= _value(other)
+
+    def __add__(self, other):
+        if isinstance(other, _Dual):
+            return _Dual(self.value + other.value, self.grad + other.grad)
+        return _Dual(self.value + other, self.grad)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return _Dual(-self.value, -self.grad)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, _Dual):
+            return _Dual(self.value * other.value, self.grad * other.value + other.grad * self.value)
+        return _Dual(self.value * other, self.grad * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, _Dual):
+            return self * other._reciprocal()
+        return self * (1 / other)
+
+    def __rtruediv__(self, other):
+        return other * self._reciprocal()
+
+    def __pow__(self, exponent: float):
+        return _Dual(self.value**exponent, exponent * self.value ** (exponent - 1) * self.grad)
+
+    def _reciprocal(self):
+        return _Dual(1 / self.value, -self.grad / self.value**2)
+
+    def sqrt(self):
+        root = np.sqrt(self.value)
+        return _Dual(root, self.grad / (2 * root))
+
+    def log(self):
+        return _Dual(np.log(self.value), self.grad / self.value)
+
+
+def _value(x):
+    """
+    value of a _Dual or float
+    """
+    return x.value if isinstance(x, _Dual) else x
+
+
+def _volume_content(x: dict) -> dict:
+    """
+    the equations of `computation_volume_content`, densities in kg/m^3
+    """
+    return volume_content_equations(**x)
+
+
+def _gwp_mix(x: dict) -> dict:
+    """
+    the equation of `computation_GWP_mix`, the inputs are '<constituent>_content' and '<constituent>_GWP'
+    """
+    gwp_mix = 0.0
+    for name in x:
+        if name.endswith("_content"):
+            gwp_mix = gwp_mix + x[name] * x[name[: -len("_content")] + "_GWP"]
+    return {"gwp_mix": gwp_mix}
+
+
+def _gwp_per_part(x: dict) -> dict:
+    """
+    the equation of `computation_GWP_per_part_raw`
+    """
+    return {"beam_gwp": computation_GWP_per_part_raw(**x)}
+
+
+def _beam_required_steel(x: dict) -> dict:
+    """
+    the equations of `beam_required_steel_raw`, the gradient of the effective mued is zero above the limit
+    """
+    req_steel, fc_constraint = beam_required_steel_raw(**x)
+    return {"req_steel": req_steel, "fc_constraint": fc_constraint}
+
+
+def _tensile_strength(x: dict) -> dict:
+    """
+    the equation of `approximate_tensile_strength_raw`
+    """
+    return {"tensile_strength": approximate_tensile_strength_raw(x["compressive_strength"])}
+
+
+# differentiable functions: equations, units of the inputs and units of the outputs
+DIFFERENTIABLE_FUNCTIONS = {
+    "computation_volume_content": (
+        _volume_content,
+        UnitSchema(
+            {
+                "density_cem": "kg/m^3",
+                "density_sub": "kg/m^3",
+                "density_water": "kg/m^3",
+                "density_plasticizer": "kg/m^3",
+                "density_aggregates": "kg/m^3",
+                "wb_mass_ratio": "dimensionless",
+                "sc_mass_fraction": "dimensionless",
+                "aggregates_volume_fraction": "dimensionless",
+                "plasticizer_volume_content": "kg/m^3",
+            }
+        ),
+        {
+            "sc_volume_fraction": "dimensionless",
+            "plasticizer_vol_fraction": "dimensionless",
+            "water_vol_fraction": "dimensionless",
+            "sub_vol_fraction": "dimensionless",
+            "cem_vol_fraction": "dimensionless",
+            "cem_mass_per_cubic_meter_concrete": "kg/m^3",
+            "sub_mass_per_cubic_meter_concrete": "kg/m^3",
+            "water_mass_per_cubic_meter_concrete": "kg/m^3",
+            "aggregates_mass_per_cubic_meter_concrete": "kg/m^3",
+            "density_paste": "kg/m^3",
+        },
+    ),
+    "computation_GWP_mix": (_gwp_mix, None, {"gwp_mix": "kg_CO2_eq/m^3"}),
+    "computation_GWP_per_part": (
+        _gwp_per_part,
+        UnitSchema(
+            {
+                "gwp_mix": "kg_CO2_eq/m^3",
+                "gwp_steel": "kg_CO2_eq/m^3",
+                "width": "m",
+                "height": "m",
+                "length": "m",
+                "n_steel": "dimensionless",
+                "diameter_steel": "m",
+            }
+        ),
+        {"beam_gwp": "kg_CO2_eq"},
+    ),
+    "beam_required_steel": (
+        _beam_required_steel,
+        UnitSchema(
+            {
+                "width": "mm",
+                "height": "mm",
+                "max_moment": "N*mm",
+                "fck": "N/mm^2",
+                "fyk": "N/mm^2",
+                "steel_dia": "mm",
+                "steel_dia_bu": "mm",
+                "cover": "mm",
+            }
+        ),
+        {"req_steel": "mm^2", "fc_constraint": "dimensionless"},
+    ),
+    "approximate_tensile_strength": (
+        _tensile_strength,
+        UnitSchema({"compressive_strength": "MPa"}),
+        {"tensile_strength": "MPa"},
+    ),
+}
+
+
+def _gwp_mix_schema(constituents: dict):
+    """
+    flattens the constituents of `computation_GWP_mix` to '<constituent>_content' and '<constituent>_GWP'
+    """
+    inputs, units = {}, {}
+    for name, constituent in constituents.items():
+        inputs[f"{name}_content"] = constituent["content"]
+        inputs[f"{name}_GWP"] = constituent["GWP"]
+        units[f"{name}_content"] = "kg/m^3"
+        units[f"{name}_GWP"] = "kg_CO2_eq/kg"
+    return inputs, UnitSchema(units)
+
+
+def evaluate_with_gradients(function: str, inputs: dict):
+    """
+    Evaluates one of the analytic demonstrator functions and its derivatives with respect to all inputs
+
+    The derivatives are exact (forward mode differentiation of the same equations), so gradient based optimizers
+    do not need finite differences. The inputs are scalar pint quantities, as for the pint versions of the functions.
+
+    Parameters
+    ----------
+    function : str
+        name of the function, one of DIFFERENTIABLE_FUNCTIONS
+        - 'computation_volume_content' : inputs as for `computation_volume_content`, the plasticizer is optional
+          (without it there are no gradients with respect to the plasticizer)
+        - 'computation_GWP_mix' : the constituents dictionary of `computation_GWP_mix`, the derivatives are given for
+          '<constituent>_content' and '<constituent>_GWP'
+        - 'computation_GWP_per_part' : the arguments of `computation_GWP_per_part` by name
+        - 'beam_required_steel' : the arguments of `beam_required_steel` by name
+        - 'approximate_tensile_strength' : {'compressive_strength': ...}
+    inputs : dict with pint quantities
+
+    Returns
+    -------
+    outputs : dict
+        pint quantities with the results of the function
+    gradients : dict
+        gradients[output][input] is the derivative of the output with respect to the input, as pint quantity
+    """
+    if function not in DIFFERENTIABLE_FUNCTIONS:
+        raise ValueError(f"No gradients for '{function}', choose one of {', '.join(DIFFERENTIABLE_FUNCTIONS)}")
+    equations, schema, output_units = DIFFERENTIABLE_FUNCTIONS[function]
+
+    # inputs added here, they are no inputs of the caller and get no gradients
+    defaults = {}
+    if function == "computation_GWP_mix":
+        inputs, schema = _gwp_mix_schema(inputs)
+    elif function == "computation_volume_content" and "plasticizer_volume_content" not in inputs:
+        # optional parameter, as in computation_volume_content
+        defaults = {
+            "plasticizer_volume_content": 0 * ureg("kg/m^3"),
+            "density_plasticizer": 42 * ureg("kg/m^3"),  # dummy value
+        }
+        inputs = {**inputs, **defaults}
+
+    # converting to the units of the equations and seeding the gradients
+    values = schema.to_magnitudes({name: inputs[name] for name in schema.units})
+    names = list(schema.units)
+    seeds = np.eye(len(names))
+    variables = {name: _Dual(float(values[name]), seeds[i]) for i, name in enumerate(names)}
+
+    results = equations(variables)
+
+    outputs, gradients = {}, {}
+    for output, unit in output_units.items():
+        result = results[output]
+        if not isinstance(result, _Dual):
+            result = _Dual(float(result), np.zeros(len(names)))
+        outputs[output] = result.value * ureg(unit)
+        gradients[output] = {
+            name: result.grad[i] * (ureg.Unit(unit) / ureg.Unit(schema.units[name]))
+            for i, name in enumerate(names)
+            if name not in defaults
+        }
+    return outputs, gradients
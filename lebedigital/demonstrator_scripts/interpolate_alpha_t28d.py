@@ -1,6 +1,30 @@
+import numpy as np
+
 from lebedigital.unit_registry import ureg
 
 
+def interpolate_alpha_t28d_raw(alpha_mix1, alpha_mix2, fraction):
+    """
+    interpolates the degree of hydration after 28 days linearly between mix 1 and mix 2, all values dimensionless
+
+    Parameters
+    ----------
+    alpha_mix1, alpha_mix2 : float or np.array
+        degree of hydration after 28 days for mix 1 (OPC) and mix 2 (100% slag)
+    fraction : float or np.array
+        amount of slag compared to cement, value from 0 to 1
+
+    Returns
+    -------
+    alpha_t28d : float or np.array
+        degree of hydration after 28 days for the mix with the given slag ratio
+    """
+    assert np.all((0 <= fraction) & (fraction <= 1)), "slag_ratio must be between 0 and 1"
+    alpha_t28d = alpha_mix1 + (alpha_mix2 - alpha_mix1) * fraction
+
+    return alpha_t28d
+
+
 @ureg.check("", "", "")
 def interpolate_alpha_t28d(alpha_mix1, alpha_mix2, fraction):
     """
@@ -9,19 +33,16 @@ def interpolate_alpha_t28d(alpha_mix1, alpha_mix2, fraction):
 
     Parameters
     ----------
-    fraction : float / pint unitless
+    fraction : float or np.array / pint unitless
         amount of slag compared to cement, value from 0 to 1
-    alpha_mix1 : float / pint unitless
+    alpha_mix1 : float or np.array / pint unitless
         degree of hydration after 28 days for mix 1 (OPC)
-    alpha_mix2 : float / pint unitless
+    alpha_mix2 : float or np.array / pint unitless
         degree of hydration after 28 days for mix 2 (100% slag)
 
     Returns
     -------
-    alpha_t28d : float / pint unitless
+    alpha_t28d : float or np.array / pint unitless
         degree of hydration after 28 days for the mix with the given slag ratio
     """
-    assert 0 <= fraction <= 1, "slag_ratio must be between 0 and 1"
-    alpha_t28d = alpha_mix1 + (alpha_mix2 - alpha_mix1) * fraction
-
-    return alpha_t28d
+    return interpolate_alpha_t28d_raw(alpha_mix1, alpha_mix2, fraction)
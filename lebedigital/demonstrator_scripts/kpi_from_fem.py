@@ -1,13 +1,88 @@
 import numpy as np
-import pandas as pd
-import pint
 import pint_pandas
-from scipy.optimize import curve_fit
 
 from lebedigital.unit_registry import ureg
 
 
-def kpi_from_fem(df, limit_temp, limit_time):
+def _extrapolate(values, position):
+    """
+    Quadratic least squares fit of the values over their sample index, evaluated at the given index position
+    (e.g. -1 for one step before the first sample or len(values) for one step after the last sample).
+    """
+    index = np.arange(len(values), dtype=float)
+    coefficients = np.polyfit(index, values, deg=min(2, len(values) - 1))
+    return float(np.polyval(coefficients, position))
+
+
+def kpis_from_arrays(time, temperature, yield_values, crossing: str = "first") -> dict:
+    """
+    compute the KPIs of `kpi_from_fem` from plain arrays in one pass
+
+    The time of demolding is the time at which the maximum yield value changes its sign from positive to negative,
+    it is linearly interpolated between the two steps around the sign change.
+    If the yield does not change its sign, the time is extrapolated one step before the first step (all values
+    negative) or after the last step (all values positive), with a quadratic fit over the steps. The temperature is
+    extrapolated in the same way and included in the maximum temperature.
+
+    Parameters
+    ----------
+    time : array of times in consistent units
+    temperature : array of the maximum temperature at each time
+    yield_values : array of the maximum yield value at each time
+    crossing : which sign change gives the time of demolding, if the yield changes its sign several times
+        - "first" : the first change from positive to negative
+        - "last" : the last change from positive to negative, after which the yield stays negative, extrapolated if
+          the yield is positive at the end
+        - "error" : raises a ValueError for more than one change
+
+    Returns
+    -------
+    results : dict with floats in the units of the input
+        - 'time_of_demolding'
+        - 'max_reached_temperature'
+        - 'time_max_reached_temperature'
+    """
+    time = np.asarray(time, dtype=float)
+    temperature = np.asarray(temperature, dtype=float)
+    yield_values = np.asarray(yield_values, dtype=float)
+    assert crossing in ("first", "last", "error"), f"unknown crossing '{crossing}'"
+
+    # all sign changes, and the changes from positive to zero/negative
+    sign_changes = np.flatnonzero(np.diff(np.sign(yield_values)))
+    downward = sign_changes[(yield_values[sign_changes] > 0) & (yield_values[sign_changes + 1] <= 0)]
+    if crossing == "error" and sign_changes.size > 1:
+        raise ValueError(f"The yield changes its sign {sign_changes.size} times, at the steps {sign_changes.tolist()}")
+
+    extrapolate_at = None
+    if yield_values[0] == 0:
+        time_of_demolding = time[0]
+    elif downward.size == 0 or (crossing == "last" and yield_values[-1] > 0):
+        # no change of sign, extrapolate before the first or after the last step
+        extrapolate_at = -1 if yield_values[0] < 0 else len(time)
+        time_of_demolding = _extrapolate(time, extrapolate_at)
+    else:
+        i = downward[0] if crossing == "first" else downward[-1]
+        weight = yield_values[i] / (yield_values[i] - yield_values[i + 1])
+        time_of_demolding = time[i] + (time[i + 1] - time[i]) * weight
+
+    # maximum temperature, including an extrapolated step
+    i_max = np.argmax(temperature)
+    max_reached_temperature = temperature[i_max]
+    time_max_reached_temperature = time[i_max]
+    if extrapolate_at is not None:
+        extrapolated_temperature = _extrapolate(temperature, extrapolate_at)
+        if extrapolated_temperature > max_reached_temperature:
+            max_reached_temperature = extrapolated_temperature
+            time_max_reached_temperature = time_of_demolding
+
+    return {
+        "time_of_demolding": float(time_of_demolding),
+        "max_reached_temperature": float(max_reached_temperature),
+        "time_max_reached_temperature": float(time_max_reached_temperature),
+    }
+
+
+def kpi_from_fem(df, limit_temp, limit_time, crossing: str = "first"):
     """
     compute KPIs from simulation output
 
@@ -24,6 +99,9 @@ def kpi_from_fem(df, limit_temp, limit_time):
         data frame with the columns "time","temperature","yield"
     limit_temp: float in pint units
         maximum allowed temperature
+    limit_time: float in pint units
+        maximum allowed time of demolding
+    crossing : which sign change of the yield is used, if there are several, see `kpis_from_arrays`
 
     Returns
     -------
@@ -33,121 +111,20 @@ def kpi_from_fem(df, limit_temp, limit_time):
         - 'check_reached_temperature' in degree_Celsius
         - 'time_of_demolding' in hours
     """
-    # initialze dictionary
-    results = {}
+    # make sure the columns have expected units, as plain arrays
+    time = df["time"].pint.to("seconds").values.quantity.magnitude
+    temperature = df["temperature"].pint.to("degree_Celsius").values.quantity.magnitude
+    yield_values = df["yield"].pint.to("dimensionless").values.quantity.magnitude
 
-    # Part 1 : interpolate time when yield == 0
-    # this is based on the assumption that the sign of the max yield value only changes once.
-    # if there are cases where that is not ture, this approach need to be improved.
-    # TODO: catch multiple possible zero values, minimum: throw an error if this happens
-
-    # make sure the columns have expected units
-    df["time"] = df["time"].pint.to("seconds")
-    df["temperature"] = df["temperature"].pint.to("degree_Celsius")
-    df["yield"] = df["yield"].pint.to("dimensionless")
-
-    # subsequent operations have problems with the units (interpolation) therefore convert to standard df
-    df = df.pint.dequantify()
-
-    # adding new row with zero yield
-    new_line = pd.DataFrame(
-        {("time", "second"): [np.nan], ("temperature", "degree_Celsius"): [np.nan], ("yield", "dimensionless"): [0.0]}
-    )
-    df = pd.concat([df, new_line], ignore_index=True)
-
-    # sort table
-    df = df.sort_values(by=[("yield", "dimensionless")], ascending=False)
-
-    # interpolate missing values
-    df = df.interpolate(method="linear", limit_direction="forward")
-
-    # locate time of demoldung
-    results["time_of_demolding"] = df.at[
-        df.loc[df[("yield", "dimensionless")] == 0.0].index.values[0], ("time", "second")
-    ] * ureg("s")
-
-    # check if the data in inter or extrapolated
-    # get the first and last line of dataframe
-    yield_first_line = df.iloc[0]["yield"]
-
-    extr_id = None
-    if yield_first_line.all() == 0.0:
-        # write NaN to column time and temperature
-        df.iloc[0]["time"] = np.nan
-        df.iloc[0]["temperature"] = np.nan
-        extr_x = -1
-
-    yield_last_line = df.iloc[-1]["yield"]
-    if yield_last_line.all() == 0.0:
-        # write NaN to column time and temperature
-        df.iloc[-1]["time"] = np.nan
-        df.iloc[-1]["temperature"] = np.nan
-        # lentgh of dataframe
-        extr_x = len(df) - 1
-        print("length of dataframe")
-        print(extr_x)
-
-    if yield_first_line.all() == 0.0 or yield_last_line.all() == 0.0:
-        # if np.isnan(results["time_of_demolding"]):
-        # based on https://stackoverflow.com/questions/22491628/extrapolate-values-in-pandas-dataframe
-        # extrapolate missing values
-
-        # Function to curve fit to the data
-        def func(x, a, b, c):
-            return a * (x**2) + b * x + c
-
-        # Initial parameter guess, just to kick off the optimization
-        guess = (0.5, 0.5, 0.5)
-
-        # Create copy of data to remove NaNs for curve fitting
-        fit_df = df.dropna()
-
-        # Place to store function parameters for each column
-        col_params = {}
-
-        # Curve fit each column
-        for col in fit_df.columns:
-            # Get x & y
-            x = fit_df.index.astype(float).values
-            y = fit_df[col].values
-            # Curve fit column and get curve parameters
-            params = curve_fit(func, x, y, guess)
-
-            # Store optimized parameters
-            col_params[col] = params[0]
-
-        # Extrapolate each column
-        for col in df.columns:
-            # Get the index values for NaNs in the column
-            x = df[pd.isnull(df[col])].index.astype(float).values
-            # Extrapolate those points with the fitted function
-            # df[col][x] = func(x, *col_params[col])
-            df[col][x] = func(extr_x, *col_params[col])
-
-        results["time_of_demolding"] = df.at[
-            df.loc[df[("yield", "dimensionless")] == 0.0].index.values[0], ("time", "second")
-        ] * ureg("s")
-
-        print("extrapolate")
-        print(df)
-
-    # changing units, because we can
-    results["time_of_demolding"].ito("h")
-    limit_time.ito("h")
-
-    # requantify the dataframe
-    df = df.pint.quantify()
-
-    # Part 2 : get max temp, with time -> compute difference to limit
-    results["max_reached_temperature"] = df["temperature"].max()
-
-    results["time_max_reached_temperature"] = df.loc[df["temperature"] == results["max_reached_temperature"]][
-        "time"
-    ].tolist()[0]
-
-    # changing units, because we can
-    results["time_max_reached_temperature"].ito("hours")
+    kpis = kpis_from_arrays(time, temperature, yield_values, crossing=crossing)
+
+    # initialze dictionary, changing units, because we can
+    results = {}
+    results["time_of_demolding"] = (kpis["time_of_demolding"] * ureg("s")).to("h")
+    results["max_reached_temperature"] = ureg.Quantity(kpis["max_reached_temperature"], ureg.degC)
+    results["time_max_reached_temperature"] = (kpis["time_max_reached_temperature"] * ureg("s")).to("hours")
 
+    limit_time = limit_time.to("h")
     results["constraint_time"] = (results["time_of_demolding"] - limit_time) / limit_time
 
     # difference between limit temp and reached maximum
@@ -0,0 +1,137 @@
+import numpy as np
+
+from lebedigital.demonstrator_scripts.computation_specific_heat_capacity_paste import (
+    computation_specific_heat_capacity_paste_raw,
+)
+from lebedigital.demonstrator_scripts.computation_volume_content import volume_content_arrays
+from lebedigital.demonstrator_scripts.dummy_paste_strength_stiffness import dummy_paste_strength_stiffness_raw
+from lebedigital.unit_registry import ureg
+from lebedigital.unit_schema import UnitSchema
+
+# units the paste property evaluation expects
+PASTE_PROPERTY_UNITS = UnitSchema(
+    {
+        "density_cem": "kg/m^3",
+        "density_sub": "kg/m^3",
+        "density_water": "kg/m^3",
+        "density_aggregates": "kg/m^3",
+        "wb_mass_ratio": "dimensionless",
+        "sc_mass_fraction": "dimensionless",
+        "aggregates_volume_fraction": "dimensionless",
+        "shc_cement": "J/kg/K",
+        "shc_sub": "J/kg/K",
+        "shc_water": "J/kg/K",
+    }
+)
+
+# units of the outputs, the volume contents as in `computation_volume_content`
+PASTE_PROPERTY_OUTPUT_UNITS = {
+    "sc_volume_fraction": "dimensionless",
+    "plasticizer_vol_fraction": "dimensionless",
+    "water_vol_fraction": "dimensionless",
+    "sub_vol_fraction": "dimensionless",
+    "cem_vol_fraction": "dimensionless",
+    "cem_mass_per_cubic_meter_concrete": "kg/m^3",
+    "sub_mass_per_cubic_meter_concrete": "kg/m^3",
+    "water_mass_per_cubic_meter_concrete": "kg/m^3",
+    "aggregates_mass_per_cubic_meter_concrete": "kg/m^3",
+    "density_paste": "kg/m^3",
+    "paste_C": "J/kg/K",
+    "paste_E": "GPa",
+    "paste_fc": "MPa",
+}
+
+
+def paste_properties_arrays(
+    density_cem,
+    density_sub,
+    density_water,
+    density_aggregates,
+    wb_mass_ratio,
+    sc_mass_fraction,
+    aggregates_volume_fraction,
+    shc_cement,
+    shc_sub,
+    shc_water,
+    plasticizer_volume_content=0.0,
+    density_plasticizer=42.0,
+) -> dict:
+    """
+    volume contents, specific heat capacity, stiffness and strength of the pastes, the inputs are floats or arrays in
+    the units of PASTE_PROPERTY_UNITS (the plasticizer in kg/m^3) and are broadcast against each other
+
+    Returns
+    -------
+    results : dict
+        arrays in the units of PASTE_PROPERTY_OUTPUT_UNITS
+    """
+    results = volume_content_arrays(
+        density_cem=density_cem,
+        density_sub=density_sub,
+        density_water=density_water,
+        density_aggregates=density_aggregates,
+        wb_mass_ratio=wb_mass_ratio,
+        sc_mass_fraction=sc_mass_fraction,
+        aggregates_volume_fraction=aggregates_volume_fraction,
+        plasticizer_volume_content=plasticizer_volume_content,
+        density_plasticizer=density_plasticizer,
+    )
+
+    # rule specific_heat_capacity_paste
+    results["paste_C"] = computation_specific_heat_capacity_paste_raw(
+        results["cem_vol_fraction"],
+        results["sub_vol_fraction"],
+        results["water_vol_fraction"],
+        np.asarray(shc_cement, dtype=float),
+        np.asarray(shc_sub, dtype=float),
+        np.asarray(shc_water, dtype=float),
+        np.asarray(density_cem, dtype=float),
+        np.asarray(density_sub, dtype=float),
+        np.asarray(density_water, dtype=float),
+    )
+
+    # rule approx_paste_properties, based on the volume fraction of the substitute as in the workflow
+    results["paste_E"], results["paste_fc"] = dummy_paste_strength_stiffness_raw(results["sc_volume_fraction"])
+
+    return results
+
+
+def paste_properties(parameters: dict) -> dict:
+    """
+    This function computes the paste properties of mixes in one vectorised pass, from the mix ratios and the
+    constituent properties to the volume contents, paste density, specific heat capacity, stiffness and strength
+
+    It replaces the chain of `computation_volume_content`, `computation_specific_heat_capacity_paste` and
+    `dummy_paste_strength_stiffness` of the workflow, e.g. for a grid of slag ratios at once.
+
+    The input and output is wrapped by the python pint package: https://pint.readthedocs.io/
+    This requires units to be attached to the input values.
+
+    Parameters
+    ----------
+    parameters : dict
+        pint quantities with float or array magnitudes, which are broadcast against each other
+        - the parameters of PASTE_PROPERTY_UNITS
+        - optional 'plasticizer_volume_content' and 'density_plasticizer', as in `computation_volume_content`
+
+    Returns
+    -------
+    results : dict
+        pint quantities with the outputs of PASTE_PROPERTY_OUTPUT_UNITS
+    """
+    # optional parameter
+    optional = UnitSchema({"plasticizer_volume_content": "kg/m^3", "density_plasticizer": "kg/m^3"})
+    if "plasticizer_volume_content" not in parameters:
+        parameters = {
+            **parameters,
+            "plasticizer_volume_content": 0 * ureg("kg/m^3"),
+            "density_plasticizer": 42 * ureg("kg/m^3"),  # dummy value
+        }
+
+    # converting to correct pint units / automatic check for pint input
+    schema = PASTE_PROPERTY_UNITS + optional
+    magnitudes = schema.to_magnitudes(parameters)
+
+    results = paste_properties_arrays(**{name: magnitudes[name] for name in schema.units})
+
+    return {name: results[name] * ureg(unit) for name, unit in PASTE_PROPERTY_OUTPUT_UNITS.items()}
@@ -0,0 +1,142 @@
+"""In-process evaluation of the optimization workflow
+
+Runs the rules of `workflow_rules.RULES` (the rules of the Snakefile) on nodes kept in memory, instead of reading and
+writing the files for each rule. The results are also written as files to a working directory per sample, so samples
+can be evaluated concurrently and the inputs of the workflow directory are not changed.
+"""
+import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from lebedigital.demonstrator_scripts.workflow_rules import (
+    RULES,
+    from_pint_object_2_dict,
+    merge_nodes,
+    read_inputs,
+    write_node,
+)
+from lebedigital.memoization import MemoCache, memoization
+from lebedigital.unit_registry import ureg
+
+# result nodes combined to the KPIs, as in `analyze_kpis.get_kpis`
+KPI_NODES = [
+    "Results/kpi_from_fem.json",
+    "Results/gwp_beam.json",
+    "Results/beam_design.json",
+    "Results/gwp_mix.json",
+    "Results/steel_gwp_per_volume.json",
+]
+
+# the KPIs without the FE model
+ANALYTIC_KPI_NODES = KPI_NODES[1:]
+
+
+class WorkflowEvaluator:
+    """Runs the rules of the optimization workflow in-process
+
+    The inputs of the workflow directory are read once, each evaluation works on a copy with the changed design
+    variables and writes its results to its own working directory.
+
+    Parameters
+    ----------
+    workflow_path : path to the workflow directory with the `Inputs` folder
+    rules : optional subset of RULES to run, e.g. `required_rules(ANALYTIC_KPI_NODES)` for the KPIs without the FE
+        model
+    cache_dir : optional directory to store the results of the memoized functions, e.g. shared by several processes
+    """
+
+    def __init__(self, workflow_path, rules: list = None, cache_dir=None):
+        self.workflow_path = Path(workflow_path)
+        self.inputs = read_inputs(self.workflow_path / "Inputs")
+        self.rules = list(RULES) if rules is None else [rule for rule in RULES if rule in rules]
+        # results of the memoized functions are reused by all evaluations of this evaluator
+        self.cache = MemoCache(cache_dir=cache_dir)
+
+    def evaluate(self, changes: dict, working_dir) -> dict:
+        """
+        Runs the workflow for the changed inputs.
+
+        Parameters
+        ----------
+        changes : dict
+            {'Inputs/<file>.json': {key: value}}, values without units keep the unit of the input file
+        working_dir : directory for the result files of this evaluation, is created if required
+
+        Returns
+        -------
+        nodes : dict with all input and result nodes as pint dictionaries
+        """
+        working_dir = Path(working_dir)
+        working_dir.mkdir(parents=True, exist_ok=True)
+
+        nodes = copy.deepcopy(self.inputs)
+        for node, values in changes.items():
+            for key, value in values.items():
+                if not isinstance(value, ureg.Quantity):
+                    value = ureg.Quantity(value, nodes[node][key].units)
+                nodes[node][key] = value
+
+        with memoization(cache=self.cache):
+            for rule in self.rules:
+                function, inputs, output = RULES[rule]
+                nodes[output] = function(merge_nodes({node: nodes[node] for node in inputs}), working_dir)
+                write_node(nodes[output], working_dir / Path(output).name)
+
+        return nodes
+
+    def get_kpis(self, height, slag_ratio, working_dir) -> dict:
+        """
+        Returns the KPIs of `analyze_kpis.get_kpis` for the design variables, in the json form of the workflow.
+        """
+        nodes = self.evaluate(
+            {"Inputs/geometry.json": {"height": height}, "Inputs/sc_fraction.json": {"sc_mass_fraction": slag_ratio}},
+            working_dir,
+        )
+        kpis = {}
+        for node in KPI_NODES:
+            if node in nodes:
+                kpis.update(from_pint_object_2_dict(nodes[node]))
+        return kpis
+
+
+# one evaluator per workflow and process, the quantities of our unit registry cannot be sent between processes
+_EVALUATORS = {}
+
+
+def get_evaluator(workflow_path, rules: list = None, cache_dir=None) -> WorkflowEvaluator:
+    """
+    Returns the evaluator of the workflow in this process, it is created (and the inputs are read) at the first call
+    for the same arguments. Changes of the input files after that are not seen.
+    """
+    key = (str(Path(workflow_path).resolve()), tuple(rules) if rules is not None else None, str(cache_dir))
+    if key not in _EVALUATORS:
+        _EVALUATORS[key] = WorkflowEvaluator(workflow_path, rules=rules, cache_dir=cache_dir)
+    return _EVALUATORS[key]
+
+
+def _evaluate_sample(arguments):
+    workflow_path, rules, cache_dir, height, slag_ratio, working_dir = arguments
+    return get_evaluator(workflow_path, rules=rules, cache_dir=cache_dir).get_kpis(height, slag_ratio, working_dir)
+
+
+def evaluate_samples(
+    workflow_path, samples: list, results_path, rules: list = None, cache_dir=None, max_workers: int = None
+) -> list:
+    """
+    Evaluates the KPIs of many (height, slag_ratio) samples concurrently, each in a process pool worker and in the
+    working directory `results_path/sample_<i>`, see `WorkflowEvaluator` for the other parameters.
+
+    Returns
+    -------
+    kpis : list with the KPIs of each sample, in the order of the samples
+    """
+    arguments = [
+        (workflow_path, rules, cache_dir, height, slag_ratio, Path(results_path) / f"sample_{i}")
+        for i, (height, slag_ratio) in enumerate(samples)
+    ]
+    if max_workers == 1:
+        return [_evaluate_sample(argument) for argument in arguments]
+    # spawn fresh processes, FEniCS/MPI does not like to be forked
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(_evaluate_sample, arguments))
@@ -0,0 +1,477 @@
+"""Rules of the optimization workflow
+
+The rules of `usecases/optimization_paper/optimization_workflow/Snakefile` as python functions on a graph of pint
+dictionaries: each node is one of the files of the workflow (json files as pint dictionaries, csv files as pandas-pint
+DataFrames), each rule reads its input nodes and returns its output node. RULES is the only definition of the rules,
+the Snakefile runs them on the files with `run_rule` and `workflow_evaluator.WorkflowEvaluator` in memory.
+"""
+import copy
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pint
+import pint_pandas
+
+from lebedigital.unit_registry import ureg
+
+
+def from_dict_2_pint_object(dictionary: dict) -> dict:
+    """
+    transforms a dictionary in the form {"example": {"value": 1, "unit": "..."}, ...} to pint quantities
+    """
+    new_dict_pint = {}
+    for key in dictionary.keys():
+        if dictionary[key]["unit"] == "degree_Celsius":
+            # somehow temperature is different...
+            new_dict_pint[key] = ureg.Quantity(dictionary[key]["value"], ureg.degC)
+            continue
+        new_dict_pint[key] = dictionary[key]["value"] * ureg(dictionary[key]["unit"])
+    return new_dict_pint
+
+
+def from_pint_object_2_dict(dictionary: dict) -> dict:
+    """
+    transforms pint quantities to the standard dictionary form of the workflow
+    """
+    return {key: {"value": value.magnitude, "unit": "{0.units}".format(value)} for key, value in dictionary.items()}
+
+
+def write_pint_dict(dictionary: dict, path: Path):
+    with open(path, "w") as f:
+        f.write(json.dumps(from_pint_object_2_dict(dictionary), indent=4))
+
+
+def write_pint_df(pint_df: pd.DataFrame, path: Path):
+    pint_df.pint.dequantify().to_csv(path, index=None)
+
+
+def read_pint_df(path: Path) -> pd.DataFrame:
+    pint_df = pd.read_csv(path, header=[0, 1])
+    pint.set_application_registry(ureg)  # required to use the same registry
+    return pint_df.pint.quantify(level=-1)
+
+
+def write_node(node, path: Path):
+    """
+    writes a result node, pint dictionaries as json and pint data frames as csv
+    """
+    if isinstance(node, pd.DataFrame):
+        write_pint_df(node, path)
+    else:
+        write_pint_dict(node, path)
+
+
+def read_node(path: Path):
+    """
+    reads a node written by `write_node`
+    """
+    if Path(path).suffix == ".csv":
+        return read_pint_df(path)
+    with open(path) as f:
+        return from_dict_2_pint_object(json.load(f))
+
+
+def merge_nodes(nodes: dict) -> dict:
+    """
+    merges the input nodes {node name: node} of a rule to its parameters, a copy as the rules rename and convert
+    their input, data frames are given by the name of their node
+    """
+    p = {}
+    for node, value in nodes.items():
+        if isinstance(value, pd.DataFrame):
+            p[Path(node).stem] = value
+        else:
+            p.update(copy.deepcopy(value))
+    return p
+
+
+def read_inputs(input_path: Path) -> dict:
+    """
+    reads all json files of the input directory as nodes {'Inputs/<name>.json': pint dictionary}
+    """
+    nodes = {}
+    for path in sorted(Path(input_path).glob("*.json")):
+        with open(path) as f:
+            nodes[f"Inputs/{path.name}"] = from_dict_2_pint_object(json.load(f))
+    return nodes
+
+
+# rules, the names of the Snakefile
+def get_mix_hydration_parameters(p, working_dir):
+    from lebedigital.demonstrator_scripts.dummy_hydration_parameters import dummy_hydration_parameters
+
+    results = {}
+    for mix, slag_ratio in (("mix1", 0), ("mix2", 1)):
+        (
+            results[f"{mix}_B1"],
+            results[f"{mix}_B2"],
+            results[f"{mix}_eta"],
+            results[f"{mix}_E_act"],
+            results[f"{mix}_Q_pot"],
+            results[f"{mix}_T_ref"],
+        ) = dummy_hydration_parameters(slag_ratio, 42)
+    return results
+
+
+def approx_max_doh(p, working_dir):
+    from lebedigital.demonstrator_scripts.approximate_max_degree_of_hydration import (
+        approximate_max_degree_of_hydration,
+    )
+
+    return {"max_degree_of_hydration": approximate_max_degree_of_hydration(p["wb_mass_ratio"])}
+
+
+def compute_doh_at_28_days(p, working_dir):
+    import fenics_concrete
+
+    time_total = 60 * 60 * 24 * 28  # 28 days in seconds
+    dt = 60 * 60  # 1 hour in seconds
+    T = 20  # 20 degrees Celsius ambient temperature
+    time_list = np.arange(0, time_total, dt)
+
+    hydration_fkt = fenics_concrete.ConcreteThermoMechanical().get_heat_of_hydration_ftk()
+
+    # remove the units, for now...
+    p = {key: value.magnitude for key, value in p.items()}
+
+    results = {}
+    for mix in ("mix1", "mix2"):
+        parameters = {name: p[f"{mix}_{name}"] for name in ("B1", "B2", "eta", "E_act", "Q_pot", "T_ref")}
+        parameters["alpha_max"] = p["max_degree_of_hydration"]
+        heat_list, doh_list = hydration_fkt(T, time_list, dt, parameters)
+        results[f"alpha_{mix}"] = float(doh_list[-1]) * ureg.dimensionless
+    return results
+
+
+def mix_volume_contents(p, working_dir):
+    from lebedigital.demonstrator_scripts.computation_volume_content import computation_volume_content
+
+    return computation_volume_content(p)
+
+
+def interpolate_alpha_t28d(p, working_dir):
+    from lebedigital.demonstrator_scripts.interpolate_alpha_t28d import interpolate_alpha_t28d
+
+    return {"alpha_t28d": interpolate_alpha_t28d(p["alpha_mix1"], p["alpha_mix2"], p["sc_volume_fraction"])}
+
+
+def compute_loads(p, working_dir):
+    from lebedigital.demonstrator_scripts.computation_loads_with_safety import computation_loads_with_safety
+
+    results = {}
+    results["distributed_load"], results["point_load"] = computation_loads_with_safety(
+        p["safety_factor_permanent"],
+        p["safety_factor_variable"],
+        p["distributed_load_permanent"],
+        p["distributed_load_variable"],
+        p["point_load_permanent"],
+        p["point_load_variable"],
+    )
+    return results
+
+
+def approx_paste_properties(p, working_dir):
+    from lebedigital.demonstrator_scripts.dummy_paste_strength_stiffness import dummy_paste_strength_stiffness
+
+    results = {}
+    results["paste_E"], results["paste_fc"] = dummy_paste_strength_stiffness(p["sc_volume_fraction"], p["paste_phi"])
+    return results
+
+
+def approx_hydration_parameters(p, working_dir):
+    from lebedigital.demonstrator_scripts.dummy_hydration_parameters import dummy_hydration_parameters
+
+    results = {}
+    (
+        results["B1"],
+        results["B2"],
+        results["eta"],
+        results["E_act"],
+        results["Q_pot"],
+        results["T_ref"],
+    ) = dummy_hydration_parameters(p["sc_volume_fraction"], p["hydration_phi"])
+    return results
+
+
+def specific_heat_capacity_paste(p, working_dir):
+    from lebedigital.demonstrator_scripts.computation_specific_heat_capacity_paste import (
+        computation_specific_heat_capacity_paste,
+    )
+
+    paste_C = computation_specific_heat_capacity_paste(
+        p["cem_vol_fraction"],
+        p["sub_vol_fraction"],
+        p["water_vol_fraction"],
+        p["cement_C"],
+        p["sub_c"],
+        p["water_C"],
+        p["density_cem"],
+        p["density_sub"],
+        p["density_water"],
+    )
+    return {"paste_C": paste_C}
+
+
+def homogenization(p, working_dir):
+    from lebedigital.simulation.concrete_homogenization import concrete_homogenization
+
+    # fixing name discrepancies from other rules or inputs
+    p["paste_Q"] = p.pop("Q_pot")
+    p["paste_rho"] = p.pop("density_paste")
+    p["aggregates_rho"] = p.pop("density_aggregates")
+    p["aggregates_vol_frac"] = p.pop("aggregates_volume_fraction")
+
+    return concrete_homogenization(p)
+
+
+def approx_tensile_strength(p, working_dir):
+    from lebedigital.demonstrator_scripts.approximate_tensile_strength import approximate_tensile_strength
+
+    return {"concrete_ft": approximate_tensile_strength(p["fc"])}
+
+
+def beam_design(p, working_dir):
+    from lebedigital.demonstrator_scripts.beam_design import check_beam_design
+
+    design = check_beam_design(
+        span=p["length"],
+        width=p["width"],
+        height=p["height"],
+        point_load=p["point_load"],
+        distributed_load=p["distributed_load"],
+        compr_str_concrete=p["fc"],
+        yield_str_steel=p["steel_yield"],
+        steel_dia_bu=p["stirrups_diameter"],
+        cover_min=p["concrete_cover"],
+    )
+    return {
+        "n_reinforcement": design["n_steel_bars"],
+        "reinforcement_diameter": design["diameter"],
+        "constraint_beam_design": design["constraint_beam_design"],
+    }
+
+
+def gwp_steel_per_volume(p, working_dir):
+    from lebedigital.demonstrator_scripts.computation_GWP_steel_per_volume import computation_GWP_steel_per_volume
+
+    return {"steel_gwp_per_volume": computation_GWP_steel_per_volume(p["gwp_steel"], p["density_steel"])}
+
+
+def gwp_mix(p, working_dir):
+    from lebedigital.demonstrator_scripts.computation_GWP_mix import computation_GWP_mix
+
+    constituents = {
+        "cement": {"content": p["cem_mass_per_cubic_meter_concrete"], "GWP": p["gwp_cement"]},
+        "slag": {"content": p["sub_mass_per_cubic_meter_concrete"], "GWP": p["gwp_slag"]},
+        "water": {"content": p["water_mass_per_cubic_meter_concrete"], "GWP": p["gwp_water"]},
+        "aggregates": {"content": p["aggregates_mass_per_cubic_meter_concrete"], "GWP": p["gwp_aggregates"]},
+    }
+    return {"gwp_mix": computation_GWP_mix(constituents)}
+
+
+def gwp_beam(p, working_dir):
+    from lebedigital.demonstrator_scripts.computation_GWP_per_part import computation_GWP_per_part
+
+    gwp = computation_GWP_per_part(
+        p["gwp_mix"],
+        p["steel_gwp_per_volume"],
+        p["width"],
+        p["height"],
+        p["length"],
+        p["n_reinforcement"],
+        p["reinforcement_diameter"],
+    )
+    return {"gwp_beam": gwp}
+
+
+def kpi_from_fem(p, working_dir):
+    from lebedigital.demonstrator_scripts.kpi_from_fem import kpi_from_fem
+
+    return kpi_from_fem(p["fem_model"], p["temperature_limit"], p["time_limit"])
+
+
+def fem_model(p, working_dir):
+    from lebedigital.simulation.demonstrator_beam import demonstrator_beam
+    from lebedigital.simulation.time_stepping import kpis_decided
+
+    # fixing name discrepancies from other rules or inputs
+    p["alpha_tx"] = p.pop("alpha_t28d")
+    p["vol_heat_cap"] = p.pop("C")
+    p["density"] = p.pop("rho")
+    p["themal_cond"] = p.pop("kappa")
+    p["Q_inf"] = p.pop("Q")
+    p["alpha_max"] = p.pop("max_degree_of_hydration")
+    p["ft"] = p.pop("steel_yield")  # setting the tensile yield to steel as a test, only used in yield fct
+
+    # optional, set 'stop_early' in fem_control.json to stop once the time of demolding and the max temperature are
+    # determined, off by default
+    stop_criterion = kpis_decided() if p.pop("stop_early", 0) else None
+
+    # output is a pandas-pint dataframe, the paraview output is written to the working directory
+    return demonstrator_beam(
+        p["full_time"],
+        p["time_step"],
+        p,
+        pv_output=True,
+        pv_name=str(working_dir / "demonstrator_beam"),
+        stop_criterion=stop_criterion,
+    )
+
+
+# rule name: (function, input nodes, output node), in an order that respects the dependencies
+RULES = {
+    "get_mix_hydration_parameters": (get_mix_hydration_parameters, [], "Results/mixes_hydration_parameters.json"),
+    "approx_max_doh": (approx_max_doh, ["Inputs/wb_ratio.json"], "Results/approx_max_doh.json"),
+    "compute_doh_at_28_days": (
+        compute_doh_at_28_days,
+        ["Results/approx_max_doh.json", "Results/mixes_hydration_parameters.json"],
+        "Results/mixes_alpha_t28d.json",
+    ),
+    "mix_volume_contents": (
+        mix_volume_contents,
+        [
+            "Inputs/material_properties.json",
+            "Inputs/aggregates_volume_fraction.json",
+            "Inputs/sc_fraction.json",
+            "Inputs/wb_ratio.json",
+        ],
+        "Results/mix_volume_contents.json",
+    ),
+    "interpolate_alpha_t28d": (
+        interpolate_alpha_t28d,
+        ["Results/mix_volume_contents.json", "Results/mixes_alpha_t28d.json"],
+        "Results/alpha_t28d.json",
+    ),
+    "compute_loads": (compute_loads, ["Inputs/loads.json"], "Results/loads_safe.json"),
+    "approx_paste_properties": (
+        approx_paste_properties,
+        ["Results/mix_volume_contents.json", "Inputs/phi_paste.json"],
+        "Results/approx_paste_properties.json",
+    ),
+    "approx_hydration_parameters": (
+        approx_hydration_parameters,
+        ["Results/mix_volume_contents.json", "Inputs/phi_hydration.json"],
+        "Results/approx_hydration_parameters.json",
+    ),
+    "specific_heat_capacity_paste": (
+        specific_heat_capacity_paste,
+        ["Results/mix_volume_contents.json", "Inputs/material_properties.json"],
+        "Results/specific_heat_capacity_paste.json",
+    ),
+    "homogenization": (
+        homogenization,
+        [
+            "Inputs/material_properties.json",
+            "Results/specific_heat_capacity_paste.json",
+            "Results/mix_volume_contents.json",
+            "Inputs/aggregates_volume_fraction.json",
+            "Results/approx_hydration_parameters.json",
+            "Results/approx_paste_properties.json",
+        ],
+        "Results/homogenization.json",
+    ),
+    "approx_tensile_strength": (
+        approx_tensile_strength,
+        ["Results/homogenization.json"],
+        "Results/approx_tensile_strength.json",
+    ),
+    "beam_design": (
+        beam_design,
+        [
+            "Inputs/geometry.json",
+            "Inputs/steel_properties.json",
+            "Inputs/beam_design.json",
+            "Results/loads_safe.json",
+            "Results/homogenization.json",
+        ],
+        "Results/beam_design.json",
+    ),
+    "gwp_steel_per_volume": (
+        gwp_steel_per_volume,
+        ["Inputs/steel_properties.json"],
+        "Results/steel_gwp_per_volume.json",
+    ),
+    "gwp_mix": (
+        gwp_mix,
+        ["Inputs/material_properties.json", "Results/mix_volume_contents.json"],
+        "Results/gwp_mix.json",
+    ),
+    "gwp_beam": (
+        gwp_beam,
+        [
+            "Inputs/geometry.json",
+            "Results/steel_gwp_per_volume.json",
+            "Results/gwp_mix.json",
+            "Results/beam_design.json",
+        ],
+        "Results/gwp_beam.json",
+    ),
+    "fem_model": (
+        fem_model,
+        [
+            "Inputs/geometry.json",
+            "Inputs/steel_properties.json",
+            "Inputs/fem_control.json",
+            "Inputs/fem_parameters.json",
+            "Results/homogenization.json",
+            "Results/approx_max_doh.json",
+            "Results/approx_hydration_parameters.json",
+            "Results/alpha_t28d.json",
+        ],
+        "Results/fem_model.csv",
+    ),
+    "kpi_from_fem": (
+        kpi_from_fem,
+        ["Inputs/fem_limits.json", "Results/fem_model.csv"],
+        "Results/kpi_from_fem.json",
+    ),
+}
+
+
+def required_rules(outputs: list) -> list:
+    """
+    Returns the rules (in the order of RULES) required to compute the given output nodes.
+    """
+    required = set()
+    missing = list(outputs)
+    producers = {output: rule for rule, (_, _, output) in RULES.items()}
+    while missing:
+        node = missing.pop()
+        if node in producers and producers[node] not in required:
+            required.add(producers[node])
+            missing.extend(RULES[producers[node]][1])
+    return [rule for rule in RULES if rule in required]
+
+
+def rule_inputs(rule: str) -> list:
+    """
+    Returns the input nodes (file paths relative to the workflow directory) of a rule, e.g. for the Snakefile.
+    """
+    return list(RULES[rule][1])
+
+
+def rule_output(rule: str) -> str:
+    """
+    Returns the output node (file path relative to the workflow directory) of a rule, e.g. for the Snakefile.
+    """
+    return RULES[rule][2]
+
+
+def run_rule(rule: str, input_paths: list, output_path, working_dir=None):
+    """
+    Runs a rule on files, as done by the Snakefile: reads the input files, runs the rule and writes the output file.
+
+    Parameters
+    ----------
+    rule : name of the rule in RULES
+    input_paths : paths of the input nodes, in the order of `rule_inputs`
+    output_path : path of the output node
+    working_dir : directory for additional outputs (e.g. paraview files), defaults to the directory of output_path
+    """
+    function, inputs, _ = RULES[rule]
+    assert len(input_paths) == len(inputs), f"rule {rule} requires the inputs {inputs}"
+    p = merge_nodes({node: read_node(path) for node, path in zip(inputs, input_paths)})
+    working_dir = Path(output_path).parent if working_dir is None else Path(working_dir)
+    write_node(function(p, working_dir), output_path)
@@ -1,6 +1,29 @@
 import numpy as np
 from lebedigital.unit_registry import ureg
 
+def youngs_modulus_approximation_raw(fc, density):
+    """
+    Young's modulus from the compressive strength (MPa) and the density (kg/m^3) of the concrete, in MPa, for
+    floats or numpy arrays
+
+    Parameters
+    ----------
+    fc : float
+        concrete compressive strength after 28 days in MPa
+    density: float
+        concrete density in kg/m^3
+
+    Returns
+    -------
+    youngs_modulus : float
+        approximated youngs modulus in MPa
+    """
+
+    youngs_modulus = 3320*np.sqrt(fc)+6895*(density/2320)**1.5
+
+    return youngs_modulus
+
+
 @ureg.wraps('MPa', ('MPa', 'kg/m^3'))
 def youngs_modulus_approximation(fc,density) :
     """
@@ -26,6 +49,4 @@ def youngs_modulus_approximation(fc,density) :
         approximated youngs modulus
     """
 
-    youngs_modulus = 3320*np.sqrt(fc)+6895*(density/2320)**1.5
-
-    return youngs_modulus
+    return youngs_modulus_approximation_raw(fc, density)
@@ -0,0 +1,239 @@
+import contextvars
+import copy
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from lebedigital.profiling import count
+from lebedigital.unit_registry import ureg
+
+# the active cache, None if memoization is disabled. A context variable, so each thread (and asyncio task) has its
+# own: memoization enabled in one thread is not active in threads started within, they have to enable it themselves
+_ACTIVE_CACHE = contextvars.ContextVar("active_cache", default=None)
+
+
+def _round_significant(values, digits: int):
+    """
+    Rounds floats or arrays to the given number of significant digits.
+    """
+    values = np.asarray(values, dtype=float)
+    exponent = np.floor(np.log10(np.abs(values), out=np.zeros_like(values), where=values != 0))
+    scale = 10.0**exponent
+    return np.round(values / scale, digits - 1) * scale
+
+
+def canonical_key(value, digits: int = 10):
+    """
+    Returns a hashable key for the value, equal for equal physical values.
+
+    Pint quantities are converted to base units, so 1 m and 1000 mm give the same key, floats and float arrays are
+    rounded to `digits` significant digits. Dicts, lists and tuples are converted recursively. Raises a TypeError for
+    values that have no canonical form (e.g. data frames).
+    """
+    if isinstance(value, ureg.Quantity):
+        value = value.to_base_units()
+        return ("quantity", str(value.units), canonical_key(value.magnitude, digits))
+    if value is None or isinstance(value, (bool, str, int, np.integer, np.bool_)):
+        return value
+    if isinstance(value, (float, np.floating)):
+        return float(_round_significant(value, digits))
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+        return ("array", value.shape, tuple(_round_significant(value, digits).ravel().tolist()))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((str(name), canonical_key(item, digits)) for name, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(canonical_key(item, digits) for item in value))
+    raise TypeError(f"No canonical key for {type(value).__name__}")
+
+
+def _to_storable(value):
+    """
+    Replaces the pint quantities by (magnitude, unit string), the quantities of our registry cannot be pickled.
+    """
+    if isinstance(value, ureg.Quantity):
+        return ("__quantity__", value.magnitude, str(value.units))
+    if isinstance(value, dict):
+        return type(value)((name, _to_storable(item)) for name, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_storable(item) for item in value)
+    return value
+
+
+def _from_storable(value):
+    """
+    Inverse of `_to_storable`.
+    """
+    if isinstance(value, tuple) and len(value) == 3 and value[0] == "__quantity__":
+        return ureg.Quantity(value[1], value[2])
+    if isinstance(value, dict):
+        return type(value)((name, _from_storable(item)) for name, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value)(_from_storable(item) for item in value)
+    return value
+
+
+class MemoCache:
+    """Least recently used cache of function results, with an optional store on disk
+
+    The results are kept in memory up to `maxsize` entries, the least recently used ones are dropped first. With a
+    `cache_dir` each result is also pickled to a file named by the hash of its key, so later runs (e.g. the next
+    optimization iteration in a new process) can reuse it. The files are written atomically, so several processes can
+    share a cache_dir, and unreadable files are treated as missing.
+
+    Parameters
+    ----------
+    maxsize : maximum number of results in memory
+    cache_dir : optional directory of the store on disk
+    digits : significant digits of the canonical keys, see `canonical_key`
+    """
+
+    def __init__(self, maxsize: int = 1024, cache_dir=None, digits: int = 10):
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.digits = digits
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(repr(key).encode()).hexdigest()}.pkl"
+
+    def get(self, key):
+        """
+        Returns (True, copy of the result) for a known key and (False, None) otherwise.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif self.cache_dir is None or not self._load(key):
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, copy.deepcopy(self.entries[key])
+
+    def _load(self, key) -> bool:
+        """
+        Reads the result of the key from the store on disk, returns False if there is no readable file.
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                result = _from_storable(pickle.load(f))
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, ValueError):
+            return False
+        self._remember(key, result)
+        return True
+
+    def put(self, key, result):
+        """
+        Stores a copy of the result, so changes of the returned object by the caller do not change the cache.
+        """
+        self._remember(key, copy.deepcopy(result))
+        if self.cache_dir is not None:
+            # written to a temporary file first, readers never see a partially written file
+            with tempfile.NamedTemporaryFile("wb", dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                pickle.dump(_to_storable(result), f)
+            os.replace(f.name, self._path(key))
+
+    def _remember(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Empties the cache in memory, the store on disk is kept.
+        """
+        self.entries.clear()
+
+
+def active_cache():
+    """
+    Returns the active cache or None if memoization is disabled.
+    """
+    return _ACTIVE_CACHE.get()
+
+
+@contextmanager
+def memoization(cache_dir=None, maxsize: int = 1024, digits: int = 10, enabled: bool = True, cache: MemoCache = None):
+    """
+    Enables memoization of all `memoized` functions in the enclosed code.
+
+    Memoization is opt-in, without an active cache the decorated functions are called as usual. If a cache is
+    already active, it is kept and no new cache is started. The cache is only active in the current thread, see
+    `_ACTIVE_CACHE`.
+
+    Parameters
+    ----------
+    cache_dir : optional
+        If given, the results are also stored in this directory and reused by later runs.
+    maxsize : maximum number of results in memory
+    digits : significant digits of the canonical keys, see `canonical_key`
+    enabled : bool, optional
+        Set to False to run the code without memoization.
+    cache : MemoCache, optional
+        An existing cache to continue with (e.g. over several evaluations), the other settings are then ignored.
+
+    Yields
+    ------
+    cache : the active MemoCache or None if memoization is disabled
+    """
+    if _ACTIVE_CACHE.get() is not None or not enabled:
+        yield _ACTIVE_CACHE.get()
+        return
+
+    if cache is None:
+        cache = MemoCache(maxsize=maxsize, cache_dir=cache_dir, digits=digits)
+    token = _ACTIVE_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_CACHE.reset(token)
+
+
+def memoized(name: str):
+    """
+    Decorator for deterministic functions of pint quantities, the results are cached if memoization is enabled.
+
+    The key is built from `name` and the canonical form of all arguments (after binding them to the signature, so
+    positional and keyword calls are the same), calls with arguments without a canonical form are not cached. Hits
+    and misses are counted as `<name>.cache_hit` and `<name>.cache_miss` in an active profile.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = _ACTIVE_CACHE.get()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            try:
+                key = (name, canonical_key(dict(arguments.arguments), cache.digits))
+            except TypeError:
+                return func(*args, **kwargs)
+
+            found, result = cache.get(key)
+            if found:
+                count(f"{name}.cache_hit")
+                return result
+            count(f"{name}.cache_miss")
+            result = func(*args, **kwargs)
+            cache.put(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,189 @@
+import functools
+import inspect
+import json
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# the active profile, None if profiling is disabled
+_ACTIVE_PROFILE = None
+
+
+class Profile:
+    """Collects the timings and counters of one run
+
+    The timers accumulate the number of calls, the total and the maximum wall clock time per name, timers can be nested
+    (e.g. the forward model response inside the likelihood evaluation). Counters count arbitrary events.
+    """
+
+    def __init__(self, name: str = None):
+        self.name = name
+        self.timers = {}
+        self.counters = {}
+        self._start = time.perf_counter()
+        self.total_time = None
+
+    def add_time(self, name: str, elapsed: float):
+        timer = self.timers.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0})
+        timer["calls"] += 1
+        timer["total"] += elapsed
+        timer["max"] = max(timer["max"], elapsed)
+
+    def add_count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def stop(self):
+        self.total_time = time.perf_counter() - self._start
+
+    def to_dict(self) -> dict:
+        """
+        Returns the profile as a json serializable dictionary.
+        """
+        total_time = self.total_time if self.total_time is not None else time.perf_counter() - self._start
+        return {
+            "name": self.name,
+            "total_time": total_time,
+            "timers": {
+                name: {**timer, "mean": timer["total"] / timer["calls"]} for name, timer in sorted(self.timers.items())
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def write_json(self, path):
+        """
+        Writes the profile to a json file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary(self) -> str:
+        """
+        Returns a table of the timers, sorted by total time, and of the counters.
+        """
+        profile = self.to_dict()
+        total_time = profile["total_time"]
+        lines = [
+            f"Profile {profile['name'] or ''} (total {total_time:.3f} s)",
+            f"{'timer':<40} {'calls':>8} {'total [s]':>12} {'mean [s]':>12} {'max [s]':>12} {'share':>7}",
+        ]
+        for name, timer in sorted(profile["timers"].items(), key=lambda item: -item[1]["total"]):
+            share = timer["total"] / total_time if total_time > 0 else 0.0
+            lines.append(
+                f"{name:<40} {timer['calls']:>8} {timer['total']:>12.4f} {timer['mean']:>12.6f} {timer['max']:>12.6f} "
+                f"{share:>7.1%}"
+            )
+        for name, value in profile["counters"].items():
+            lines.append(f"{name:<40} {value:>8}")
+        return "\n".join(lines)
+
+
+def active_profile():
+    """
+    Returns the active profile or None if profiling is disabled.
+    """
+    return _ACTIVE_PROFILE
+
+
+@contextmanager
+def profiling(profile_path=None, name: str = None, enabled: bool = None):
+    """
+    Enables profiling for the enclosed code, all `timer` and `count` calls are recorded in a new profile.
+
+    Profiling is opt-in, without an active profile the timers and counters do nothing. If a profile is already
+    active (e.g. a profiled function called inside a profiled run), it keeps collecting and no new profile is started.
+
+    Parameters
+    ----------
+    profile_path : optional
+        If given, the profile is written to this json file and its summary table is logged at the end (level INFO).
+    name : optional
+        Name of the run, stored in the profile.
+    enabled : bool, optional
+        Start a profile even without profile_path, defaults to True if profile_path is given.
+
+    Yields
+    ------
+    profile : the active Profile or None if profiling is disabled
+    """
+    global _ACTIVE_PROFILE
+    if enabled is None:
+        enabled = profile_path is not None
+    if _ACTIVE_PROFILE is not None or not enabled:
+        yield _ACTIVE_PROFILE
+        return
+
+    profile = Profile(name)
+    _ACTIVE_PROFILE = profile
+    try:
+        yield profile
+    finally:
+        _ACTIVE_PROFILE = None
+        profile.stop()
+        if profile_path is not None:
+            Path(profile_path).parent.mkdir(parents=True, exist_ok=True)
+            profile.write_json(profile_path)
+            logger.info("Profile written to %s\n%s", profile_path, profile.summary())
+
+
+@contextmanager
+def timer(name: str):
+    """
+    Measures the wall clock time of the enclosed code, if profiling is enabled.
+    """
+    profile = _ACTIVE_PROFILE
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_time(name, time.perf_counter() - start)
+
+
+def count(name: str, n: int = 1):
+    """
+    Increases the counter `name` by n, if profiling is enabled.
+    """
+    if _ACTIVE_PROFILE is not None:
+        _ACTIVE_PROFILE.add_count(name, n)
+
+
+def timed(name: str):
+    """
+    Decorator measuring each call of the function with `timer(name)`.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def profiled(name: str, path_argument: str = "profile_path"):
+    """
+    Decorator for the entry point of a run, the run is profiled if the argument `path_argument` of the decorated
+    function is set, the profile is then written to that path (see `profiling`).
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            with profiling(arguments.arguments.get(path_argument), name=name), timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
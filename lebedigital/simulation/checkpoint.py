@@ -0,0 +1,171 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# file names inside a checkpoint directory
+FIELDS_FILE = "fields.h5"
+STATE_FILE = "state.json"
+
+
+def find_fields(problem, max_depth: int = 2) -> dict:
+    """
+    Collects the FE functions (dolfin.Function) of a fenics_concrete problem, including the ones of its sub problems
+    (e.g. the temperature and the mechanics problem of ConcreteThermoMechanical).
+
+    Parameters
+    ----------
+    problem : fenics_concrete problem
+    max_depth : depth up to which attributes of attributes are searched
+
+    Returns
+    -------
+    fields : dict, attribute path (e.g. "temperature_problem.T") -> dolfin.Function
+    """
+    fields = {}
+    visited = set()
+
+    def search(obj, prefix, depth):
+        if id(obj) in visited or not hasattr(obj, "__dict__"):
+            return
+        visited.add(id(obj))
+        for name, value in sorted(vars(obj).items()):
+            if name in ("experiment", "sensors"):
+                continue
+            path = f"{prefix}{name}"
+            if type(value).__module__.startswith("dolfin") and _is_function(value):
+                fields.setdefault(path, value)
+            elif depth < max_depth and type(value).__module__.startswith("fenics_concrete"):
+                search(value, f"{path}.", depth + 1)
+
+    search(problem, "", 0)
+    return fields
+
+
+def _is_function(value) -> bool:
+    # dolfin is only imported if the problem has dolfin attributes
+    import dolfin
+
+    return isinstance(value, dolfin.Function)
+
+
+def save_state(problem) -> dict:
+    """
+    Copies the state of a problem in memory (the local values of the FE fields and the length of the sensor
+    histories), e.g. to repeat a rejected time step with `restore_state`.
+    """
+    return {
+        "fields": {name: field.vector().get_local() for name, field in find_fields(problem).items()},
+        "sensors": {name: len(sensor.data) for name, sensor in problem.sensors.items()},
+    }
+
+
+def restore_state(problem, state: dict):
+    """
+    Restores the state of a problem saved by `save_state`, the sensor values added since are removed.
+    """
+    fields = find_fields(problem)
+    for name, values in state["fields"].items():
+        fields[name].vector().set_local(values)
+        fields[name].vector().apply("insert")
+    for name, length in state["sensors"].items():
+        del problem.sensors[name].data[length:]
+        del problem.sensors[name].time[length:]
+
+
+def write_sensor_history(problem, path, **state):
+    """
+    Writes the time and data of all sensors and additional state values to a json file.
+    """
+    sensors = {
+        name: {"time": np.asarray(sensor.time).tolist(), "data": np.asarray(sensor.data).tolist()}
+        for name, sensor in problem.sensors.items()
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"state": state, "sensors": sensors}, f)
+    os.replace(tmp_path, path)
+
+
+def read_sensor_history(problem, path) -> dict:
+    """
+    Restores the sensor time and data from a json file written by `write_sensor_history`.
+
+    Returns
+    -------
+    state : dict with the additional state values
+    """
+    with open(path) as f:
+        history = json.load(f)
+    for name, sensor in problem.sensors.items():
+        sensor.time = list(history["sensors"][name]["time"])
+        sensor.data = list(history["sensors"][name]["data"])
+    return history["state"]
+
+
+def checkpoint_time(checkpoint_path) -> float:
+    """
+    Returns the time in s of the last solved step of a checkpoint written by `write_checkpoint`.
+    """
+    with open(Path(checkpoint_path) / STATE_FILE) as f:
+        return json.load(f)["state"]["t"]
+
+
+def write_checkpoint(problem, checkpoint_path, t: float, dt: float):
+    """
+    Writes a checkpoint of a fenics_concrete problem: the FE fields as HDF5 and the sensor histories and time as json.
+    An existing checkpoint in the same directory is replaced.
+
+    Parameters
+    ----------
+    problem : fenics_concrete problem
+    checkpoint_path : directory of the checkpoint
+    t : time of the last solved step in s
+    dt : current time step in s
+    """
+    import dolfin
+
+    checkpoint_path = Path(checkpoint_path)
+    checkpoint_path.mkdir(parents=True, exist_ok=True)
+    comm = dolfin.MPI.comm_world
+
+    fields = find_fields(problem)
+    tmp_fields_file = str(checkpoint_path / f"{FIELDS_FILE}.tmp")
+    with dolfin.HDF5File(comm, tmp_fields_file, "w") as h5:
+        for name, field in fields.items():
+            # the vectors are written, this works for all function spaces including quadrature spaces
+            h5.write(field.vector(), f"/{name}")
+
+    if dolfin.MPI.rank(comm) == 0:
+        os.replace(tmp_fields_file, checkpoint_path / FIELDS_FILE)
+        write_sensor_history(problem, checkpoint_path / STATE_FILE, t=t, dt=dt, fields=sorted(fields))
+    dolfin.MPI.barrier(comm)
+
+
+def read_checkpoint(problem, checkpoint_path) -> tuple:
+    """
+    Restores the FE fields and sensor histories of a problem from a checkpoint written by `write_checkpoint`. The
+    problem has to be set up in the same way (parameters, mesh, sensors) as the checkpointed one.
+
+    Returns
+    -------
+    t : time of the last solved step in s
+    dt : time step in s
+    """
+    import dolfin
+
+    checkpoint_path = Path(checkpoint_path)
+    state = read_sensor_history(problem, checkpoint_path / STATE_FILE)
+
+    fields = find_fields(problem)
+    missing = set(state["fields"]) - set(fields)
+    if missing:
+        raise ValueError(f"The checkpoint does not match the problem, fields {sorted(missing)} are missing")
+
+    with dolfin.HDF5File(dolfin.MPI.comm_world, str(checkpoint_path / FIELDS_FILE), "r") as h5:
+        for name in state["fields"]:
+            h5.read(fields[name].vector(), f"/{name}", False)
+            fields[name].vector().apply("insert")
+
+    return state["t"], state["dt"]
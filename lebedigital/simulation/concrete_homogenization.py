@@ -1,15 +1,19 @@
-import fenics_concrete
+from lebedigital.memoization import memoized
 from lebedigital.unit_registry import ureg
+from lebedigital.simulation.mori_tanaka import HOMOGENIZATION_PARAMETER_UNITS, mori_tanaka
 
+@memoized("concrete_homogenization")
 def concrete_homogenization(parameters):
     """ returns homogenized concrete parameter
 
-    this function calls the Mori-Tanaka homogenization scheme
+    this function calls the Mori-Tanaka homogenization scheme (`mori_tanaka.mori_tanaka`, the equations of
+    fenics_concrete.ConcreteHomogenization with one type of uncoated aggregates, fenics is not required)
     A dictionary with the required parameter is given
 
     The input and output is wrapped by the python pint package: https://pint.readthedocs.io/
     This requires units to be attached to the input values.
     Units will be automatically converted to what is required, an appropriate dimensionality must be given.
+    For arrays of parameters use `mori_tanaka.vectorized_homogenization`.
 
     Parameters
     ----------
@@ -39,41 +43,17 @@ def concrete_homogenization(parameters):
     """
 
     # converting to correct pint units / automatic check for pint input
-    parameters['paste_E'].ito('Pa')
-    parameters['paste_fc'].ito('Pa')
-    parameters['paste_kappa'].ito('W/m/K')
-    parameters['paste_rho'].ito('kg/m^3')
-    parameters['paste_C'].ito('J/kg/K')
-    parameters['paste_Q'].ito('J/kg')
-    parameters['aggregates_E'].ito('Pa')
-    parameters['aggregates_kappa'].ito('W/m/K')
-    parameters['aggregates_rho'].ito('kg/m^3')
-    parameters['aggregates_C'].ito('J/kg/K')
+    parameters = HOMOGENIZATION_PARAMETER_UNITS.to_magnitudes(parameters)
 
-    # initialize concrete paste
-    concrete = fenics_concrete.ConcreteHomogenization(E_matrix=parameters['paste_E'].magnitude,
-                                                      nu_matrix=parameters['paste_nu'].magnitude,
-                                                      fc_matrix=parameters['paste_fc'].magnitude,
-                                                      kappa_matrix=parameters['paste_kappa'].magnitude,
-                                                      rho_matrix=parameters['paste_rho'].magnitude,
-                                                      C_matrix=parameters['paste_C'].magnitude,
-                                                      Q_matrix=parameters['paste_Q'].magnitude)
-
-    # adding uncoated aggregates
-    concrete.add_uncoated_particle(E=parameters['aggregates_E'].magnitude,
-                                   nu=parameters['aggregates_nu'].magnitude,
-                                   volume_fraction=parameters['aggregates_vol_frac'].magnitude,
-                                   kappa=parameters['aggregates_kappa'].magnitude,
-                                   rho=parameters['aggregates_rho'].magnitude,
-                                   C=parameters['aggregates_C'].magnitude)
+    results = mori_tanaka(**{name: parameters[name] for name in HOMOGENIZATION_PARAMETER_UNITS.units})
 
     # output with corresponding units
-    results = {'E': concrete.E_eff * ureg('Pa'),
-               'nu': concrete.nu_eff * ureg('dimensionless'),
-               'fc': concrete.fc_eff * ureg('Pa'),
-               'C': concrete.C_vol_eff * ureg('J/m^3/K'),
-               'rho': concrete.rho_eff * ureg('kg/m^3'),
-               'kappa': concrete.kappa_eff * ureg('W/m/K'),
-               'Q': concrete.Q_vol_eff * ureg('J/m^3')}
-
-    return results
\ No newline at end of file
+    units = {'E': 'Pa',
+             'nu': 'dimensionless',
+             'fc': 'Pa',
+             'C': 'J/m^3/K',
+             'rho': 'kg/m^3',
+             'kappa': 'W/m/K',
+             'Q': 'J/m^3'}
+
+    return {name: float(results[name]) * ureg(unit) for name, unit in units.items()}
@@ -1,51 +1,88 @@
 import fenics_concrete
-import pandas as pd
 import pint_pandas
 
-from lebedigital.unit_registry import ureg
-
-
-def demonstrator_beam(time, dt, parameters, pv_output=False, pv_name="beam_simulation"):
-    # check/convert units...
-    # TODO this needs to be moved to fenics concrete but for now this is ok.
-    parameters["density"].ito("kg/m^3")
-    parameters["themal_cond"].ito("W/m/K")
-    parameters["vol_heat_cap"].ito("J/m^3/K")
-    parameters["alpha_t"].ito("")
-    parameters["alpha_0"].ito("")
-    parameters["a_E"].ito("")
-    parameters["fc"].ito("N/m^2")
-    parameters["a_fc"].ito("")
-    parameters["ft"].ito("N/m^2")
-    parameters["a_ft"].ito("")
-    parameters["T_0"].ito("degree_Celsius")
-    parameters["T_bc1"].ito("degree_Celsius")
-    parameters["length"].ito("m")
-    parameters["width"].ito("m")
-    parameters["height"].ito("m")
-    parameters["Q_inf"].ito("J/m^3")
-    parameters["B1"].ito("1/s")
-    parameters["B2"].ito("")
-    parameters["eta"].ito("")
-    parameters["E_act"].ito("J/mol")
-    parameters["T_ref"].ito("degree_Celsius")
-    parameters["alpha_max"].ito("")
-    parameters["E"].ito("N/m^2")
-    parameters["nu"].ito("")
-    parameters["mesh_density"].ito("")
-    parameters["mesh_density_min"].ito("")
-
-    # ... now remove all units, otherwise problems with simulation :(, will change in the future...
-    for key in parameters.keys():
-        # check if paramter has a unit, then remove it
-        if type(parameters[key]) == type(1 * ureg("")):
-            parameters[key] = parameters[key].magnitude
+from lebedigital.simulation.reduced_beam_models import BeamCrossSectionExperiment, SymmetricBeamExperiment
+from lebedigital.simulation.time_stepping import run_hardening_simulation
+from lebedigital.unit_schema import UnitSchema, magnitude
+
+# units the simulation expects, all other quantities are passed without units
+BEAM_PARAMETER_UNITS = UnitSchema(
+    {
+        "density": "kg/m^3",
+        "themal_cond": "W/m/K",
+        "vol_heat_cap": "J/m^3/K",
+        "alpha_t": "",
+        "alpha_0": "",
+        "a_E": "",
+        "fc": "N/m^2",
+        "a_fc": "",
+        "ft": "N/m^2",
+        "a_ft": "",
+        "T_0": "degree_Celsius",
+        "T_bc1": "degree_Celsius",
+        "length": "m",
+        "width": "m",
+        "height": "m",
+        "Q_inf": "J/m^3",
+        "B1": "1/s",
+        "B2": "",
+        "eta": "",
+        "E_act": "J/mol",
+        "T_ref": "degree_Celsius",
+        "alpha_max": "",
+        "E": "N/m^2",
+        "nu": "",
+        "mesh_density": "",
+        "mesh_density_min": "",
+    }
+)
+
+
+def demonstrator_beam(
+    time,
+    dt,
+    parameters,
+    pv_output=False,
+    pv_name="beam_simulation",
+    adaptive=False,
+    dt_min=None,
+    dt_max=None,
+    output_times=None,
+    stop_criterion=None,
+    checkpoint_path=None,
+    checkpoint_interval=10,
+    restart_from=None,
+    sensor_file=None,
+    keep_sensor_history=True,
+    sensor_callback=None,
+    model="full",
+):
+    """
+    Runs the thermo-mechanical hardening simulation and returns the maximum temperature and yield over time.
+
+    Parameters
+    ----------
+    time : pint time quantity, simulation time
+    dt : pint time quantity, time step (initial time step for adaptive time stepping)
+    parameters : fenics_concrete.Parameters with pint quantities
+    pv_name : name of the paraview output file
+    pv_output, adaptive, dt_min, dt_max, output_times, stop_criterion, checkpoint_path, checkpoint_interval,
+    restart_from, sensor_file, keep_sensor_history, sensor_callback :
+        time stepping and output options, see `time_stepping.run_hardening_simulation` and `run_time_loop`
+    model : "full" (default), "half" or "quarter" for the symmetric reduced 3D models with the same results up to the
+        discretization, or "cross_section" for a 2D model of the cross section, only valid for the temperature (the
+        returned DataFrame has no yield column), see `reduced_beam_models`
+
+    Returns
+    -------
+    pint_df : pd.DataFrame with the columns time, temperature and yield
+    """
+    # check/convert units, the input parameters are not modified
+    parameters = BEAM_PARAMETER_UNITS.to_magnitudes(parameters)
 
     # same for the two values, not in the parameter list
-    time.ito("s")
-    time = time.magnitude
-    dt.ito("s")
-    dt = dt.magnitude
+    time = magnitude(time, "s")
+    dt = magnitude(dt, "s")
 
     # simulation parameters
     parameters["log_level"] = "WARNING"
@@ -53,39 +90,41 @@ def demonstrator_beam(time, dt, parameters, pv_output=False, pv_name="beam_simul
     parameters["evolution_ft"] = False  # just gravity
     parameters["bc_setting"] = "no_external_load"  # just gravity
 
-    experiment = fenics_concrete.ConcreteBeamExperiment(parameters)
+    if model == "full":
+        experiment = fenics_concrete.ConcreteBeamExperiment(parameters)
+    elif model in ("half", "quarter"):
+        parameters["symmetry"] = model
+        experiment = SymmetricBeamExperiment(parameters)
+    elif model == "cross_section":
+        parameters["dim"] = 2
+        experiment = BeamCrossSectionExperiment(parameters)
+    else:
+        raise ValueError(f"Unknown beam model '{model}', use 'full', 'half', 'quarter' or 'cross_section'")
     problem = fenics_concrete.ConcreteThermoMechanical(experiment, parameters, pv_name=pv_name)
 
     problem.add_sensor(fenics_concrete.sensors.MaxYieldSensor())
     problem.add_sensor(fenics_concrete.sensors.MaxTemperatureSensor())
 
-    # set time step
-    problem.set_timestep(dt)  # for time integration scheme
-
-    # initialize time
-    t = dt  # first time step time
-
-    print("Run simulation!")
-    time_data = []
-    while t <= time:  # time loop in seconds
-        # solve temp-hydration-mechanics
-        problem.solve(t=t)  # solving this
-
-        if pv_output:
-            problem.pv_plot(t=t)
-
-        # prepare next timestep
-        t += dt
-
-    print("Done!")
-
-    # Building Pandas-Pint DataFrame
-    pint_df = pd.DataFrame(
-        {
-            "time": pd.Series(problem.sensors["MaxYieldSensor"].time, dtype="pint[s]"),
-            "temperature": pd.Series(problem.sensors["MaxTemperatureSensor"].data, dtype="pint[degree_Celsius]"),
-            "yield": pd.Series(problem.sensors["MaxYieldSensor"].data, dtype="pint[]"),
-        }
+    pint_df = run_hardening_simulation(
+        problem,
+        time,
+        dt,
+        pv_output=pv_output,
+        adaptive=adaptive,
+        dt_min=dt_min,
+        dt_max=dt_max,
+        output_times=output_times,
+        stop_criterion=stop_criterion,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=checkpoint_interval,
+        restart_from=restart_from,
+        sensor_file=sensor_file,
+        keep_sensor_history=keep_sensor_history,
+        sensor_callback=sensor_callback,
     )
 
+    if model == "cross_section":
+        # the yield of the cross section misses the bending due to dead load
+        pint_df = pint_df.drop(columns="yield")
+
     return pint_df
@@ -0,0 +1,172 @@
+import numpy as np
+from scipy.integrate import solve_ivp
+
+# universal gas constant in J/mol/K, same value as in fenics_concrete
+GAS_CONSTANT = 8.3145
+# conversion degree Celsius to Kelvin
+ZERO_CELSIUS = 273.15
+
+
+def hydration_rate(alpha, temperature, B1, B2, eta, alpha_max, E_act, T_ref):
+    """
+    Rate of the degree of hydration, the same hydration law as in fenics_concrete's thermo-mechanical model.
+
+    Parameters
+    ----------
+    alpha : degree of hydration
+    temperature : temperature in degree Celsius
+    B1 : parameter of the affinity function in 1/s
+    B2 : parameter of the affinity function
+    eta : parameter of the affinity function
+    alpha_max : maximum degree of hydration
+    E_act : activation energy in J/mol
+    T_ref : reference temperature in degree Celsius
+
+    Returns
+    -------
+    rate : d alpha / dt in 1/s, arrays are broadcast
+    """
+    affinity = B1 * (B2 / alpha_max + alpha) * (alpha_max - alpha) * np.exp(-eta * alpha / alpha_max)
+    arrhenius = np.exp(-E_act / GAS_CONSTANT * (1 / (temperature + ZERO_CELSIUS) - 1 / (T_ref + ZERO_CELSIUS)))
+    return affinity * arrhenius
+
+
+def degree_of_hydration(time, temperature, B1, B2, eta, alpha_max, E_act, T_ref, rtol=1e-8, atol=1e-10):
+    """
+    Computes the degree of hydration over time at constant temperature for one material point, i.e. a mesh free
+    version of a small isothermal cube (starting with alpha = 0 at t = 0).
+
+    All parameters can be arrays (broadcast to a common shape), all parameter sets are integrated at once.
+
+    Parameters
+    ----------
+    time : float or array of times in s
+    temperature : constant temperature in degree Celsius
+    B1, B2, eta, alpha_max, E_act, T_ref : hydration parameters, see `hydration_rate`
+    rtol, atol : tolerances of the time integration
+
+    Returns
+    -------
+    alpha : np.array with shape (parameter shape) + (time shape)
+    """
+    parameters = np.broadcast_arrays(
+        *[np.asarray(value, dtype=float) for value in (temperature, B1, B2, eta, alpha_max, E_act, T_ref)]
+    )
+    shape = parameters[0].shape
+    temperature, B1, B2, eta, alpha_max, E_act, T_ref = [value.ravel() for value in parameters]
+
+    time = np.asarray(time, dtype=float)
+    t_eval = np.unique(time.ravel())
+    assert t_eval[0] >= 0, "only non negative times are allowed"
+
+    def rhs(t, alpha):
+        return hydration_rate(alpha, temperature, B1, B2, eta, alpha_max, E_act, T_ref)
+
+    solution = solve_ivp(
+        rhs, (0.0, t_eval[-1]), np.zeros(temperature.size), t_eval=t_eval, method="RK45", rtol=rtol, atol=atol
+    )
+    if not solution.success:
+        raise RuntimeError(f"Integration of the hydration law failed: {solution.message}")
+
+    # map the sorted unique times back to the requested times
+    alpha = solution.y[:, np.searchsorted(t_eval, time.ravel())]
+    return alpha.reshape(shape + time.shape)
+
+
+def youngs_modulus_evolution(alpha, E, alpha_t, alpha_0, a_E, alpha_tx=1.0):
+    """
+    Young's modulus as function of the degree of hydration, as in fenics_concrete. Below alpha_t the modulus is
+    interpolated linearly to zero. The given E is reached at alpha_tx, i.e. the evolution is scaled by the modulus of
+    the fully hydrated concrete E_inf = E / ((alpha_tx - alpha_0) / (1 - alpha_0))^a_E.
+
+    Parameters
+    ----------
+    alpha : degree of hydration
+    E : Young's modulus at alpha = alpha_tx
+    alpha_t : degree of hydration, below which the modulus is interpolated linearly
+    alpha_0 : degree of hydration, at which the concrete starts to gain stiffness
+    a_E : exponent of the evolution
+    alpha_tx : degree of hydration the given E refers to, e.g. the one after 28 days
+
+    Returns
+    -------
+    E : Young's modulus in the units of the given E
+    """
+    alpha = np.asarray(alpha, dtype=float)
+    E_inf = E / ((alpha_tx - alpha_0) / (1 - alpha_0)) ** a_E
+    E_at_alpha_t = E_inf * ((alpha_t - alpha_0) / (1 - alpha_0)) ** a_E
+    with np.errstate(invalid="ignore"):
+        E_above = E_inf * ((alpha - alpha_0) / (1 - alpha_0)) ** a_E
+    return np.where(alpha < alpha_t, E_at_alpha_t * alpha / alpha_t, E_above)
+
+
+def compressive_strength_evolution(alpha, fc, a_fc, alpha_tx=1.0):
+    """
+    Compressive strength as function of the degree of hydration, as in fenics_concrete.
+
+    Parameters
+    ----------
+    alpha : degree of hydration
+    fc : compressive strength at alpha = alpha_tx
+    a_fc : exponent of the evolution
+    alpha_tx : degree of hydration the given fc refers to, e.g. the one after 28 days
+
+    Returns
+    -------
+    fc : compressive strength in the units of the given fc
+    """
+    alpha = np.asarray(alpha, dtype=float) / alpha_tx
+    return fc * alpha**a_fc
+
+
+def material_evolution(time, temperature, parameters: dict) -> dict:
+    """
+    Computes the degree of hydration, Young's modulus and compressive strength over time at constant temperature.
+
+    Parameters
+    ----------
+    time : float or array of times in s
+    temperature : constant temperature in degree Celsius
+    parameters : dict with float values (or arrays for several parameter sets) in SI units and degree Celsius
+        - B1, B2, eta, alpha_max, E_act, T_ref : hydration parameters
+        - E, alpha_t, alpha_0, a_E : Young's modulus evolution
+        - fc, a_fc : compressive strength evolution
+        - alpha_tx : optional, degree of hydration E and fc refer to
+
+    Returns
+    -------
+    results : dict with the arrays "alpha", "E" and "fc", shape (parameter shape) + (time shape)
+    """
+    # all parameter sets are broadcast to a common shape
+    keys = ["B1", "B2", "eta", "alpha_max", "E_act", "T_ref", "E", "alpha_t", "alpha_0", "a_E", "fc", "a_fc"]
+    values = dict(zip(keys, np.broadcast_arrays(*[np.asarray(parameters[key], dtype=float) for key in keys])))
+    alpha_tx = parameters.get("alpha_tx", 1.0)
+
+    alpha = degree_of_hydration(
+        time,
+        temperature,
+        values["B1"],
+        values["B2"],
+        values["eta"],
+        values["alpha_max"],
+        values["E_act"],
+        values["T_ref"],
+    )
+
+    # parameter arrays are broadcast against the additional time axis
+    time_axes = (1,) * np.ndim(time)
+
+    def expand(value):
+        return np.reshape(value, np.shape(value) + time_axes)
+
+    E = youngs_modulus_evolution(
+        alpha,
+        expand(values["E"]),
+        expand(values["alpha_t"]),
+        expand(values["alpha_0"]),
+        expand(values["a_E"]),
+        expand(alpha_tx),
+    )
+    fc = compressive_strength_evolution(alpha, expand(values["fc"]), expand(values["a_fc"]), expand(alpha_tx))
+
+    return {"alpha": alpha, "E": E, "fc": fc}
@@ -0,0 +1,157 @@
+import numpy as np
+
+from lebedigital.unit_registry import ureg
+from lebedigital.unit_schema import UnitSchema
+
+# units the homogenization expects
+HOMOGENIZATION_PARAMETER_UNITS = UnitSchema(
+    {
+        "paste_E": "Pa",
+        "paste_nu": "",
+        "paste_fc": "Pa",
+        "paste_kappa": "W/m/K",
+        "paste_rho": "kg/m^3",
+        "paste_C": "J/kg/K",
+        "paste_Q": "J/kg",
+        "aggregates_E": "Pa",
+        "aggregates_nu": "",
+        "aggregates_vol_frac": "",
+        "aggregates_kappa": "W/m/K",
+        "aggregates_rho": "kg/m^3",
+        "aggregates_C": "J/kg/K",
+    }
+)
+
+
+def mori_tanaka(
+    paste_E,
+    paste_nu,
+    paste_fc,
+    paste_kappa,
+    paste_rho,
+    paste_C,
+    paste_Q,
+    aggregates_E,
+    aggregates_nu,
+    aggregates_vol_frac,
+    aggregates_kappa,
+    aggregates_rho,
+    aggregates_C,
+):
+    """returns homogenized concrete parameters for arrays of paste and aggregate properties
+
+    Mori-Tanaka scheme for spherical, uncoated aggregates in a paste matrix, the same equations as
+    fenics_concrete.ConcreteHomogenization with one type of aggregates. All inputs are floats or arrays in the units of
+    HOMOGENIZATION_PARAMETER_UNITS, they are broadcast against each other.
+
+    Returns
+    -------
+    results : dict
+        np.arrays with the homogenized values in SI units
+        - E, nu, fc, C (volumetric), rho, kappa, Q (volumetric)
+    """
+    (
+        paste_E,
+        paste_nu,
+        paste_fc,
+        paste_kappa,
+        paste_rho,
+        paste_C,
+        paste_Q,
+        aggregates_E,
+        aggregates_nu,
+        f,
+        aggregates_kappa,
+        aggregates_rho,
+        aggregates_C,
+    ) = np.broadcast_arrays(
+        *[
+            np.asarray(value, dtype=float)
+            for value in (
+                paste_E,
+                paste_nu,
+                paste_fc,
+                paste_kappa,
+                paste_rho,
+                paste_C,
+                paste_Q,
+                aggregates_E,
+                aggregates_nu,
+                aggregates_vol_frac,
+                aggregates_kappa,
+                aggregates_rho,
+                aggregates_C,
+            )
+        ]
+    )
+    f_m = 1 - f
+
+    # bulk and shear moduli
+    K_m = paste_E / (3 * (1 - 2 * paste_nu))
+    G_m = paste_E / (2 * (1 + paste_nu))
+    K_a = aggregates_E / (3 * (1 - 2 * aggregates_nu))
+    G_a = aggregates_E / (2 * (1 + aggregates_nu))
+
+    # Eshelby coefficients of a sphere and the dilute concentration factors
+    alpha = 1 / 3
+    beta = 2 * (4 - 5 * paste_nu) / (15 * (1 - paste_nu))
+    A_vol = 1 / (1 + alpha * (K_a / K_m - 1))
+    A_dev = 1 / (1 + beta * (G_a / G_m - 1))
+
+    K_eff = (f_m * K_m + f * K_a * A_vol) / (f_m + f * A_vol)
+    G_eff = (f_m * G_m + f * G_a * A_dev) / (f_m + f * A_dev)
+
+    E_eff = 9 * K_eff * G_eff / (3 * K_eff + G_eff)
+    nu_eff = (3 * K_eff - 2 * G_eff) / (2 * (3 * K_eff + G_eff))
+
+    # compressive strength, based on the deviatoric stress concentration in the matrix
+    B_dev = 1 / (f_m + f * A_dev)
+    fc_eff = paste_fc * G_eff / (G_m * B_dev)
+
+    # thermal conductivity
+    A_kappa = 3 * paste_kappa / (2 * paste_kappa + aggregates_kappa)
+    kappa_eff = (f_m * paste_kappa + f * aggregates_kappa * A_kappa) / (f_m + f * A_kappa)
+
+    # volume averages
+    rho_eff = f_m * paste_rho + f * aggregates_rho
+    C_vol_eff = f_m * paste_rho * paste_C + f * aggregates_rho * aggregates_C
+    Q_vol_eff = f_m * paste_rho * paste_Q
+
+    return {"E": E_eff, "nu": nu_eff, "fc": fc_eff, "C": C_vol_eff, "rho": rho_eff, "kappa": kappa_eff, "Q": Q_vol_eff}
+
+
+def vectorized_homogenization(parameters):
+    """returns homogenized concrete parameters for arrays of mixes
+
+    Same input and output as `concrete_homogenization`, but the values can be arrays (pint quantities with array
+    magnitudes), all parameter sets are computed in one call with numpy, e.g. for parameter sweeps.
+
+    Parameters
+    ----------
+    parameters : dict
+        Paste and aggregate properties, see `concrete_homogenization`
+
+    Returns
+    -------
+    results : dict
+        pint quantities with the homogenized values
+        - E, nu, fc, C, rho, kappa, Q
+    """
+
+    # converting to correct pint units / automatic check for pint input
+    parameters = HOMOGENIZATION_PARAMETER_UNITS.to_magnitudes(parameters)
+
+    results = mori_tanaka(**{name: parameters[name] for name in HOMOGENIZATION_PARAMETER_UNITS.units})
+
+    # output with corresponding units
+    units = {
+        "E": "Pa",
+        "nu": "dimensionless",
+        "fc": "Pa",
+        "C": "J/m^3/K",
+        "rho": "kg/m^3",
+        "kappa": "W/m/K",
+        "Q": "J/m^3",
+    }
+
+    return {name: results[name] * ureg(unit) for name, unit in units.items()}
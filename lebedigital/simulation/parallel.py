@@ -0,0 +1,117 @@
+"""
+MPI helpers for the thermo-mechanical simulations.
+
+Started with mpirun, dolfin partitions the mesh over the ranks and each rank solves its part. The max sensors of
+fenics_concrete only see the local part of the fields, therefore their values are reduced over all ranks after each
+step, such that all ranks see the same sensor data (required for adaptive time steps and stop criteria).
+
+Entry point, writes the same data as the DataFrame returned by the simulation functions (on rank 0)::
+
+    mpirun -n 4 python -m lebedigital.simulation.parallel beam params.json results.csv --time "2 days" --dt "20 min"
+"""
+import argparse
+import json
+
+import numpy as np
+
+from lebedigital.unit_registry import ureg
+
+
+def get_comm():
+    """
+    Returns the MPI world communicator, or None if mpi4py is not available.
+    """
+    try:
+        from mpi4py import MPI
+    except ImportError:
+        return None
+    return MPI.COMM_WORLD
+
+
+def is_parallel(comm=None) -> bool:
+    """
+    True if the program runs on more than one MPI rank.
+    """
+    comm = get_comm() if comm is None else comm
+    return comm is not None and comm.Get_size() > 1
+
+
+def is_root(comm=None) -> bool:
+    """
+    True on MPI rank 0 and in serial runs.
+    """
+    comm = get_comm() if comm is None else comm
+    return comm is None or comm.Get_rank() == 0
+
+
+def reduce_max_sensors(problem, comm=None):
+    """
+    Replaces the last value of all max sensors (e.g. MaxTemperatureSensor, MaxYieldSensor) by the maximum over all
+    ranks. Does nothing in serial runs.
+    """
+    comm = get_comm() if comm is None else comm
+    if not is_parallel(comm):
+        return
+    from mpi4py import MPI
+
+    for name, sensor in problem.sensors.items():
+        if name.startswith("Max") and len(sensor.data) > 0:
+            local = np.asarray(sensor.data[-1], dtype=float)
+            if local.ndim == 0:
+                sensor.data[-1] = comm.allreduce(float(local), op=MPI.MAX)
+            else:
+                # elementwise maximum for vector valued sensors
+                reduced = np.empty_like(local)
+                comm.Allreduce(local, reduced, op=MPI.MAX)
+                sensor.data[-1] = reduced
+
+
+def read_parameters(path) -> dict:
+    """
+    Reads simulation parameters from a json file in the workflow format {"name": {"value": ..., "unit": ...}, ...}.
+    """
+    with open(path) as f:
+        dictionary = json.load(f)
+
+    parameters = {}
+    for key, value in dictionary.items():
+        if value["unit"] == "degree_Celsius":
+            parameters[key] = ureg.Quantity(value["value"], ureg.degC)
+        else:
+            parameters[key] = value["value"] * ureg(value["unit"])
+    return parameters
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Runs the beam or column hardening simulation, with mpirun in parallel."
+    )
+    parser.add_argument("simulation", choices=["beam", "column"])
+    parser.add_argument("parameters", help="json file with the simulation parameters")
+    parser.add_argument("output", help="csv file for the sensor data (time, temperature, yield)")
+    parser.add_argument("--time", required=True, help='simulation time, e.g. "2 days"')
+    parser.add_argument("--dt", required=True, help='time step, e.g. "20 min"')
+    parser.add_argument("--pv-name", default=None, help="name of the paraview output, no output if not given")
+    args = parser.parse_args(args)
+
+    import fenics_concrete
+
+    parameters = fenics_concrete.Parameters()
+    parameters.update(read_parameters(args.parameters))
+
+    if args.simulation == "beam":
+        from lebedigital.simulation.demonstrator_beam import demonstrator_beam as simulation
+    else:
+        from lebedigital.simulation.precast_column import column_simulation as simulation
+
+    kwargs = {"pv_output": args.pv_name is not None}
+    if args.pv_name is not None:
+        kwargs["pv_name"] = args.pv_name
+    pint_df = simulation(ureg(args.time), ureg(args.dt), parameters, **kwargs)
+
+    if is_root():
+        pint_df.pint.dequantify().to_csv(args.output, index=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Reduced models of the demonstrator beam, see `demonstrator_beam(..., model=...)`.
+
+The geometry, the temperature boundary conditions, the supports and the loads of the beam are symmetric with respect
+to the mid span plane (x = length/2) and the mid width plane (y = width/2).
+
+- "half": the beam is cut at mid span, the cut is a symmetry plane (u_x = 0, no heat flux).
+- "quarter": the beam is additionally cut at mid width (u_y = 0, no heat flux).
+
+For a symmetric problem the reduced models solve the same problem, the maximum temperature and yield values are the
+same as for the full beam up to the discretization error, the element size is the same as for the full model.
+
+- "cross_section": the 2D (plane strain) cross section at mid span, heat flux along the beam axis is neglected. The
+  temperature is conservative (upper bound) at mid span, the axial heat flux only lowers the temperature within about
+  one beam height of the ends. Only the temperature KPIs are meaningful, the mechanical results do not include the
+  bending due to dead load, so `demonstrator_beam` returns no yield for this model.
+
+The maximum relative errors of the KPIs compared to the full model are measured by `reduced_model_errors`, they
+depend on the geometry, the mesh and the time steps and have to be measured for each setup.
+tests/simulation/test_demonstrator_beam.py (0.3 m x 0.5 m x 10 m, 1 h in 20 min steps) accepts up to 5 % for the
+temperature and 10 % for the yield.
+"""
+import dolfin as df
+import fenics_concrete
+import numpy as np
+
+
+def _element_number(length: float, height: float, mesh_density: int, mesh_density_min: int) -> int:
+    """number of elements along `length` for `mesh_density` elements along `height`"""
+    return max(int(mesh_density_min), int(round(mesh_density * length / height)))
+
+
+class SymmetricBeamExperiment(fenics_concrete.ConcreteBeamExperiment):
+    """Half or quarter of the concrete beam with symmetry boundary conditions
+
+    Additional parameter 'symmetry': "half" (cut at mid span) or "quarter" (cut at mid span and mid width).
+    """
+
+    def setup(self):
+        assert self.p.dim == 3, "the symmetric beam models are only implemented in 3D"
+        assert self.p.symmetry in ("half", "quarter"), f"unknown symmetry '{self.p.symmetry}'"
+
+        self.model_length = self.p.length / 2
+        self.model_width = self.p.width / 2 if self.p.symmetry == "quarter" else self.p.width
+
+        n_height = int(self.p.mesh_density)
+        # same element size as the full model, half of its elements in the cut directions
+        n_length = max(1, _element_number(self.p.length, self.p.height, n_height, self.p.mesh_density_min) // 2)
+        n_width = _element_number(self.p.width, self.p.height, n_height, self.p.mesh_density_min)
+        if self.p.symmetry == "quarter":
+            n_width = max(1, n_width // 2)
+
+        self.mesh = df.BoxMesh(
+            df.Point(0, 0, 0),
+            df.Point(self.model_length, self.model_width, self.p.height),
+            n_length,
+            n_width,
+            n_height,
+        )
+
+    def _on_symmetry_plane(self, x) -> bool:
+        on_plane = df.near(x[0], self.model_length)
+        if self.p.symmetry == "quarter":
+            on_plane = on_plane or df.near(x[1], self.model_width)
+        return on_plane
+
+    def create_temp_bcs(self, V):
+        # constant temperature on the outer surface, the symmetry planes are adiabatic, in Kelvin as in
+        # fenics_concrete.ConcreteBeamExperiment
+        def outer_surface(x, on_boundary):
+            return on_boundary and not self._on_symmetry_plane(x)
+
+        return [df.DirichletBC(V, df.Constant(self.p.T_bc1 + self.p.zero_C), outer_surface)]
+
+    def create_displ_bcs(self, V):
+        model_length = self.model_length
+        model_width = self.model_width
+
+        def mid_span(x, on_boundary):
+            return on_boundary and df.near(x[0], model_length)
+
+        def mid_width(x, on_boundary):
+            return on_boundary and df.near(x[1], model_width)
+
+        def support(x):
+            return df.near(x[0], 0) and df.near(x[2], 0)
+
+        displ_bcs = [df.DirichletBC(V.sub(0), df.Constant(0.0), mid_span)]  # symmetry in length direction
+        displ_bcs.append(df.DirichletBC(V.sub(2), df.Constant(0.0), support, method="pointwise"))  # line support
+        if self.p.symmetry == "quarter":
+            displ_bcs.append(df.DirichletBC(V.sub(1), df.Constant(0.0), mid_width))  # symmetry in width direction
+        else:
+            displ_bcs.append(df.DirichletBC(V.sub(1), df.Constant(0.0), support, method="pointwise"))
+
+        if self.p.bc_setting == "full":
+            # displacement load at the top of the mid span
+            def load(x):
+                return df.near(x[0], model_length) and df.near(x[2], self.p.height)
+
+            displ_bcs.append(df.DirichletBC(V.sub(2), self.displ_load, load, method="pointwise"))
+
+        return displ_bcs
+
+
+class BeamCrossSectionExperiment(fenics_concrete.ConcreteBeamExperiment):
+    """2D plane strain cross section (width x height) of the concrete beam, for the temperature KPIs"""
+
+    def setup(self):
+        assert self.p.dim == 2, "the cross section model is 2D"
+        n_height = int(self.p.mesh_density)
+        n_width = _element_number(self.p.width, self.p.height, n_height, self.p.mesh_density_min)
+        self.mesh = df.RectangleMesh(df.Point(0, 0), df.Point(self.p.width, self.p.height), n_width, n_height)
+
+    def create_temp_bcs(self, V):
+        # constant temperature on the whole surface, in Kelvin
+        def outer_surface(x, on_boundary):
+            return on_boundary
+
+        return [df.DirichletBC(V, df.Constant(self.p.T_bc1 + self.p.zero_C), outer_surface)]
+
+    def create_displ_bcs(self, V):
+        width = self.p.width
+
+        def bottom(x, on_boundary):
+            return on_boundary and df.near(x[1], 0)
+
+        def bottom_center(x):
+            return df.near(x[0], width / 2) and df.near(x[1], 0)
+
+        # supported at the bottom, fixed horizontally at one point
+        return [
+            df.DirichletBC(V.sub(1), df.Constant(0.0), bottom),
+            df.DirichletBC(V.sub(0), df.Constant(0.0), bottom_center, method="pointwise"),
+        ]
+
+
+def reduced_model_errors(time, dt, parameters, models=("half", "quarter", "cross_section")) -> dict:
+    """
+    Measures the maximum relative errors of the reduced models compared to the full beam.
+
+    Parameters
+    ----------
+    time : pint time quantity, simulation time
+    dt : pint time quantity, time step
+    parameters : fenics_concrete.Parameters with pint quantities, as for `demonstrator_beam`
+    models : the reduced models to compare
+
+    Returns
+    -------
+    errors : dict, model -> {"temperature": error, "yield": error}, without yield for the cross section
+    """
+    from lebedigital.simulation.demonstrator_beam import demonstrator_beam
+
+    full = demonstrator_beam(time, dt, parameters)
+    errors = {}
+    for model in models:
+        reduced = demonstrator_beam(time, dt, parameters, model=model)
+        errors[model] = {}
+        for column in reduced.columns.drop("time"):
+            reference = full[column].values.quantity.magnitude
+            errors[model][column] = float(
+                np.max(np.abs(reduced[column].values.quantity.magnitude - reference) / np.abs(reference))
+            )
+    return errors
@@ -3,8 +3,26 @@ import numpy as np
 import pandas as pd
 import pint_pandas
 
+from lebedigital.simulation.lumped_hydration import degree_of_hydration, material_evolution
 from lebedigital.unit_registry import ureg
 
+# units of the parameters of the lumped hydration model
+LUMPED_PARAMETER_UNITS = {
+    "B1": "1/s",
+    "B2": "",
+    "eta": "",
+    "alpha_max": "",
+    "E_act": "J/mol",
+    "T_ref": "degree_Celsius",
+    "E": "N/m^2",
+    "alpha_t": "",
+    "alpha_0": "",
+    "a_E": "",
+    "fc": "N/m^2",
+    "a_fc": "",
+    "alpha_tx": "",
+}
+
 
 def setup_simple_cube(time, dt, parameters, pv_output=False):
     # check/convert units...
@@ -74,7 +92,42 @@ def setup_simple_cube(time, dt, parameters, pv_output=False):
     return problem
 
 
-def get_doh_at_28day(p, ambient_temperature=ureg.Quantity(20, ureg.degC)):
+def _lumped_parameters(p) -> dict:
+    """
+    Converts the pint parameters required by the lumped hydration model to floats, without modifying p.
+    """
+    return {
+        key: p[key].to(unit).magnitude
+        for key, unit in LUMPED_PARAMETER_UNITS.items()
+        if key in p and p[key] is not None
+    }
+
+
+def get_doh_at_28day(p, ambient_temperature=ureg.Quantity(20, ureg.degC), fast=False):
+    """
+    Computes the degree of hydration after 28 days at constant ambient temperature.
+
+    Parameters
+    ----------
+    p : parameters with pint units (hydration parameters B1, B2, eta, alpha_max, E_act, T_ref, ...)
+    ambient_temperature : pint temperature
+    fast : if True, the hydration law is integrated for a single material point (`lumped_hydration`) instead of
+        simulating a small FE cube with hourly time steps. The results agree within the time discretization error
+        of the FE simulation.
+
+    Returns
+    -------
+    doh : float, degree of hydration after 28 days
+    """
+    if fast:
+        lumped_parameters = _lumped_parameters(p)
+        doh = degree_of_hydration(
+            (28 * ureg("days")).to("s").magnitude,
+            ambient_temperature.to("degree_Celsius").magnitude,
+            *[lumped_parameters[key] for key in ("B1", "B2", "eta", "alpha_max", "E_act", "T_ref")],
+        )
+        return float(doh)
+
     Q_ = ureg.Quantity
     parameters = fenics_concrete.Parameters()
     parameters = parameters + p
@@ -118,7 +171,36 @@ def get_doh_at_28day(p, ambient_temperature=ureg.Quantity(20, ureg.degC)):
     return fem_problem.sensors["DOHSensor"].data[-1]  # doh_at_28 days
 
 
-def get_E_and_fc_over_time(p, time_list, time_step=1 * ureg("hour"), ambient_temperature=ureg.Quantity(20, ureg.degC)):
+def get_E_and_fc_over_time(
+    p, time_list, time_step=1 * ureg("hour"), ambient_temperature=ureg.Quantity(20, ureg.degC), fast=False
+):
+    """
+    Computes Young's modulus and the compressive strength over time at constant ambient temperature.
+
+    Parameters
+    ----------
+    p : parameters with pint units (hydration parameters and E, alpha_t, alpha_0, a_E, fc, a_fc)
+    time_list : list of pint times, the results are given at least for these times
+    time_step : pint time, time step of the FE simulation
+    ambient_temperature : pint temperature
+    fast : if True, the evolution is computed for a single material point (`lumped_hydration`) directly at the
+        requested times instead of simulating a small FE cube.
+
+    Returns
+    -------
+    df_units : pandas-pint DataFrame with the columns time, E and fc
+    """
+    if fast:
+        time = np.sort([t.to("s").magnitude for t in time_list])
+        results = material_evolution(time, ambient_temperature.to("degree_Celsius").magnitude, _lumped_parameters(p))
+        return pd.DataFrame(
+            {
+                "time": pd.Series(time, dtype="pint[s]"),
+                "E": pd.Series(results["E"], dtype="pint[N/m^2]"),
+                "fc": pd.Series(results["fc"], dtype="pint[N/m^2]"),
+            }
+        )
+
     Q_ = ureg.Quantity
     parameters = fenics_concrete.Parameters()
 
@@ -3,8 +3,14 @@ import fenics_concrete
 import matplotlib.pyplot as plt
 import numpy as np
 from lebedigital.unit_registry import ureg
+from lebedigital.unit_schema import UnitSchema
 import pint
 
+# units the simulation expects
+BENDING_PARAMETER_UNITS = UnitSchema(
+    {"height": "mm", "length": "mm", "width": "mm", "displacement": "mm", "E": "N/mm^2", "nu": ""}
+)
+
 def three_point_bending_beam(parameters, pv_output=False):
     """Example of a linear elastic three point bending test
 
@@ -48,19 +54,8 @@ def three_point_bending_beam(parameters, pv_output=False):
     # will overwrite the default values if given in input
     parameters = p + parameters
 
-    # convert to correct units/check for required inputs
-    parameters["height"].ito('mm')
-    parameters["length"].ito('mm')
-    parameters["width"].ito('mm')
-    parameters["displacement"].ito('mm')
-    parameters["E"].ito('N/mm^2')
-    parameters["nu"].ito('')
-
-    # ... now remove all units, otherwise problems with simulation :(, will change in the future...
-    for key in parameters.keys():
-        # check if parameter has a unit, then remove it
-        if isinstance(parameters[key], type(1 * ureg(''))):
-            parameters[key] = parameters[key].magnitude
+    # convert to correct units/check for required inputs, all units are removed
+    parameters = BENDING_PARAMETER_UNITS.to_magnitudes(parameters)
 
     # setting up the problem
     experiment = fenics_concrete.ConcreteBeamExperiment(parameters)
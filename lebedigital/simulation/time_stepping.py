@@ -0,0 +1,492 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pint_pandas
+
+from lebedigital.simulation.checkpoint import (
+    checkpoint_time,
+    read_checkpoint,
+    restore_state,
+    save_state,
+    write_checkpoint,
+)
+from lebedigital.simulation.parallel import is_root, reduce_max_sensors
+from lebedigital.unit_schema import magnitude
+
+# tolerance in seconds when comparing time values
+TIME_TOLERANCE = 1e-6
+
+
+class AdaptiveTimeStep:
+    """Controller for the time step of the thermo-mechanical hardening simulations
+
+    The hydration heat is released fast in the first hours and slowly afterwards. The controller adapts the time step
+    after each step, such that the change of the maximum temperature (and of the degree of hydration, if a DOHSensor is
+    attached to the problem) per step stays close to the given targets. A step with a change larger than
+    reject_factor times the target is rejected and repeated with a smaller time step (unless dt_min is reached).
+
+    Parameters
+    ----------
+    dt_min : minimal time step in s
+    dt_max : maximal time step in s
+    max_temperature_change : targeted change of the maximum temperature per step in K
+    max_doh_change : targeted change of the degree of hydration per step
+    safety : safety factor applied to the proposed time step
+    max_growth : maximal factor the time step can grow from one step to the next
+    max_shrink : minimal factor the time step can shrink from one step to the next
+    reject_factor : a step is rejected if a change exceeds the target by this factor
+    """
+
+    def __init__(
+        self,
+        dt_min: float,
+        dt_max: float,
+        max_temperature_change: float = 1.0,
+        max_doh_change: float = 0.01,
+        safety: float = 0.9,
+        max_growth: float = 2.0,
+        max_shrink: float = 0.5,
+        reject_factor: float = 2.0,
+    ):
+        assert 0 < dt_min <= dt_max, "0 < dt_min <= dt_max required"
+        assert reject_factor > 1, "reject_factor > 1 required"
+        self.dt_min = dt_min
+        self.dt_max = dt_max
+        self.targets = {"temperature": max_temperature_change, "doh": max_doh_change}
+        self.safety = safety
+        self.max_growth = max_growth
+        self.max_shrink = max_shrink
+        self.reject_factor = reject_factor
+
+    def next_dt(self, dt: float, changes: dict) -> float:
+        """
+        Proposes the next time step based on the changes of the last step.
+
+        Parameters
+        ----------
+        dt : the last time step in s
+        changes : dict with the absolute changes of the last step, keys "temperature" and/or "doh"
+
+        Returns
+        -------
+        dt : the next time step in s
+        """
+        ratios = [self.targets[key] / change for key, change in changes.items() if key in self.targets and change > 0]
+        if ratios:
+            factor = np.clip(self.safety * min(ratios), self.max_shrink, self.max_growth)
+        else:
+            factor = self.max_growth
+        return float(np.clip(dt * factor, self.dt_min, self.dt_max))
+
+    def reject(self, dt: float, changes: dict) -> bool:
+        """
+        Returns True if the last step of size dt has to be repeated with a smaller time step.
+        """
+        too_large = any(change > self.reject_factor * self.targets[key] for key, change in changes.items())
+        return too_large and dt > self.dt_min * (1 + TIME_TOLERANCE)
+
+
+def step_changes(problem) -> dict:
+    """
+    Returns the absolute changes of the maximum temperature and the degree of hydration in the last time step,
+    based on the MaxTemperatureSensor and DOHSensor of the problem (if attached).
+    """
+    changes = {}
+    for key, sensor_name in [("temperature", "MaxTemperatureSensor"), ("doh", "DOHSensor")]:
+        if sensor_name in problem.sensors and len(problem.sensors[sensor_name].data) > 1:
+            data = problem.sensors[sensor_name].data
+            changes[key] = abs(data[-1] - data[-2])
+    return changes
+
+
+class CsvSensorSink:
+    """Streams the sensor data of each time step to a csv file
+
+    The file has the same format as the csv files of the workflow (`write_pint_df`): a header line with the column
+    names (time, temperature, yield), a line with the units and one line per time step. It can be read while the
+    simulation is running, e.g. with `read_sensor_csv`.
+
+    Parameters
+    ----------
+    path : the csv file
+    append : if True, an existing file is continued (e.g. after a restart), otherwise it is overwritten
+    restart_time : float, optional
+        Time in s of the checkpoint a simulation is restarted from. When appending, the rows after this time (written
+        before the interruption, after the last checkpoint) are removed, as they are computed again.
+    max_history : int, optional
+        If given, only the last max_history values are kept in the sensors of the problem (enough for the adaptive
+        time stepping and the stop criteria), the memory does not grow with the number of steps. The full history
+        is only available in the file then.
+    """
+
+    columns = {
+        "time": ("MaxYieldSensor", "time", "second"),
+        "temperature": ("MaxTemperatureSensor", "data", "degree_Celsius"),
+        "yield": ("MaxYieldSensor", "data", "dimensionless"),
+    }
+
+    def __init__(self, path, append: bool = False, max_history: int = None, restart_time: float = None):
+        self.path = path
+        self.max_history = max_history
+        # in parallel runs the file is only written by rank 0, all ranks hold the same (reduced) sensor data
+        self.write = is_root()
+        if not self.write:
+            return
+        if not append or not os.path.isfile(path) or os.path.getsize(path) == 0:
+            with open(path, "w") as f:
+                f.write(",".join(self.columns) + "\n")
+                f.write(",".join(unit for _, _, unit in self.columns.values()) + "\n")
+        elif restart_time is not None:
+            self._remove_rows_after(restart_time)
+
+    def _remove_rows_after(self, restart_time: float):
+        with open(self.path) as f:
+            lines = f.readlines()
+        kept = lines[:2] + [line for line in lines[2:] if float(line.split(",")[0]) <= restart_time + TIME_TOLERANCE]
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.writelines(kept)
+        os.replace(tmp_path, self.path)
+
+    def __call__(self, problem, t: float):
+        if self.write:
+            row = [getattr(problem.sensors[sensor], attribute)[-1] for sensor, attribute, _ in self.columns.values()]
+            with open(self.path, "a") as f:
+                f.write(",".join(repr(float(value)) for value in row) + "\n")
+
+        if self.max_history is not None:
+            for sensor in problem.sensors.values():
+                del sensor.data[: -self.max_history]
+                del sensor.time[: -self.max_history]
+
+
+def _at_times(time: np.ndarray, output_times) -> np.ndarray:
+    """
+    Returns the mask of the entries of time that are one of the output times.
+    """
+    return np.any(np.abs(time[:, None] - np.asarray(output_times, dtype=float)[None, :]) < TIME_TOLERANCE, axis=1)
+
+
+def read_sensor_csv(path, output_times=None) -> pd.DataFrame:
+    """
+    Reads a csv file written by `CsvSensorSink` as pandas-pint DataFrame.
+
+    Parameters
+    ----------
+    path : the csv file
+    output_times : list of float, optional
+        If given, only the rows at these times (in s) are returned, as in `sensor_dataframe`.
+    """
+    df = pd.read_csv(path, header=[0, 1])
+    if output_times is not None:
+        df = df[_at_times(df.iloc[:, 0].to_numpy(dtype=float), output_times)].reset_index(drop=True)
+    return df.pint.quantify(level=-1)
+
+
+def yield_negative_for(n_steps: int = 3):
+    """
+    Stop criterion, fulfilled once the maximum yield function value was negative for the last n_steps steps, i.e.
+    the time of demolding is passed.
+    """
+
+    def criterion(problem) -> bool:
+        data = problem.sensors["MaxYieldSensor"].data
+        return len(data) >= n_steps and all(value < 0 for value in data[-n_steps:])
+
+    return criterion
+
+
+def temperature_past_peak(n_steps: int = 3):
+    """
+    Stop criterion, fulfilled once the maximum temperature decreased in each of the last n_steps steps, i.e. the
+    maximum temperature is passed.
+    """
+
+    def criterion(problem) -> bool:
+        data = problem.sensors["MaxTemperatureSensor"].data
+        return len(data) > n_steps and all(np.diff(data[-n_steps - 1 :]) < 0)
+
+    return criterion
+
+
+def all_of(*criteria):
+    """
+    Combines stop criteria, fulfilled once all criteria are fulfilled.
+    """
+
+    def criterion(problem) -> bool:
+        return all(c(problem) for c in criteria)
+
+    return criterion
+
+
+def kpis_decided(n_steps: int = 3):
+    """
+    Stop criterion for the optimization workflow, fulfilled once the time of demolding and the maximum temperature
+    (the KPIs computed by `kpi_from_fem`) are determined: the yield is negative for the last n_steps steps and after
+    the yield crossing the temperature fell in n_steps steps in a row from a peak, i.e. after it had risen before. The
+    cooling of a cast warmer than its surroundings before the hydration heat is released is no peak.
+
+    The criterion processes each new sensor value once, so it works with a truncated sensor history (see
+    `CsvSensorSink`) and after a restart, a new criterion is needed for each simulation.
+    """
+    state = {"time": -np.inf, "temperature": None, "risen": False, "negative": 0, "falling": 0}
+
+    def criterion(problem) -> bool:
+        temperature = problem.sensors["MaxTemperatureSensor"]
+        yield_data = problem.sensors["MaxYieldSensor"].data
+        for t, value, yield_value in zip(temperature.time, temperature.data, yield_data):
+            if t <= state["time"] + TIME_TOLERANCE:
+                continue
+            previous = state["temperature"]
+            state["negative"] = state["negative"] + 1 if yield_value < 0 else 0
+            state["risen"] = state["risen"] or (previous is not None and value > previous)
+            fell = previous is not None and value < previous and state["risen"]
+            state["falling"] = state["falling"] + 1 if fell and state["negative"] > 0 else 0
+            state["time"], state["temperature"] = t, value
+        return state["negative"] >= n_steps and state["falling"] >= n_steps
+
+    return criterion
+
+
+def run_time_loop(
+    problem,
+    time: float,
+    dt: float,
+    pv_output: bool = False,
+    time_step_control=None,
+    output_times=None,
+    stop_criterion=None,
+    checkpoint_path=None,
+    checkpoint_interval: int = 10,
+    restart_from=None,
+    sensor_sinks=None,
+):
+    """
+    Solves the problem from t = dt to t = time, or until the stop criterion is fulfilled.
+
+    Parameters
+    ----------
+    problem : fenics_concrete problem with sensors
+    time : final time in s
+    dt : (initial) time step in s
+    pv_output : if True, the fields are written for paraview after each step
+    time_step_control : AdaptiveTimeStep, optional
+        If given, the time step is adapted after each step and steps with too large changes are repeated with a
+        smaller time step, otherwise the constant time step dt is used.
+    output_times : list of float, optional
+        Times in s which are hit exactly, e.g. the times the sensor output is needed. With a constant time step,
+        additional steps are inserted at these times, the other steps stay at multiples of dt.
+    stop_criterion : callable, optional
+        Called with the problem after each step, the simulation ends early if it returns True (see `kpis_decided`).
+    checkpoint_path : optional
+        Directory the FE fields and sensor histories are written to every `checkpoint_interval` steps and at the end
+        (see `checkpoint.write_checkpoint`), the previous checkpoint is replaced.
+    checkpoint_interval : number of steps between two checkpoints
+    restart_from : optional
+        Checkpoint directory to restart the simulation from, the problem has to be set up as the checkpointed one.
+    sensor_sinks : list of callables, optional
+        Called with the problem and the time after each (accepted) step on all MPI ranks, e.g. a CsvSensorSink or a
+        callback to watch the progress.
+    """
+    output_times = np.sort(np.asarray([] if output_times is None else output_times, dtype=float))
+
+    # time of the last solved step
+    t_solved = 0.0
+
+    if restart_from is not None:
+        t_solved, dt = read_checkpoint(problem, restart_from)
+        print(f"Restart from checkpoint at t = {t_solved} s")
+
+    step = 0
+    n_rejected = 0
+    dt_step = None  # length of the current step, shorter than dt to hit an output time or the final time
+
+    print("Run simulation!")
+    while True:
+        if time_step_control is None:
+            t = dt * (np.floor(t_solved / dt + TIME_TOLERANCE) + 1)  # next multiple of dt
+        else:
+            t = min(t_solved + dt, time)
+        # do not step over the requested output times
+        t = min([t] + [t_out for t_out in output_times if t_out > t_solved + TIME_TOLERANCE])
+        if t > time + TIME_TOLERANCE:
+            break
+
+        # set time step, for the time integration scheme
+        if dt_step is None or abs(t - t_solved - dt_step) > TIME_TOLERANCE:
+            dt_step = t - t_solved
+            problem.set_timestep(dt_step)
+
+        state = save_state(problem) if time_step_control is not None else None
+
+        # solve temp-hydration-mechanics
+        problem.solve(t=t)  # solving this
+
+        # in parallel runs the max sensors only see the local part of the mesh
+        reduce_max_sensors(problem)
+
+        if time_step_control is not None:
+            changes = step_changes(problem)
+            if time_step_control.reject(dt_step, changes):
+                # repeat the step with a smaller time step
+                restore_state(problem, state)
+                dt = time_step_control.next_dt(dt_step, changes)
+                n_rejected += 1
+                continue
+
+        for sink in sensor_sinks or []:
+            sink(problem, t)
+
+        if pv_output:
+            problem.pv_plot(t=t)
+
+        step += 1
+        t_solved = t
+        if checkpoint_path is not None and step % checkpoint_interval == 0:
+            write_checkpoint(problem, checkpoint_path, t_solved, dt)
+
+        if stop_criterion is not None and stop_criterion(problem):
+            print(f"Stop criterion fulfilled at t = {t} s")
+            break
+
+        # prepare next timestep
+        if time_step_control is not None:
+            if t >= time - TIME_TOLERANCE:
+                break
+            dt = time_step_control.next_dt(dt_step, changes)
+
+    # checkpoint of the final state, if not just written
+    if checkpoint_path is not None and step % checkpoint_interval != 0:
+        write_checkpoint(problem, checkpoint_path, t_solved, dt)
+
+    if n_rejected:
+        print(f"{n_rejected} time steps rejected and repeated")
+    print("Done!")
+
+
+def run_hardening_simulation(
+    problem,
+    time: float,
+    dt: float,
+    pv_output=False,
+    adaptive=False,
+    dt_min=None,
+    dt_max=None,
+    output_times=None,
+    stop_criterion=None,
+    checkpoint_path=None,
+    checkpoint_interval=10,
+    restart_from=None,
+    sensor_file=None,
+    keep_sensor_history=True,
+    sensor_callback=None,
+) -> pd.DataFrame:
+    """
+    Runs `run_time_loop` for a problem with MaxYieldSensor and MaxTemperatureSensor and returns the sensor data, the
+    shared part of the hardening simulations (e.g. `demonstrator_beam` and `column_simulation`).
+
+    Parameters
+    ----------
+    problem : fenics_concrete problem with MaxYieldSensor and MaxTemperatureSensor
+    time : final time in s
+    dt : time step in s (initial time step for adaptive time stepping)
+    pv_output : if True, the fields are written for paraview
+    adaptive : if True, the time step is adapted to the change of temperature/degree of hydration per step, see
+        `AdaptiveTimeStep`
+    dt_min : pint time quantity, minimal time step for adaptive time stepping, defaults to dt/10
+    dt_max : pint time quantity, maximal time step for adaptive time stepping, defaults to 10*dt
+    output_times : list of pint time quantities, optional
+        These times are hit exactly and only the sensor data at these times is returned.
+    stop_criterion : callable, optional
+        Called with the problem after each step, the simulation ends early once it returns True, e.g.
+        `kpis_decided()` to stop as soon as the time of demolding and the maximum temperature are known.
+    checkpoint_path : optional, directory the FE fields and sensor histories are checkpointed to
+    checkpoint_interval : number of time steps between two checkpoints
+    restart_from : optional, checkpoint directory to resume the simulation from (with the same parameters)
+    sensor_file : optional, csv file the sensor data is streamed to after each step (see `CsvSensorSink`)
+    keep_sensor_history : if False (requires sensor_file), only the last sensor values are kept in memory and the
+        returned DataFrame is read from sensor_file
+    sensor_callback : optional, callable called with the problem and the time after each step
+
+    Returns
+    -------
+    pint_df : pd.DataFrame with the columns time, temperature and yield
+    """
+    time_step_control = None
+    if adaptive:
+        dt_min = dt / 10 if dt_min is None else magnitude(dt_min, "s")
+        dt_max = dt * 10 if dt_max is None else magnitude(dt_max, "s")
+        time_step_control = AdaptiveTimeStep(dt_min=dt_min, dt_max=dt_max)
+    if output_times is not None:
+        output_times = [magnitude(t_out, "s") for t_out in output_times]
+
+    sensor_sinks = []
+    if sensor_file is not None:
+        max_history = None if keep_sensor_history else 10
+        restart_time = None if restart_from is None else checkpoint_time(restart_from)
+        sensor_sinks.append(
+            CsvSensorSink(
+                sensor_file, append=restart_from is not None, max_history=max_history, restart_time=restart_time
+            )
+        )
+    else:
+        assert keep_sensor_history, "keep_sensor_history=False requires a sensor_file"
+    if sensor_callback is not None:
+        sensor_sinks.append(sensor_callback)
+
+    run_time_loop(
+        problem,
+        time,
+        dt,
+        pv_output=pv_output,
+        time_step_control=time_step_control,
+        output_times=output_times,
+        stop_criterion=stop_criterion,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=checkpoint_interval,
+        restart_from=restart_from,
+        sensor_sinks=sensor_sinks,
+    )
+
+    if keep_sensor_history:
+        pint_df = sensor_dataframe(problem, output_times=output_times)
+    else:
+        pint_df = read_sensor_csv(sensor_file, output_times=output_times)
+
+    return pint_df
+
+
+def sensor_dataframe(problem, output_times=None) -> pd.DataFrame:
+    """
+    Builds the pandas-pint DataFrame with the time, the maximum temperature and the maximum yield function value.
+
+    Parameters
+    ----------
+    problem : fenics_concrete problem with MaxYieldSensor and MaxTemperatureSensor
+    output_times : list of float, optional
+        If given, only the rows at these times (in s) are returned.
+
+    Returns
+    -------
+    pint_df : pd.DataFrame with the columns time, temperature and yield
+    """
+    time = np.asarray(problem.sensors["MaxYieldSensor"].time, dtype=float)
+    temperature = np.asarray(problem.sensors["MaxTemperatureSensor"].data, dtype=float)
+    yield_data = np.asarray(problem.sensors["MaxYieldSensor"].data, dtype=float)
+
+    if output_times is not None:
+        selected = _at_times(time, output_times)
+        time, temperature, yield_data = time[selected], temperature[selected], yield_data[selected]
+
+    # Building Pandas-Pint DataFrame
+    pint_df = pd.DataFrame(
+        {
+            "time": pd.Series(time, dtype="pint[s]"),
+            "temperature": pd.Series(temperature, dtype="pint[degree_Celsius]"),
+            "yield": pd.Series(yield_data, dtype="pint[]"),
+        }
+    )
+
+    return pint_df
@@ -0,0 +1,79 @@
+from functools import lru_cache
+
+from lebedigital.unit_registry import ureg
+
+
+@lru_cache(maxsize=None)
+def conversion_factors(units, target_unit: str) -> tuple:
+    """
+    Returns the factor and offset of the (affine) conversion from `units` to `target_unit`, such that
+    target_value = factor * value + offset. Offsets are only non zero for temperatures.
+
+    The factors are computed with pint once per pair of units and cached. Raises pint's DimensionalityError for
+    incompatible units, as `.ito()` would.
+    """
+    offset = ureg.Quantity(0.0, units).to(target_unit).magnitude
+    factor = ureg.Quantity(1.0, units).to(target_unit).magnitude - offset
+    return factor, offset
+
+
+def magnitude(value, target_unit: str):
+    """
+    Returns the magnitude of a pint quantity in the target unit, without modifying the quantity.
+    """
+    factor, offset = conversion_factors(value.units, target_unit)
+    return value.magnitude * factor + offset
+
+
+class UnitSchema:
+    """Declarative conversion of a parameter dictionary with pint quantities to plain magnitudes
+
+    The schema maps parameter names to the units the simulation expects. `to_magnitudes` converts all listed
+    parameters to these units and strips the units of all other quantities, the conversion factors are cached per
+    pair of units, so repeated calls (e.g. in parameter sweeps) only cost a multiplication per parameter.
+
+    Parameters
+    ----------
+    units : dict
+        parameter name -> target unit, e.g. {"density": "kg/m^3", "T_0": "degree_Celsius", "nu": ""}
+    """
+
+    def __init__(self, units: dict):
+        self.units = dict(units)
+
+    def __add__(self, other):
+        """
+        Returns a new schema with the units of both schemas, the ones of `other` take precedence.
+        """
+        units = other.units if isinstance(other, UnitSchema) else other
+        return UnitSchema({**self.units, **units})
+
+    def to_magnitudes(self, parameters, required: bool = True):
+        """
+        Converts the parameters to magnitudes in the units of the schema.
+
+        The input is not modified, a shallow copy of the same type (e.g. fenics_concrete.Parameters) is returned.
+
+        Parameters
+        ----------
+        parameters : dict with pint quantities (and other values, which are passed through)
+        required : if True, all parameters of the schema have to be given (KeyError otherwise)
+
+        Returns
+        -------
+        magnitudes : copy of parameters with plain values
+        """
+        if required:
+            missing = [name for name in self.units if name not in parameters]
+            if missing:
+                raise KeyError(f"Missing parameters: {', '.join(missing)}")
+
+        # shallow copy, keeping the dict type
+        magnitudes = type(parameters)(parameters)
+        for name, value in parameters.items():
+            if isinstance(value, ureg.Quantity):
+                if name in self.units:
+                    magnitudes[name] = magnitude(value, self.units[name])
+                else:
+                    magnitudes[name] = value.magnitude
+        return magnitudes
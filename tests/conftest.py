@@ -6,6 +6,18 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "login: mark test to only run when provided with login"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: mark timing test to only run with --benchmark"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 """
@@ -18,6 +30,7 @@ def pytest_addoption(parser):
     parser.addoption("--login", action="store", default="no_cl_login")
     parser.addoption("--password", action="store", default="no_cl_password")
     parser.addoption("--url", action="store", default="https://localhost:8443/openbis/")
+    parser.addoption("--benchmark", action="store_true", default=False)
 
 
 # @pytest.fixture(scope='session', autouse=True)
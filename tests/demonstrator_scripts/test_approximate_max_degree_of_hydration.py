@@ -20,3 +20,9 @@ def test_approximate_max_degree_of_hydration():
     water_cement_ratio = 1.0 * ureg('')
     max_degree_of_hydration = approximate_max_degree_of_hydration(water_cement_ratio)
     assert max_degree_of_hydration == pytest.approx(0.863484087)
+
+
+def test_approximate_max_degree_of_hydration_array():
+    water_cement_ratio = [0.0, 0.2, 0.4, 1.0] * ureg('')
+    max_degree_of_hydration = approximate_max_degree_of_hydration(water_cement_ratio)
+    assert max_degree_of_hydration.magnitude == pytest.approx([0.0, 0.523350254, 0.6942760942760942, 0.863484087])
@@ -1,5 +1,6 @@
 from lebedigital.unit_registry import ureg
-from lebedigital.demonstrator_scripts.approximate_tensile_strength import approximate_tensile_strength
+from lebedigital.demonstrator_scripts.approximate_tensile_strength import (approximate_tensile_strength,
+                                                                           approximate_tensile_strength_raw)
 from pint.testsuite.helpers import assert_quantity_almost_equal as assert_approx
 import pytest
 
@@ -12,3 +13,17 @@ def test_approximate_tensile_strength():
     compressive_strength = 60 * ureg('MPa')
     tensile_strength = approximate_tensile_strength(compressive_strength)
     assert tensile_strength.magnitude == pytest.approx(4.354742315434558)
+
+
+def test_approximate_tensile_strength_raw():
+    # float version in MPa
+    assert approximate_tensile_strength_raw(30.0) == pytest.approx(2.896468153816889)
+    assert approximate_tensile_strength_raw(60.0) == pytest.approx(4.354742315434558)
+
+
+def test_approximate_tensile_strength_array():
+    # both branches in one array, same values as the scalar calls
+    compressive_strength = [30, 50, 60] * ureg('MPa')
+    tensile_strength = approximate_tensile_strength(compressive_strength)
+    expected = [approximate_tensile_strength(value).magnitude for value in compressive_strength]
+    assert tensile_strength.magnitude == pytest.approx(expected)
@@ -1,3 +1,6 @@
+import time
+
+import numpy as np
 import pytest
 
 from lebedigital.demonstrator_scripts import beam_design
@@ -82,3 +85,115 @@ def test_beam_design_cover():
     assert results_1["n_steel_bars"] == 7 * ureg("")
     assert results_1["diameter"] == 8 * ureg("mm")
     assert results_1["crosssection"].magnitude == pytest.approx(351.85837720205683)
+
+
+def test_check_beam_design_vectorized():
+    # scalar input gives the same results as check_beam_design
+    width, height = beam_design.section_dimension_rule_of_thumb(span=6.75 * ureg("m"))
+    parameters = {
+        "span": 6750 * ureg("mm"),
+        "width": width,
+        "height": height,
+        "point_load": 36e3 * ureg("N"),
+        "distributed_load": 0 * ureg("N/mm"),
+        "compr_str_concrete": 20 * ureg("N/mm^2"),
+        "yield_str_steel": 500 * ureg("N/mm^2"),
+        "steel_dia_bu": 12 * ureg("mm"),
+        "cover_min": 2.5 * ureg("cm"),
+    }
+    results = beam_design.check_beam_design_vectorized(**parameters)
+    assert results["n_steel_bars"] == 5 * ureg("")
+    assert results["diameter"] == 10 * ureg("mm")
+    assert results["crosssection"].magnitude == pytest.approx(392.699082)
+
+    # arrays of heights and strengths, including designs without fitting reinforcement
+    heights = np.array([200.0, 300.0, 455.0, 600.0]) * ureg("mm")
+    strengths = np.array([5.0, 20.0, 60.0])[:, np.newaxis] * ureg("N/mm^2")
+    results = beam_design.check_beam_design_vectorized(
+        **{**parameters, "height": heights, "compr_str_concrete": strengths, "width": 150 * ureg("mm")}
+    )
+
+    for i, fc in enumerate(strengths):
+        for j, h in enumerate(heights):
+            expected = beam_design.check_beam_design(
+                **{**parameters, "height": h, "compr_str_concrete": fc[0], "width": 150 * ureg("mm")}
+            )
+            for key, value in expected.items():
+                assert results[key][i, j].to(value.units).magnitude == pytest.approx(value.magnitude)
+
+
+def test_max_number_of_bars():
+    # same as increasing the number of bars until the spacing check fails, including the bounds
+    for width in np.linspace(100.0, 400.0, 13):
+        for diameter in [8.0, 20.0, 25.0]:
+            n_steel = 2
+            while beam_design.beam_check_spacing(
+                diameter * ureg("mm"), n_steel * ureg(""), 10 * ureg("mm"), width * ureg("mm"), 30 * ureg("mm")
+            ):
+                n_steel += 1
+            n_max = beam_design.max_number_of_bars(diameter, 10.0, width, 30.0)
+            if n_steel == 2:
+                assert n_max < 2
+            else:
+                assert n_max == n_steel - 1
+
+
+def incremental_max_reinforcement(width):
+    # maximum reinforcement area by increasing the number of bars until the spacing check fails
+    diameters = beam_design.ACCEPTABLE_REINFORCEMENT_DIAMETERS * ureg("mm")
+    for diameter in reversed(diameters):
+        cover = max(25 * ureg("mm"), diameter)
+        n_steel = 2 * ureg("")
+        max_area = 0.0 * ureg("mm^2")
+        while beam_design.beam_check_spacing(diameter, n_steel, 10 * ureg("mm"), width * ureg("mm"), cover):
+            max_area = n_steel * np.pi * (diameter / 2) ** 2
+            n_steel += 1 * ureg("")
+        if max_area > 0:
+            break
+    return max_area.to("mm^2").magnitude
+
+
+def test_max_reinforcement():
+    # closed form, same as the incremental search
+    widths = np.linspace(150.0, 800.0, 8)
+    diameters = beam_design.ACCEPTABLE_REINFORCEMENT_DIAMETERS
+    max_area = beam_design.get_max_reinforcement_raw(diameters, widths, 25.0, 10.0)
+    assert max_area == pytest.approx([incremental_max_reinforcement(width) for width in widths])
+
+
+@pytest.mark.benchmark
+def test_max_reinforcement_benchmark():
+    # micro benchmark of the closed form against the incremental search, for 200 beams
+    widths = np.linspace(150.0, 800.0, 200)
+
+    start = time.perf_counter()
+    expected = [incremental_max_reinforcement(width) for width in widths]
+    time_incremental = time.perf_counter() - start
+
+    start = time.perf_counter()
+    raw_diameters = beam_design.ACCEPTABLE_REINFORCEMENT_DIAMETERS
+    max_area = beam_design.get_max_reinforcement_raw(raw_diameters, widths, 25.0, 10.0)
+    time_closed_form = time.perf_counter() - start
+
+    print(f"incremental: {time_incremental:.4f} s, closed form: {time_closed_form:.6f} s")
+    assert max_area == pytest.approx(expected)
+    assert time_closed_form < time_incremental
+
+
+def test_beam_required_steel_raw():
+    # float version in mm and N, same values as the pint version
+    required_steel, fc_constraint = beam_design.beam_required_steel(
+        200 * ureg("mm"),
+        450 * ureg("mm"),
+        60 * ureg("kN*m"),
+        20 * ureg("N/mm^2"),
+        500 * ureg("N/mm^2"),
+        10 * ureg("mm"),
+        12 * ureg("mm"),
+        25 * ureg("mm"),
+    )
+    required_steel_raw, fc_constraint_raw = beam_design.beam_required_steel_raw(
+        200.0, 450.0, 60e6, 20.0, 500.0, 10.0, 12.0, 25.0
+    )
+    assert required_steel_raw == pytest.approx(required_steel.magnitude)
+    assert fc_constraint_raw == pytest.approx(fc_constraint.magnitude)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from lebedigital.demonstrator_scripts.computation_GWP_catalogue import (
+    computation_GWP_catalogue,
+    gwp_mixes,
+    rank_catalogue,
+)
+from lebedigital.demonstrator_scripts.computation_GWP_mix import computation_GWP_mix
+from lebedigital.demonstrator_scripts.computation_GWP_per_part import computation_GWP_per_part
+from lebedigital.unit_registry import ureg
+
+
+def test_computation_GWP_catalogue():
+    # the values for GWP are chose a priory and are just for testing purposes
+    names = ["cement", "water", "aggregates"]
+    contents = np.array([[300.0, 150.0, 1800.0], [400.0, 180.0, 1700.0]]) * ureg("kg/m^3")
+    gwp_factors = np.array([0.8, 0.0, 0.005]) * ureg("kg_CO2_eq/kg")
+    gwp_steel = 10000 * ureg("kg_CO2_eq/m^3")
+
+    width = np.array([0.2, 0.3, 0.25]) * ureg("m")
+    height = np.array([500.0, 400.0, 600.0]) * ureg("mm")
+    length = 10 * ureg("m")
+    n_steel = np.array([2, 4, 3]) * ureg("")
+    diameter_steel = np.array([10.0, 12.0, 16.0]) * ureg("mm")
+
+    gwp = computation_GWP_catalogue(contents, gwp_factors, gwp_steel, width, height, length, n_steel, diameter_steel)
+
+    assert gwp.shape == (2, 3)
+    assert gwp.units == ureg("kg_CO2_eq")
+
+    # same as the single mix and part computations
+    for i in range(2):
+        constituents = {name: {"content": contents[i, j], "GWP": gwp_factors[j]} for j, name in enumerate(names)}
+        gwp_mix = computation_GWP_mix(constituents)
+        assert gwp_mixes(contents[i].magnitude, gwp_factors.magnitude) == pytest.approx(gwp_mix.magnitude)
+        for j in range(3):
+            beam_gwp = computation_GWP_per_part(
+                gwp_mix, gwp_steel, width[j], height[j], length, n_steel[j], diameter_steel[j]
+            )
+            assert gwp[i, j].magnitude == pytest.approx(beam_gwp.magnitude)
+
+    # ranking by GWP
+    mix_index, beam_index = rank_catalogue(gwp)
+    ranked = gwp.magnitude[mix_index, beam_index]
+    assert np.all(np.diff(ranked) >= 0)
+    assert ranked[0] == gwp.magnitude.min()
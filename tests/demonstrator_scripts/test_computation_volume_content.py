@@ -1,6 +1,16 @@
+import numpy as np
+import pandas as pd
+import pint_pandas
+import pytest
 from pint.testsuite.helpers import assert_quantity_almost_equal as assert_approx
 
-from lebedigital.demonstrator_scripts.computation_volume_content import computation_ratios, computation_volume_content
+from lebedigital.demonstrator_scripts.computation_volume_content import (
+    MIX_TABLE_UNITS,
+    computation_ratios,
+    computation_ratios_batch,
+    computation_volume_content,
+    computation_volume_content_batch,
+)
 from lebedigital.unit_registry import ureg
 
 
@@ -180,3 +190,52 @@ def test_computation_ratio_based_on_computation_volume_content():
     assert_approx(input1["wb_mass_ratio"], output2["wb_mass_ratio"], rtol=1e-6)
     assert_approx(output1["sc_volume_fraction"], output2["sc_volume_fraction"], rtol=1e-6)
     assert_approx(input1["aggregates_volume_fraction"], output2["aggregates_volume_fraction"], rtol=1e-6)
+
+
+def test_computation_volume_content_batch():
+    """
+    testing the batch computation against the single mix computation
+    """
+    mixes = pd.DataFrame(
+        {
+            "density_cem": [1440.0, 1000.0, 1543.0],
+            "density_sub": [840.0, 1000.0, 900.0],
+            "density_water": [977.0, 1000.0, 988.0],
+            "density_plasticizer": [980.0, 1000.0, 957.0],
+            "density_aggregates": [1500.0, 1000.0, 1460.0],
+            "wb_mass_ratio": [0.4, 0.4, 0.765],
+            "sc_mass_fraction": [0.4, 0.0, 0.452],
+            "aggregates_volume_fraction": [0.65, 0.65, 0.578],
+            "plasticizer_volume_content": [10.0, 0.0, 12.0],
+        }
+    )
+
+    output = computation_volume_content_batch(mixes)
+
+    for i, row in mixes.iterrows():
+        input_dic = {key: value * ureg(MIX_TABLE_UNITS[key]) for key, value in row.items()}
+        expected = computation_volume_content(input_dic)
+        for key, value in expected.items():
+            assert output[key][i] == pytest.approx(value.magnitude, rel=1e-9)
+
+    # the ratios are the inverse computation
+    contents = output[[column for column in output.columns if column.endswith("per_cubic_meter_concrete")]]
+    ratios = computation_ratios_batch(pd.concat([mixes.drop(columns=["wb_mass_ratio"]), contents], axis=1))
+    assert ratios["wb_mass_ratio"].values == pytest.approx(mixes["wb_mass_ratio"].values)
+    assert ratios["aggregates_volume_fraction"].values == pytest.approx(mixes["aggregates_volume_fraction"].values)
+    assert ratios["sc_volume_fraction"].values == pytest.approx(output["sc_volume_fraction"].values)
+
+    # structured arrays and pint-pandas columns work as well
+    structured = mixes.to_records(index=False)
+    assert computation_volume_content_batch(structured).values == pytest.approx(output.values)
+    pint_mixes = mixes.copy()
+    pint_mixes["density_cem"] = (mixes["density_cem"] / 1000).astype("pint[g/cm^3]")
+    assert computation_volume_content_batch(pint_mixes).values == pytest.approx(output.values)
+
+    # sanity checks name the wrong mixes
+    mixes.loc[1, "density_water"] = np.nan
+    with pytest.raises(ValueError, match=r"\[1\]"):
+        computation_volume_content_batch(mixes)
+    input_dic = {key: value * ureg(MIX_TABLE_UNITS[key]) for key, value in mixes.loc[1].items()}
+    with pytest.raises(ValueError):
+        computation_volume_content(input_dic)
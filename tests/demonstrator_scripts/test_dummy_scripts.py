@@ -1,9 +1,10 @@
+import numpy as np
 import pytest
 
-from lebedigital.demonstrator_scripts.dummy_hydration_parameters import \
-    dummy_hydration_parameters
-from lebedigital.demonstrator_scripts.dummy_paste_strength_stiffness import \
-    dummy_paste_strength_stiffness
+from lebedigital.demonstrator_scripts.dummy_hydration_parameters import (
+    dummy_hydration_parameters, dummy_hydration_parameters_raw)
+from lebedigital.demonstrator_scripts.dummy_paste_strength_stiffness import (
+    dummy_paste_strength_stiffness, dummy_paste_strength_stiffness_raw)
 
 
 def test_dummy_scripts():
@@ -19,3 +20,23 @@ def test_dummy_scripts():
     E, fc = dummy_paste_strength_stiffness(0, 10)
     assert E.magnitude == pytest.approx(60)
     assert fc.magnitude == pytest.approx(40)
+
+
+def test_dummy_scripts_raw():
+    # float versions, same values in the units of the pint versions
+    B1, B2, eta, E_act, Q_pot, T_ref = dummy_hydration_parameters_raw(0.5)
+    assert B1 == pytest.approx(0.0002208)
+    assert Q_pot == pytest.approx(200000)
+    assert T_ref == pytest.approx(25)
+
+    E, fc = dummy_paste_strength_stiffness_raw(0.5)
+    assert E == pytest.approx(45)
+    assert fc == pytest.approx(22.5)
+
+
+def test_dummy_hydration_parameters_array():
+    slag_ratio = np.array([0.0, 0.5, 1.0])
+    parameters = dummy_hydration_parameters(slag_ratio, 10)
+    for value, scalar_value in zip(parameters, dummy_hydration_parameters(0.5, 10)):
+        assert value.shape == (3,)
+        assert value.magnitude[1] == pytest.approx(scalar_value.magnitude)
@@ -0,0 +1,107 @@
+import pytest
+
+from lebedigital.demonstrator_scripts.approximate_tensile_strength import approximate_tensile_strength
+from lebedigital.demonstrator_scripts.beam_design import beam_required_steel
+from lebedigital.demonstrator_scripts.computation_GWP_mix import computation_GWP_mix
+from lebedigital.demonstrator_scripts.computation_GWP_per_part import computation_GWP_per_part
+from lebedigital.demonstrator_scripts.computation_volume_content import computation_volume_content
+from lebedigital.demonstrator_scripts.gradients import evaluate_with_gradients
+from lebedigital.unit_registry import ureg
+
+
+def finite_difference(function, inputs, name, output, relative_step=1e-6):
+    """central difference of function(inputs)[output] with respect to inputs[name]"""
+    step = relative_step * max(abs(inputs[name].magnitude), 1.0) * inputs[name].units
+    upper = function({**inputs, name: inputs[name] + step})[output]
+    lower = function({**inputs, name: inputs[name] - step})[output]
+    return (upper - lower) / (2 * step)
+
+
+def check_gradients(function, reference, inputs):
+    """compares the values with the reference implementation and the gradients with finite differences"""
+    outputs, gradients = evaluate_with_gradients(function, inputs)
+    expected = reference(inputs)
+    for output, value in outputs.items():
+        assert value.to(expected[output].units).magnitude == pytest.approx(expected[output].magnitude, rel=1e-9)
+        for name, gradient in gradients[output].items():
+            fd = finite_difference(reference, inputs, name, output)
+            assert gradient.to(fd.units).magnitude == pytest.approx(fd.magnitude, rel=1e-5, abs=1e-9)
+
+
+def test_volume_content_gradients():
+    inputs = {
+        "density_cem": 3150 * ureg("kg/m^3"),
+        "density_sub": 2900 * ureg("kg/m^3"),
+        "density_water": 1000 * ureg("kg/m^3"),
+        "density_aggregates": 2600 * ureg("kg/m^3"),
+        "density_plasticizer": 1100 * ureg("kg/m^3"),
+        "plasticizer_volume_content": 2 * ureg("kg/m^3"),
+        "wb_mass_ratio": 0.4 * ureg("dimensionless"),
+        "sc_mass_fraction": 0.3 * ureg("dimensionless"),
+        "aggregates_volume_fraction": 0.7 * ureg("dimensionless"),
+    }
+    check_gradients("computation_volume_content", lambda x: computation_volume_content(dict(x)), inputs)
+
+    # without plasticizer, the gradients are only given for the inputs of the caller
+    del inputs["density_plasticizer"], inputs["plasticizer_volume_content"]
+    check_gradients("computation_volume_content", lambda x: computation_volume_content(dict(x)), inputs)
+    _, gradients = evaluate_with_gradients("computation_volume_content", inputs)
+    assert all(set(gradient) == set(inputs) for gradient in gradients.values())
+
+
+def test_gwp_gradients():
+    constituents = {
+        "cement": {"content": 300 * ureg("kg/m^3"), "GWP": 0.9 * ureg("kg_CO2_eq/kg")},
+        "aggregates": {"content": 1800 * ureg("kg/m^3"), "GWP": 0.005 * ureg("kg_CO2_eq/kg")},
+    }
+    outputs, gradients = evaluate_with_gradients("computation_GWP_mix", constituents)
+    expected = computation_GWP_mix(constituents).to("kg_CO2_eq/m^3").magnitude
+    assert outputs["gwp_mix"].to("kg_CO2_eq/m^3").magnitude == pytest.approx(expected)
+    assert gradients["gwp_mix"]["cement_content"].to("kg_CO2_eq/kg").magnitude == pytest.approx(0.9)
+    assert gradients["gwp_mix"]["aggregates_GWP"].to("kg/m^3").magnitude == pytest.approx(1800)
+
+    inputs = {
+        "gwp_mix": 300 * ureg("kg_CO2_eq/m^3"),
+        "gwp_steel": 9000 * ureg("kg_CO2_eq/m^3"),
+        "width": 20 * ureg("cm"),
+        "height": 60 * ureg("cm"),
+        "length": 6.75 * ureg("m"),
+        "n_steel": 4 * ureg("dimensionless"),
+        "diameter_steel": 16 * ureg("mm"),
+    }
+    check_gradients("computation_GWP_per_part", lambda x: {"beam_gwp": computation_GWP_per_part(**x)}, inputs)
+
+
+@pytest.mark.parametrize("max_moment", [200, 400])
+def test_beam_required_steel_gradients(max_moment):
+    # below and above the limit of the compressive strength
+    inputs = {
+        "width": 200 * ureg("mm"),
+        "height": 600 * ureg("mm"),
+        "max_moment": max_moment * ureg("kN*m"),
+        "fck": 35 * ureg("N/mm^2") if max_moment == 200 else 10 * ureg("N/mm^2"),
+        "fyk": 500 * ureg("N/mm^2"),
+        "steel_dia": 16 * ureg("mm"),
+        "steel_dia_bu": 10 * ureg("mm"),
+        "cover": 25 * ureg("mm"),
+    }
+
+    def reference(x):
+        req_steel, fc_constraint = beam_required_steel(**x)
+        return {"req_steel": req_steel, "fc_constraint": fc_constraint}
+
+    check_gradients("beam_required_steel", reference, inputs)
+
+
+@pytest.mark.parametrize("compressive_strength", [30, 60])
+def test_tensile_strength_gradients(compressive_strength):
+    check_gradients(
+        "approximate_tensile_strength",
+        lambda x: {"tensile_strength": approximate_tensile_strength(x["compressive_strength"])},
+        {"compressive_strength": compressive_strength * ureg("MPa")},
+    )
+
+
+def test_unknown_function():
+    with pytest.raises(ValueError):
+        evaluate_with_gradients("check_beam_design", {})
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from lebedigital.demonstrator_scripts.interpolate_alpha_t28d import interpolate_alpha_t28d
@@ -13,3 +14,11 @@ def test_interpolate_alpha_t28d():
     assert interpolate_alpha_t28d(alpha_mix1, alpha_mix2, slag_ratio) == pytest.approx((alpha_mix1 + alpha_mix2) / 2)
     slag_ratio = 1.0
     assert interpolate_alpha_t28d(alpha_mix1, alpha_mix2, slag_ratio) == pytest.approx(alpha_mix2)
+
+
+def test_interpolate_alpha_t28d_array():
+    slag_ratio = np.array([0.0, 0.5, 1.0])
+    assert interpolate_alpha_t28d(0.5, 1.0, slag_ratio) == pytest.approx([0.5, 0.75, 1.0])
+
+    with pytest.raises(AssertionError):
+        interpolate_alpha_t28d(0.5, 1.0, np.array([0.5, 1.5]))
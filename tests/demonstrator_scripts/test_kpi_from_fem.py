@@ -5,7 +5,7 @@ import pytest
 from pint.testsuite.helpers import \
     assert_quantity_almost_equal as assert_approx
 
-from lebedigital.demonstrator_scripts.kpi_from_fem import kpi_from_fem
+from lebedigital.demonstrator_scripts.kpi_from_fem import kpi_from_fem, kpis_from_arrays
 from lebedigital.unit_registry import ureg
 
 
@@ -74,3 +74,23 @@ def test_kpi_from_fem_extrapolate2():
     assert results["time_max_reached_temperature"].magnitude == pytest.approx(20)
     assert results["constraint_temperature"].magnitude == pytest.approx(0.14285714285714285)
     assert results["time_of_demolding"].magnitude == pytest.approx(-10)
+
+
+def test_kpis_from_arrays():
+    time = [0.0, 10.0, 20.0, 30.0, 40.0]
+    temperature = [20.0, 50.0, 45.0, 40.0, 30.0]
+
+    # linear interpolation between the steps around the sign change
+    results = kpis_from_arrays(time, temperature, [50.0, 30.0, -10.0, -20.0, -30.0])
+    assert results["time_of_demolding"] == pytest.approx(17.5)
+    assert results["max_reached_temperature"] == 50.0
+    assert results["time_max_reached_temperature"] == 10.0
+
+    # several sign changes
+    yield_values = [50.0, -10.0, 10.0, -30.0, -30.0]
+    assert kpis_from_arrays(time, temperature, yield_values)["time_of_demolding"] == pytest.approx(50 / 6)
+    assert kpis_from_arrays(time, temperature, yield_values, crossing="last")["time_of_demolding"] == pytest.approx(
+        22.5
+    )
+    with pytest.raises(ValueError):
+        kpis_from_arrays(time, temperature, yield_values, crossing="error")
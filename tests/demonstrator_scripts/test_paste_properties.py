@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from lebedigital.demonstrator_scripts.computation_specific_heat_capacity_paste import (
+    computation_specific_heat_capacity_paste,
+)
+from lebedigital.demonstrator_scripts.computation_volume_content import computation_volume_content
+from lebedigital.demonstrator_scripts.dummy_paste_strength_stiffness import dummy_paste_strength_stiffness
+from lebedigital.demonstrator_scripts.paste_properties import paste_properties
+from lebedigital.unit_registry import ureg
+
+
+def test_paste_properties():
+    slag_ratios = np.linspace(0, 1, 5)
+    parameters = {
+        "density_cem": 3100 * ureg("kg/m^3"),
+        "density_sub": 2850 * ureg("kg/m^3"),
+        "density_water": 998 * ureg("kg/m^3"),
+        "density_aggregates": 2.7 * ureg("kg/dm^3"),
+        "wb_mass_ratio": 0.35 * ureg("dimensionless"),
+        "sc_mass_fraction": slag_ratios * ureg("dimensionless"),
+        "aggregates_volume_fraction": 0.7 * ureg("dimensionless"),
+        "shc_cement": 800 * ureg("J/kg/K"),
+        "shc_sub": 780 * ureg("J/kg/K"),
+        "shc_water": 4180 * ureg("J/kg/K"),
+    }
+
+    results = paste_properties(parameters)
+
+    # each mix equals the chain of the workflow rules
+    for i, slag_ratio in enumerate(slag_ratios):
+        mix = {**parameters, "sc_mass_fraction": slag_ratio * ureg("dimensionless")}
+        volume_contents = computation_volume_content(dict(mix))
+        for name, value in volume_contents.items():
+            assert results[name][i].to(value.units).magnitude == pytest.approx(value.magnitude)
+
+        paste_C = computation_specific_heat_capacity_paste(
+            volume_contents["cem_vol_fraction"],
+            volume_contents["sub_vol_fraction"],
+            volume_contents["water_vol_fraction"],
+            mix["shc_cement"],
+            mix["shc_sub"],
+            mix["shc_water"],
+            mix["density_cem"],
+            mix["density_sub"],
+            mix["density_water"],
+        )
+        assert results["paste_C"][i].to("J/kg/K").magnitude == pytest.approx(paste_C.to("J/kg/K").magnitude)
+
+        paste_E, paste_fc = dummy_paste_strength_stiffness(volume_contents["sc_volume_fraction"], 0)
+        assert results["paste_E"][i].to("GPa").magnitude == pytest.approx(paste_E.to("GPa").magnitude)
+        assert results["paste_fc"][i].to("MPa").magnitude == pytest.approx(paste_fc.to("MPa").magnitude)
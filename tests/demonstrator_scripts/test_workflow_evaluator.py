@@ -0,0 +1,75 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from lebedigital.demonstrator_scripts.workflow_evaluator import (
+    ANALYTIC_KPI_NODES,
+    WorkflowEvaluator,
+    evaluate_samples,
+    get_evaluator,
+)
+from lebedigital.demonstrator_scripts.workflow_rules import RULES, required_rules, rule_inputs, rule_output, run_rule
+
+WORKFLOW_PATH = Path(__file__).parents[2] / "usecases" / "optimization_paper" / "optimization_workflow"
+ANALYTIC_RULES = required_rules(ANALYTIC_KPI_NODES)
+
+
+def run_rules_on_files(workflow_path: Path, rules: list):
+    # as snakemake does, each rule reads its input files and writes its output file
+    for rule in rules:
+        run_rule(rule, [workflow_path / node for node in rule_inputs(rule)], workflow_path / rule_output(rule))
+
+
+def test_required_rules():
+    # the analytic KPIs do not depend on the FE model or the hydration simulation
+    assert "fem_model" not in ANALYTIC_RULES
+    assert "compute_doh_at_28_days" not in ANALYTIC_RULES
+    assert ANALYTIC_RULES[-1] == "gwp_beam"
+    assert required_rules(["Results/kpi_from_fem.json"])[-2:] == ["fem_model", "kpi_from_fem"]
+    # each rule runs after the rules of its inputs
+    outputs = set()
+    for rule in required_rules(["Results/kpi_from_fem.json"]):
+        assert all(node.startswith("Inputs/") or node in outputs for node in rule_inputs(rule))
+        outputs.add(rule_output(rule))
+
+
+def test_evaluator_equals_rules_on_files(tmp_path):
+    shutil.copytree(WORKFLOW_PATH / "Inputs", tmp_path / "Inputs")
+    (tmp_path / "Results").mkdir()
+    with open(tmp_path / "Inputs" / "geometry.json") as f:
+        geometry = json.load(f)
+    geometry["height"]["value"] = 800
+    with open(tmp_path / "Inputs" / "geometry.json", "w") as f:
+        json.dump(geometry, f)
+    with open(tmp_path / "Inputs" / "sc_fraction.json") as f:
+        slag_ratio = json.load(f)["sc_mass_fraction"]["value"]
+
+    run_rules_on_files(tmp_path, ANALYTIC_RULES)
+
+    evaluator = WorkflowEvaluator(WORKFLOW_PATH, rules=ANALYTIC_RULES)
+    kpis = evaluator.get_kpis(800, slag_ratio, tmp_path / "evaluator")
+    assert len(kpis) > 0
+    for node in ANALYTIC_KPI_NODES:
+        with open(tmp_path / node) as f:
+            for key, value in json.load(f).items():
+                assert kpis[key]["unit"] == value["unit"]
+                assert kpis[key]["value"] == pytest.approx(value["value"], rel=1e-12)
+
+    # all results of the evaluator are written as by the rules
+    for rule in ANALYTIC_RULES:
+        assert (tmp_path / "evaluator" / Path(RULES[rule][2]).name).exists()
+
+
+def test_evaluate_samples(tmp_path):
+    samples = [(600, 0.2), (900, 0.6)]
+    kpis = evaluate_samples(WORKFLOW_PATH, samples, tmp_path, rules=ANALYTIC_RULES, max_workers=2)
+    evaluator = get_evaluator(WORKFLOW_PATH, rules=ANALYTIC_RULES)
+    assert get_evaluator(WORKFLOW_PATH, rules=ANALYTIC_RULES) is evaluator
+    for (height, slag_ratio), sample_kpis in zip(samples, kpis):
+        expected = evaluator.get_kpis(height, slag_ratio, tmp_path / "serial")
+        assert sample_kpis.keys() == expected.keys()
+        for key, value in expected.items():
+            assert sample_kpis[key]["value"] == pytest.approx(value["value"])
+    assert kpis[0]["gwp_beam"]["value"] != pytest.approx(kpis[1]["gwp_beam"]["value"])
@@ -1,6 +1,7 @@
 import numpy as np
 from pint.testsuite.helpers import assert_quantity_almost_equal as assert_approx
-from lebedigital.demonstrator_scripts.youngs_modulus_approximation import youngs_modulus_approximation
+from lebedigital.demonstrator_scripts.youngs_modulus_approximation import (youngs_modulus_approximation,
+                                                                           youngs_modulus_approximation_raw)
 from lebedigital.unit_registry import ureg
 
 def test_youngs_modulus_approximation() :
@@ -27,4 +28,9 @@ def test_youngs_modulus_approximation() :
     density = 2400 * ureg('kg/m^3') # kg/m
     E = youngs_modulus_approximation(fc,density)
 
-    assert_approx(E, 25439.083860411065* ureg('MPa'), rtol=0.001)
\ No newline at end of file
+    assert_approx(E, 25439.083860411065* ureg('MPa'), rtol=0.001)
+
+def test_youngs_modulus_approximation_raw():
+    # float version, same values in MPa
+    assert youngs_modulus_approximation_raw(30.0, 2400.0) == youngs_modulus_approximation(
+        30 * ureg('MPa'), 2400 * ureg('kg/m^3')).magnitude
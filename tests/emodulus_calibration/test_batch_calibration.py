@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from lebedigital.calibration.batch_calibration import BatchCalibrationError, calibrate_experiments, load_experiments
+from lebedigital.calibration.sample_store import list_experiments, load_samples
+
+
+def test_batch_calibration(tmp_path):
+    # defining paths and directories
+    data_dir = "calibration_data"
+    data_path = Path(__file__).parent / data_dir
+    input_file = "Wolf 8.2 Probe 1.csv"
+
+    # experiments as they would be returned by the knowledge graph
+    experiment_records = [{"path": data_path, "exp_name": input_file, "length": 300.2, "diameter": 98.6}]
+    experiments = load_experiments(experiment_records)
+
+    posteriors = calibrate_experiments(
+        experiments,
+        calibration_metadata={"E_loc": 30, "E_scale": 10},
+        calibrated_data_path=tmp_path,
+        max_workers=1,
+        mode="test",
+    )
+
+    # checking if the KG file and the sample store are created
+    assert (tmp_path / "calibrationWorkflowWolf 8.2 Probe 1").is_file()
+    assert "Wolf 8.2 Probe 1" in list_experiments(tmp_path / "posterior_samples")
+
+    # same result as the single calibration
+    assert np.mean(posteriors["Wolf 8.2 Probe 1"]) == pytest.approx(31.334306458960317)
+    E_samples = load_samples(tmp_path / "posterior_samples", "Wolf 8.2 Probe 1", "E")
+    assert np.mean(E_samples) == pytest.approx(31.334306458960317)
+
+
+def test_batch_calibration_unique_names():
+    experiments = [{"exp_name": "a.csv"}, {"exp_name": "a.csv"}]
+    with pytest.raises(AssertionError):
+        calibrate_experiments(experiments, {"E_loc": 30, "E_scale": 10}, ".", mode="test")
+
+
+def test_batch_calibration_failure(tmp_path):
+    data_path = Path(__file__).parent / "calibration_data"
+    experiments = load_experiments(
+        [{"path": data_path, "exp_name": "Wolf 8.2 Probe 1.csv", "length": 300.2, "diameter": 98.6}]
+    )
+    # an experiment without data fails in its worker
+    experiments.append({"exp_name": "broken.csv"})
+
+    with pytest.raises(BatchCalibrationError) as error:
+        calibrate_experiments(
+            experiments, {"E_loc": 30, "E_scale": 10}, calibrated_data_path=tmp_path, max_workers=1, mode="test"
+        )
+    assert list(error.value.posteriors) == ["Wolf 8.2 Probe 1"]
+    assert list(error.value.failed) == ["broken"]
+
+    # without raising, only the successful posteriors are returned
+    posteriors = calibrate_experiments(
+        experiments,
+        {"E_loc": 30, "E_scale": 10},
+        calibrated_data_path=tmp_path,
+        max_workers=1,
+        mode="test",
+        raise_on_error=False,
+    )
+    assert list(posteriors) == ["Wolf 8.2 Probe 1"]
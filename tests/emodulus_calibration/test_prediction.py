@@ -1,25 +1,49 @@
 from lebedigital.calibration.posterior_predictive_three_point_bending import perform_prediction
 from lebedigital.calibration.posterior_predictive_three_point_bending import wrapper_three_point_bending
-from probeye.ontology.knowledge_graph_import import import_parameter_samples
+from lebedigital.calibration.sample_store import write_samples
 import pytest
 import numpy as np
-import os
-from pathlib import Path
 
 
-def test_prediction():
-    # Reading in the calibrated data. TO be pas here by some KG
+def test_prediction(tmp_path):
+    # the calibrated samples, as written to the sample store by the calibration
     E_samples = [30.1,30.2,30.53,30.8,29.6] #kN/mm2
-    KG = False
-    if KG:
-        data_dir = 'calibration_data'
-        data_path = Path(__file__).parent / data_dir
-        input_file = 'calibrationWorkflowWolf 8.2 Probe 1.csv.owl'
-        kg_path = data_path / input_file
-        assert kg_path.is_file()
-        E_samples = import_parameter_samples(kg_path)
+    write_samples(tmp_path, "Wolf 8.2 Probe 1", {"E": E_samples})
 
     # performing posterior predictive
     pos_pred = perform_prediction(forward_solver=wrapper_three_point_bending,
-                                  parameter=E_samples)
+                                  sample_store_path=tmp_path, experiment_name="Wolf 8.2 Probe 1")
     assert np.mean(pos_pred) == pytest.approx(120, rel=0.1)  # rel=0.5, only for debugging
+
+def test_prediction_sampling():
+    # cheap forward solver to check the sampling strategies and the stopping rule
+    E_samples = np.random.default_rng(0).normal(30, 1, 1000)
+    forward_solver = lambda E, nu: 4 * E * (1 + nu)
+
+    for sampling in ["random", "lhs", "sobol"]:
+        pos_pred = perform_prediction(forward_solver=forward_solver, parameter=E_samples, no_sample=64,
+                                      mode="full", sampling=sampling, seed=1)
+        assert len(pos_pred) == 64
+        assert np.mean(pos_pred) == pytest.approx(4.8 * np.mean(E_samples), rel=0.01)
+
+    # same seed, same samples (common random numbers)
+    pos_pred_1 = perform_prediction(forward_solver, E_samples, no_sample=16, mode="full", sampling="lhs", seed=2)
+    pos_pred_2 = perform_prediction(forward_solver, E_samples, no_sample=16, mode="full", sampling="lhs", seed=2)
+    assert pos_pred_1 == pos_pred_2
+
+    # the stopping rule ends the sampling early
+    pos_pred = perform_prediction(forward_solver, E_samples, no_sample=1000, mode="full", sampling="lhs",
+                                  rel_tol=0.1, seed=1)
+    assert len(pos_pred) < 1000
+
+
+def test_prediction_sample_store(tmp_path):
+    # same prediction from the sample store as from the samples
+    E_samples = np.random.default_rng(0).normal(30, 1, 100)
+    write_samples(tmp_path, "experiment", {"E": E_samples})
+    forward_solver = lambda E, nu: 4 * E * (1 + nu)
+
+    from_store = perform_prediction(forward_solver, sample_store_path=tmp_path, experiment_name="experiment",
+                                    no_sample=16, mode="full", sampling="lhs", seed=1)
+    from_samples = perform_prediction(forward_solver, E_samples, no_sample=16, mode="full", sampling="lhs", seed=1)
+    assert from_store == pytest.approx(from_samples)
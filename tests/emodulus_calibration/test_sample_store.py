@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from lebedigital.calibration.sample_store import list_experiments, load_samples, write_samples
+
+
+def test_sample_store(tmp_path):
+    store_path = tmp_path / "posterior_samples"
+    samples = {"E": np.linspace(30.0, 32.0, 100), "b": np.ones((2, 100))}
+    write_samples(store_path, "Wolf 8.2 Probe 1", samples)
+    write_samples(store_path, "Wolf 8.2 Probe 2", {"E": np.zeros(10)})
+
+    assert list_experiments(store_path) == ["Wolf 8.2 Probe 1", "Wolf 8.2 Probe 2"]
+    assert list_experiments(tmp_path / "not_existing") == []
+
+    # single parameters are memory-mapped
+    E_samples = load_samples(store_path, "Wolf 8.2 Probe 1", "E")
+    assert isinstance(E_samples, np.memmap)
+    assert E_samples == pytest.approx(samples["E"])
+
+    # all parameters of an experiment
+    all_samples = load_samples(store_path, "Wolf 8.2 Probe 1")
+    assert sorted(all_samples) == ["E", "b"]
+    assert all_samples["b"].shape == (2, 100)
+
+
+def test_sample_store_missing_experiment(tmp_path):
+    with pytest.raises(KeyError):
+        load_samples(tmp_path, "Wolf 8.2 Probe 1", "E")
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from probeye.definition.forward_model import ForwardModelBase
+from probeye.definition.inverse_problem import InverseProblem
+from probeye.definition.likelihood_model import GaussianLikelihoodModel
+from probeye.definition.sensor import Sensor
+from probeye.inference.emcee.solver import EmceeSolver
+
+from lebedigital.calibration.vectorized_solver import VectorizedEmceeSolver
+
+
+class LinearModel(ForwardModelBase):
+    """linear model with the same interface as the cylinder forward model"""
+
+    def interface(self):
+        self.parameters = ["E"]
+        self.input_sensors = [Sensor("displacement_list")]
+        self.output_sensors = [Sensor("force_list", std_model="sigma")]
+
+    def response(self, inp: dict) -> dict:
+        return {"force_list": inp["E"] * inp["displacement_list"]}
+
+    def response_vectorized(self, inp: dict) -> dict:
+        return {"force_list": np.outer(inp["E"], inp["displacement_list"])}
+
+
+def setup_problem():
+    problem = InverseProblem("linear test")
+    problem.add_parameter("E", "model", prior=("normal", {"mean": 30, "std": 10}))
+    problem.add_parameter("sigma", "likelihood", prior=("uniform", {"low": 0, "high": 0.5}))
+
+    model = LinearModel("linear_model")
+    problem.add_forward_model(model)
+
+    displacement = np.linspace(0.0, 1.0, 10)
+    problem.add_experiment(
+        "exp",
+        fwd_model_name="linear_model",
+        sensor_values={"displacement_list": displacement, "force_list": 31.0 * displacement},
+    )
+    problem.add_likelihood_model(
+        GaussianLikelihoodModel(prms_def="sigma", experiment_name="exp", model_error="additive")
+    )
+    return problem
+
+
+def test_vectorized_loglike():
+    problem = setup_problem()
+    solver = VectorizedEmceeSolver(problem, seed=10, show_progress=False)
+
+    theta = np.array([[30.0, 0.1], [31.0, 0.2], [29.0, 0.6]])  # last one outside the sigma prior
+    ll = solver.loglike(theta)
+    lp = solver.logprior(theta)
+
+    for i, theta_i in enumerate(theta):
+        assert ll[i] == pytest.approx(EmceeSolver.loglike(solver, theta_i))
+        assert lp[i] == pytest.approx(EmceeSolver.logprior(solver, theta_i))
+    assert lp[2] == -np.inf
+
+
+def test_vectorized_emcee():
+    # the initial positions are drawn from the global random state
+    np.random.seed(1)
+    reference = EmceeSolver(setup_problem(), seed=10, show_progress=False)
+    reference_data = reference.run_mcmc(n_walkers=8, n_steps=20, n_initial_steps=5)
+
+    np.random.seed(1)
+    solver = VectorizedEmceeSolver(setup_problem(), seed=10, show_progress=False)
+    inference_data = solver.run_mcmc(n_walkers=8, n_steps=20, n_initial_steps=5, vectorize=True)
+
+    # the same chain is obtained
+    assert inference_data.posterior["E"].values == pytest.approx(reference_data.posterior["E"].values)
@@ -0,0 +1,27 @@
+from lebedigital.simulation.checkpoint import read_sensor_history, write_sensor_history
+
+
+class Sensor:
+    def __init__(self, time, data):
+        self.time = time
+        self.data = data
+
+
+class Problem:
+    def __init__(self, sensors):
+        self.sensors = sensors
+
+
+def test_sensor_history(tmp_path):
+    problem = Problem(
+        {"MaxTemperatureSensor": Sensor([1200.0, 2400.0], [41.5, 43.6]), "MaxYieldSensor": Sensor([1200.0], [21.3])}
+    )
+    write_sensor_history(problem, tmp_path / "state.json", t=2400.0, dt=1200.0)
+
+    restored = Problem({"MaxTemperatureSensor": Sensor([], []), "MaxYieldSensor": Sensor([], [])})
+    state = read_sensor_history(restored, tmp_path / "state.json")
+
+    assert state == {"t": 2400.0, "dt": 1200.0}
+    for name, sensor in problem.sensors.items():
+        assert restored.sensors[name].time == sensor.time
+        assert restored.sensors[name].data == sensor.data
@@ -86,3 +86,39 @@ def test_get_E_and_fc_over_time():
         assert t in result["time"].unique()
         assert not np.isnan(result.loc[result["time"] == t, "E"].values[0].magnitude)
         assert not np.isnan(result.loc[result["time"] == t, "fc"].values[0].magnitude)
+
+
+@pytest.mark.parametrize("alpha_tx", [1.0, 0.8])
+def test_fast_mode(alpha_tx):
+    Q_ = ureg.Quantity
+    parameters = fenics_concrete.Parameters()
+    parameters["density"] = 2350 * ureg("kg/m^3")
+    parameters["themal_cond"] = 2.0 * ureg("W/m/K")
+    parameters["vol_heat_cap"] = 2.4e6 * ureg("J/m^3/K")
+    parameters["Q_inf"] = 240000000 * ureg("J/m^3")
+    parameters["B1"] = 2.916e-4 * ureg("1/s")
+    parameters["B2"] = 0.0024229 * ureg("")
+    parameters["eta"] = 5.554 * ureg("")
+    parameters["alpha_max"] = 0.875 * ureg("")
+    parameters["E_act"] = 5653 * 8.3145 * ureg("J/mol")
+    parameters["T_ref"] = Q_(25, ureg.degC)
+    parameters["E"] = 25e9 * ureg("N/m^2")
+    parameters["nu"] = 0.2 * ureg("")
+    parameters["alpha_t"] = 0.2 * ureg("")
+    parameters["alpha_0"] = 0.05 * ureg("")
+    parameters["a_E"] = 0.6 * ureg("")
+    parameters["fc"] = 30e6 * ureg("N/m^2")
+    parameters["a_fc"] = 1.5 * ureg("")
+    parameters["alpha_tx"] = alpha_tx * ureg("")
+
+    # the lumped model agrees with the FE cube up to the time discretization error of the hourly steps
+    assert get_doh_at_28day(parameters, fast=True) == pytest.approx(0.8525248121015192, rel=1e-3)
+
+    time_list = [1 * ureg("day"), 2 * ureg("days")]
+    fast = get_E_and_fc_over_time(parameters, time_list, fast=True)
+    fem = get_E_and_fc_over_time(parameters, time_list)
+    for t in time_list:
+        for key in ["E", "fc"]:
+            fast_value = fast.loc[fast["time"] == t, key].values[0].magnitude
+            fem_value = fem.loc[fem["time"] == t, key].values[0].magnitude
+            assert fast_value == pytest.approx(fem_value, rel=1e-2)
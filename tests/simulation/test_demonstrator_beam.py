@@ -3,11 +3,12 @@ import pandas as pd
 import pytest
 
 from lebedigital.simulation.demonstrator_beam import demonstrator_beam
+from lebedigital.simulation.reduced_beam_models import reduced_model_errors
 from lebedigital.unit_registry import ureg
 
 
-def test_demonstrator_beam():
-    # setup parameters:
+def setup_parameters():
+    # parameters of the beam tests
     parameters = fenics_concrete.Parameters()
 
     # model parameters
@@ -55,6 +56,12 @@ def test_demonstrator_beam():
     parameters["mesh_density"] = 2 * ureg("")
     parameters["mesh_density_min"] = 2 * ureg("")
 
+    return parameters
+
+
+def test_demonstrator_beam():
+    parameters = setup_parameters()
+
     # simulation time
     full_time = 60 * 60 * 1 * ureg("s")  # simulation time
     time_step = 60 * 20 * ureg("s")  # timestep
@@ -130,3 +137,71 @@ def test_demonstrator_beam_2():
 
     # run simulation
     data = demonstrator_beam(full_time, time_step, parameters, pv_output=False, pv_name="test_beam_simulation")
+
+
+def test_demonstrator_beam_restart(tmp_path):
+    checkpoint_path = tmp_path / "checkpoint"
+
+    # run the first two steps, with a checkpoint at the end
+    demonstrator_beam(40 * ureg("min"), 20 * ureg("min"), setup_parameters(), checkpoint_path=checkpoint_path)
+    assert (checkpoint_path / "state.json").is_file()
+
+    # restart and run the third step
+    data = demonstrator_beam(60 * ureg("min"), 20 * ureg("min"), setup_parameters(), restart_from=checkpoint_path)
+
+    # same result as without interruption
+    uninterrupted = demonstrator_beam(60 * ureg("min"), 20 * ureg("min"), setup_parameters())
+    assert data.time.values.quantity.magnitude == pytest.approx(uninterrupted.time.values.quantity.magnitude)
+    for column in ["temperature", "yield"]:
+        assert data[column].values.quantity.magnitude == pytest.approx(
+            uninterrupted[column].values.quantity.magnitude, rel=1e-10
+        )
+
+
+def test_demonstrator_beam_restart_sensor_file(tmp_path):
+    checkpoint_path = tmp_path / "checkpoint"
+    sensor_file = tmp_path / "sensors.csv"
+
+    def interrupt(problem, t):
+        # the sensor row of the last step is written, the final checkpoint is not
+        if t > 3000:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        demonstrator_beam(
+            60 * ureg("min"),
+            20 * ureg("min"),
+            setup_parameters(),
+            checkpoint_path=checkpoint_path,
+            checkpoint_interval=2,
+            sensor_file=sensor_file,
+            sensor_callback=interrupt,
+        )
+
+    # the restart computes the last step again, its row is written once
+    data = demonstrator_beam(
+        60 * ureg("min"),
+        20 * ureg("min"),
+        setup_parameters(),
+        restart_from=checkpoint_path,
+        sensor_file=sensor_file,
+        keep_sensor_history=False,
+        output_times=[40 * ureg("min"), 60 * ureg("min")],
+    )
+    assert data.time.values.quantity.magnitude == pytest.approx([2400, 3600])
+
+
+def test_demonstrator_beam_reduced_models():
+    errors = reduced_model_errors(60 * ureg("min"), 20 * ureg("min"), setup_parameters())
+
+    # same results up to the discretization error, the accepted errors documented in reduced_beam_models
+    for model in ["half", "quarter", "cross_section"]:
+        assert errors[model]["temperature"] < 0.05, errors
+    for model in ["half", "quarter"]:
+        assert errors[model]["yield"] < 0.1, errors
+
+    # no yield for the cross section
+    assert "yield" not in errors["cross_section"]
+    data = demonstrator_beam(60 * ureg("min"), 20 * ureg("min"), setup_parameters(), model="cross_section")
+    with pytest.raises(KeyError):
+        data["yield"]
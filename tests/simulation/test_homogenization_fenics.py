@@ -0,0 +1,44 @@
+import fenics_concrete
+import pytest
+
+from lebedigital.simulation.concrete_homogenization import concrete_homogenization
+from lebedigital.unit_registry import ureg
+
+
+@pytest.mark.parametrize("vol_frac", [0.0, 0.3, 0.6, 0.8])
+def test_homogenization_equals_fenics_concrete(vol_frac):
+    # the numpy Mori-Tanaka scheme gives the values of fenics_concrete.ConcreteHomogenization
+    parameters = {
+        "paste_E": 30e9 * ureg("Pa"),
+        "paste_nu": 0.2 * ureg("dimensionless"),
+        "paste_C": 870 * ureg("J/kg/K"),
+        "paste_kappa": 1.8 * ureg("W/m/K"),
+        "paste_rho": 2400 * ureg("kg/m^3"),
+        "paste_fc": 30e6 * ureg("Pa"),
+        "paste_Q": 250000 * ureg("J/kg"),
+        "aggregates_E": 45e9 * ureg("Pa"),
+        "aggregates_nu": 0.3 * ureg("dimensionless"),
+        "aggregates_C": 840 * ureg("J/kg/K"),
+        "aggregates_kappa": 0.8 * ureg("W/m/K"),
+        "aggregates_rho": 2600 * ureg("kg/m^3"),
+        "aggregates_vol_frac": vol_frac * ureg("dimensionless"),
+    }
+
+    concrete = fenics_concrete.ConcreteHomogenization(
+        E_matrix=30e9, nu_matrix=0.2, fc_matrix=30e6, kappa_matrix=1.8, rho_matrix=2400, C_matrix=870, Q_matrix=250000
+    )
+    concrete.add_uncoated_particle(E=45e9, nu=0.3, volume_fraction=vol_frac, kappa=0.8, rho=2600, C=840)
+    expected = {
+        "E": concrete.E_eff,
+        "nu": concrete.nu_eff,
+        "fc": concrete.fc_eff,
+        "C": concrete.C_vol_eff,
+        "rho": concrete.rho_eff,
+        "kappa": concrete.kappa_eff,
+        "Q": concrete.Q_vol_eff,
+    }
+
+    results = concrete_homogenization(parameters)
+
+    for name, value in expected.items():
+        assert results[name].to_base_units().magnitude == pytest.approx(value, rel=1e-10)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from lebedigital.simulation.lumped_hydration import (
+    compressive_strength_evolution,
+    degree_of_hydration,
+    material_evolution,
+    youngs_modulus_evolution,
+)
+
+HYDRATION_PARAMETERS = {
+    "B1": 2.916e-4,
+    "B2": 0.0024229,
+    "eta": 5.554,
+    "alpha_max": 0.875,
+    "E_act": 5653 * 8.3145,
+    "T_ref": 25.0,
+}
+
+
+def test_degree_of_hydration():
+    # value of the FE cube after 28 days (hourly implicit Euler steps)
+    alpha = degree_of_hydration(28 * 24 * 3600, 20, **HYDRATION_PARAMETERS)
+    assert alpha == pytest.approx(0.8525248121015192, rel=1e-3)
+    assert alpha < HYDRATION_PARAMETERS["alpha_max"]
+
+    # higher temperatures accelerate the hydration
+    alpha = degree_of_hydration(24 * 3600, [10, 20, 30], **HYDRATION_PARAMETERS)
+    assert np.all(np.diff(alpha) > 0)
+
+    # vectorised over parameter sets and time, monotonic in time
+    time = np.array([0, 3600, 24 * 3600, 7 * 24 * 3600])
+    alpha = degree_of_hydration(time, 20, **{**HYDRATION_PARAMETERS, "B1": [2.916e-4, 3.5e-4]})
+    assert alpha.shape == (2, 4)
+    assert alpha[:, 0] == pytest.approx(0)
+    assert np.all(np.diff(alpha, axis=1) > 0)
+    assert np.all(alpha[1, 1:] > alpha[0, 1:])
+
+    # unsorted times are returned in the requested order
+    alpha_unsorted = degree_of_hydration(time[::-1], 20, **{**HYDRATION_PARAMETERS, "B1": [2.916e-4, 3.5e-4]})
+    assert alpha_unsorted == pytest.approx(alpha[:, ::-1])
+
+
+def test_evolution_functions():
+    alpha = np.array([0.0, 0.1, 0.2, 0.5, 1.0])
+    E = youngs_modulus_evolution(alpha, 25e9, alpha_t=0.2, alpha_0=0.05, a_E=0.6)
+    # linear below alpha_t, continuous at alpha_t, the full value for alpha = 1
+    assert E[1] == pytest.approx(E[2] / 2)
+    assert E[2] == pytest.approx(25e9 * (0.15 / 0.95) ** 0.6)
+    assert E[-1] == pytest.approx(25e9)
+
+    fc = compressive_strength_evolution(alpha, 30e6, a_fc=1.5)
+    assert fc == pytest.approx(30e6 * alpha**1.5)
+
+    # alpha_tx scales the degree of hydration the 28 day values refer to
+    assert compressive_strength_evolution(0.8, 30e6, a_fc=1.5, alpha_tx=0.8) == pytest.approx(30e6)
+    assert youngs_modulus_evolution(0.8, 25e9, alpha_t=0.2, alpha_0=0.05, a_E=0.6, alpha_tx=0.8) == pytest.approx(25e9)
+    # same evolution, scaled by the modulus of the fully hydrated concrete
+    E_tx = youngs_modulus_evolution(alpha, 25e9, alpha_t=0.2, alpha_0=0.05, a_E=0.6, alpha_tx=0.8)
+    assert E_tx == pytest.approx(E / ((0.75 / 0.95) ** 0.6))
+
+
+def test_material_evolution():
+    parameters = {
+        **HYDRATION_PARAMETERS,
+        "E": 25e9,
+        "alpha_t": 0.2,
+        "alpha_0": 0.05,
+        "a_E": 0.6,
+        "fc": np.array([30e6, 40e6]),
+        "a_fc": 1.5,
+    }
+    time = np.array([3600.0, 24 * 3600.0])
+    results = material_evolution(time, 20, parameters)
+
+    assert results["alpha"].shape == (2, 2)
+    assert results["fc"][1] == pytest.approx(results["fc"][0] * 4 / 3)
+    assert results["E"][0] == pytest.approx(youngs_modulus_evolution(results["alpha"][0], 25e9, 0.2, 0.05, 0.6))
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from lebedigital.simulation.mori_tanaka import mori_tanaka, vectorized_homogenization
+from lebedigital.unit_registry import ureg
+
+
+def test_vectorized_homogenization():
+    # same parameters as test_homogenization, with an array of volume fractions
+    parameters = {}
+    parameters["paste_E"] = 30e9 * ureg("Pa")
+    parameters["paste_nu"] = 0.2 * ureg("dimensionless")
+    parameters["paste_C"] = 870 * ureg("J/kg/K")
+    parameters["paste_kappa"] = 1.8 * ureg("W/m/K")
+    parameters["paste_rho"] = 2400 * ureg("kg/m^3")
+    parameters["paste_fc"] = 30 * ureg("MPa")
+    parameters["paste_Q"] = 250 * ureg("kJ/kg")
+    parameters["aggregates_E"] = 25e9 * ureg("Pa")
+    parameters["aggregates_nu"] = 0.3 * ureg("dimensionless")
+    parameters["aggregates_C"] = 840 * ureg("J/kg/K")
+    parameters["aggregates_kappa"] = 0.8 * ureg("W/m/K")
+    parameters["aggregates_rho"] = 2600 * ureg("kg/m^3")
+    parameters["aggregates_vol_frac"] = np.array([0.0, 0.6, 1.0]) * ureg("dimensionless")
+
+    results = vectorized_homogenization(parameters)
+
+    assert results["E"].to("Pa").magnitude == pytest.approx([30e9, 27014932516.511917, 25e9], rel=1e-6)
+    assert results["nu"].magnitude == pytest.approx([0.2, 0.26409495548961426, 0.3], rel=1e-6)
+    assert results["fc"].to("Pa").magnitude[1] == pytest.approx(27652173.91304348, rel=1e-6)
+    assert results["C"].to("J/m^3/K").magnitude[1] == pytest.approx(2145600.0, rel=1e-6)
+    assert results["rho"].to("kg/m^3").magnitude == pytest.approx([2400, 2520, 2600], rel=1e-6)
+    assert results["kappa"].to("W/m/K").magnitude == pytest.approx([1.8, 1.152, 0.8], rel=1e-6)
+    assert results["Q"].to("J/m^3").magnitude == pytest.approx([600e6, 240e6, 0], rel=1e-6)
+
+
+def test_mori_tanaka_broadcasting():
+    E = np.linspace(20e9, 40e9, 4)
+    vol_frac = np.linspace(0.2, 0.7, 3)[:, np.newaxis]
+
+    results = mori_tanaka(
+        paste_E=E,
+        paste_nu=0.2,
+        paste_fc=30e6,
+        paste_kappa=1.8,
+        paste_rho=2400,
+        paste_C=870,
+        paste_Q=250000,
+        aggregates_E=25e9,
+        aggregates_nu=0.3,
+        aggregates_vol_frac=vol_frac,
+        aggregates_kappa=0.8,
+        aggregates_rho=2600,
+        aggregates_C=840,
+    )
+
+    for value in results.values():
+        assert value.shape == (3, 4)
+
+    # each entry equals the scalar computation
+    single = mori_tanaka(
+        paste_E=E[2],
+        paste_nu=0.2,
+        paste_fc=30e6,
+        paste_kappa=1.8,
+        paste_rho=2400,
+        paste_C=870,
+        paste_Q=250000,
+        aggregates_E=25e9,
+        aggregates_nu=0.3,
+        aggregates_vol_frac=vol_frac[1, 0],
+        aggregates_kappa=0.8,
+        aggregates_rho=2600,
+        aggregates_C=840,
+    )
+    for name, value in results.items():
+        assert value[1, 2] == pytest.approx(float(single[name]))
@@ -0,0 +1,34 @@
+import json
+
+from lebedigital.simulation.parallel import is_parallel, is_root, read_parameters, reduce_max_sensors
+from lebedigital.unit_registry import ureg
+
+
+class Sensor:
+    def __init__(self, data):
+        self.data = data
+        self.time = list(range(len(data)))
+
+
+class Problem:
+    def __init__(self):
+        self.sensors = {"MaxTemperatureSensor": Sensor([40.0, 42.0])}
+
+
+def test_serial_run():
+    # without mpirun, the sensor data is not changed
+    assert not is_parallel()
+    assert is_root()
+    problem = Problem()
+    reduce_max_sensors(problem)
+    assert problem.sensors["MaxTemperatureSensor"].data == [40.0, 42.0]
+
+
+def test_read_parameters(tmp_path):
+    path = tmp_path / "parameters.json"
+    with open(path, "w") as f:
+        json.dump({"T_0": {"value": 20, "unit": "degree_Celsius"}, "width": {"value": 0.3, "unit": "meter"}}, f)
+
+    parameters = read_parameters(path)
+    assert parameters["T_0"] == ureg.Quantity(20, ureg.degC)
+    assert parameters["width"] == 0.3 * ureg("m")
@@ -0,0 +1,241 @@
+import numpy as np
+import pytest
+
+from lebedigital.simulation.time_stepping import (
+    AdaptiveTimeStep,
+    CsvSensorSink,
+    kpis_decided,
+    read_sensor_csv,
+    run_time_loop,
+    sensor_dataframe,
+    temperature_past_peak,
+    yield_negative_for,
+)
+
+
+class Sensor:
+    def __init__(self):
+        self.data = []
+        self.time = []
+
+
+class HardeningProblem:
+    """problem with the interface of the fenics_concrete problems, temperature rise as in the hydration"""
+
+    def __init__(self):
+        self.sensors = {"MaxTemperatureSensor": Sensor(), "MaxYieldSensor": Sensor()}
+        self.dt = None
+        self.n_solves = 0
+
+    def set_timestep(self, dt):
+        self.dt = dt
+
+    def solve(self, t):
+        self.n_solves += 1
+        for name, value in [("MaxTemperatureSensor", 20 + 30 * (1 - np.exp(-t / 36000))), ("MaxYieldSensor", -t)]:
+            self.sensors[name].data.append(value)
+            self.sensors[name].time.append(t)
+
+
+def test_adaptive_time_step():
+    control = AdaptiveTimeStep(dt_min=60, dt_max=3600, max_temperature_change=1.0)
+
+    # large change, time step is reduced, but at most by max_shrink
+    assert control.next_dt(600, {"temperature": 10.0}) == pytest.approx(300)
+    # small change, time step grows by at most max_growth
+    assert control.next_dt(600, {"temperature": 0.1}) == pytest.approx(1200)
+    assert control.next_dt(600, {"temperature": 0.6}) == pytest.approx(900)
+    # bounds
+    assert control.next_dt(3000, {}) == pytest.approx(3600)
+    assert control.next_dt(100, {"temperature": 10.0}) == pytest.approx(60)
+
+
+def test_run_time_loop():
+    # constant time steps
+    problem = HardeningProblem()
+    run_time_loop(problem, time=3600, dt=1200)
+    assert problem.sensors["MaxYieldSensor"].time == pytest.approx([1200, 2400, 3600])
+
+    # constant time steps, steps are inserted at the output times
+    problem = HardeningProblem()
+    run_time_loop(problem, time=3600, dt=1200, output_times=[1800, 2400])
+    assert problem.sensors["MaxYieldSensor"].time == pytest.approx([1200, 1800, 2400, 3600])
+    data = sensor_dataframe(problem, output_times=[1800, 2400])
+    assert data.time.values.quantity.magnitude == pytest.approx([1800, 2400])
+
+    # adaptive time steps, the output times and the end time are hit exactly
+    problem = HardeningProblem()
+    output_times = [3600, 24 * 3600, 48 * 3600]
+    control = AdaptiveTimeStep(dt_min=60, dt_max=6 * 3600, max_temperature_change=1.0)
+    run_time_loop(problem, time=48 * 3600, dt=600, time_step_control=control, output_times=output_times)
+
+    time = problem.sensors["MaxYieldSensor"].time
+    assert problem.n_solves < 48 * 3600 / 600
+    assert time[-1] == pytest.approx(48 * 3600)
+    assert np.all(np.diff(problem.sensors["MaxTemperatureSensor"].data) < 1.5)
+
+    data = sensor_dataframe(problem, output_times=output_times)
+    assert data.time.values.quantity.magnitude == pytest.approx(output_times)
+    assert data.temperature.values.quantity.magnitude == pytest.approx(
+        20 + 30 * (1 - np.exp(-np.array(output_times) / 36000))
+    )
+
+
+class PeakProblem(HardeningProblem):
+    """temperature with a fast rise to a peak after 10 h, yield negative after 20 h"""
+
+    def solve(self, t):
+        self.n_solves += 1
+        values = [("MaxTemperatureSensor", 20 + 30 * (t / 36000) ** 2 * np.exp(2 - 2 * t / 36000))]
+        values.append(("MaxYieldSensor", 1 - (t / 72000) ** 2))
+        for name, value in values:
+            self.sensors[name].data.append(value)
+            self.sensors[name].time.append(t)
+
+
+def kpis(problem):
+    # maximum temperature and time of demolding (interpolated zero of the yield), as in `kpi_from_fem`
+    time = np.asarray(problem.sensors["MaxYieldSensor"].time)
+    yield_data = np.asarray(problem.sensors["MaxYieldSensor"].data)
+    i = np.argmax(yield_data < 0)
+    demolding = np.interp(0, yield_data[[i, i - 1]], time[[i, i - 1]])
+    return max(problem.sensors["MaxTemperatureSensor"].data), demolding
+
+
+def test_run_time_loop_rejection():
+    # a large initial step is rejected and repeated until the temperature change is small enough
+    problem = PeakProblem()
+    control = AdaptiveTimeStep(dt_min=60, dt_max=6 * 3600, max_temperature_change=1.0, max_growth=10)
+    run_time_loop(problem, time=48 * 3600, dt=600, time_step_control=control)
+
+    time = problem.sensors["MaxTemperatureSensor"].time
+    temperature = problem.sensors["MaxTemperatureSensor"].data
+    assert problem.n_solves > len(time)
+    assert len(problem.sensors["MaxYieldSensor"].time) == len(time)
+    assert np.all(np.diff(time) > 0)
+    assert np.all(np.abs(np.diff(temperature)) <= control.reject_factor * 1.0)
+    assert time[-1] == pytest.approx(48 * 3600)
+
+
+def test_adaptive_kpis():
+    # the KPIs of the adaptive time stepping match the ones with a fine constant time step
+    fixed = PeakProblem()
+    run_time_loop(fixed, time=48 * 3600, dt=300)
+
+    adaptive = PeakProblem()
+    control = AdaptiveTimeStep(dt_min=60, dt_max=6 * 3600, max_temperature_change=1.0)
+    run_time_loop(adaptive, time=48 * 3600, dt=600, time_step_control=control)
+
+    assert adaptive.n_solves < fixed.n_solves / 4
+    max_temperature, demolding = kpis(adaptive)
+    fixed_max_temperature, fixed_demolding = kpis(fixed)
+    # tolerances: 0.1 K for the maximum temperature and 1 % for the time of demolding
+    assert max_temperature == pytest.approx(fixed_max_temperature, abs=0.1)
+    assert demolding == pytest.approx(fixed_demolding, rel=0.01)
+
+
+def set_sensors(problem, temperature, yield_data):
+    for name, data in [("MaxTemperatureSensor", temperature), ("MaxYieldSensor", yield_data)]:
+        problem.sensors[name].data = list(data)
+        problem.sensors[name].time = list(600.0 * np.arange(1, len(data) + 1))
+
+
+def test_stop_criteria():
+    problem = HardeningProblem()
+    yield_data = [5.0, 2.0, -1.0, -2.0, -3.0, -4.0, -5.0]
+    temperature = [30.0, 35.0, 36.0, 35.5, 35.0, 34.0, 33.0]
+    criterion = kpis_decided(3)
+    set_sensors(problem, temperature[:4], yield_data[:4])
+
+    assert not yield_negative_for(3)(problem)
+    assert not temperature_past_peak(3)(problem)
+    assert not criterion(problem)
+
+    set_sensors(problem, temperature[:5], yield_data[:5])
+    assert yield_negative_for(3)(problem)
+    assert not temperature_past_peak(3)(problem)
+    assert not criterion(problem)
+
+    set_sensors(problem, temperature[:6], yield_data[:6])
+    assert criterion(problem)
+    # same for a new criterion, e.g. after a restart
+    assert kpis_decided(3)(problem)
+
+
+def test_kpis_decided_hot_cast():
+    # the temperature of a warm cast falls before the hydration heat rises it to the peak
+    problem = HardeningProblem()
+    yield_data = [-1.0, -2.0, -3.0, -4.0, -5.0, -6.0, -7.0, -8.0, -9.0]
+    temperature = [40.0, 38.0, 37.0, 36.5, 37.0, 38.0, 37.5, 37.0, 36.0]
+    criterion = kpis_decided(3)
+    for n in range(1, len(temperature)):
+        set_sensors(problem, temperature[:n], yield_data[:n])
+        assert not criterion(problem)
+
+    set_sensors(problem, temperature, yield_data)
+    assert criterion(problem)
+
+    # the temperature has to fall after the yield crossing
+    yield_data = [5.0, 4.0, 3.0, 2.0, 1.0, 0.5, 0.2, -1.0, -2.0]
+    set_sensors(problem, temperature, yield_data)
+    assert not kpis_decided(3)(problem)
+
+
+def test_run_time_loop_stop_criterion():
+    # the yield of the test problem is negative from the first step on, the temperature never decreases
+    problem = HardeningProblem()
+    run_time_loop(problem, time=36000, dt=600, stop_criterion=yield_negative_for(3))
+    assert problem.sensors["MaxYieldSensor"].time == pytest.approx([600, 1200, 1800])
+
+    problem = HardeningProblem()
+    run_time_loop(problem, time=36000, dt=600, stop_criterion=kpis_decided(3))
+    assert problem.n_solves == 60
+
+
+def test_csv_sensor_sink(tmp_path):
+    sensor_file = tmp_path / "sensors.csv"
+    times = []
+
+    problem = HardeningProblem()
+    sinks = [CsvSensorSink(sensor_file, max_history=3), lambda problem, t: times.append(t)]
+    run_time_loop(problem, time=36000, dt=600, sensor_sinks=sinks)
+
+    # only the last values are kept in memory, the full history is in the file
+    assert len(problem.sensors["MaxTemperatureSensor"].data) == 3
+    assert times == pytest.approx(np.arange(1, 61) * 600)
+
+    data = read_sensor_csv(sensor_file)
+    assert data.time.values.quantity.magnitude == pytest.approx(times)
+    assert data.temperature.values.quantity.magnitude == pytest.approx(
+        20 + 30 * (1 - np.exp(-np.array(times) / 36000))
+    )
+    assert str(data.temperature.values.quantity.units) == "degree_Celsius"
+
+    # appending continues the file
+    problem = HardeningProblem()
+    run_time_loop(problem, time=1200, dt=600, sensor_sinks=[CsvSensorSink(sensor_file, append=True)])
+    assert len(read_sensor_csv(sensor_file)) == 62
+
+
+def test_csv_sensor_sink_restart(tmp_path):
+    sensor_file = tmp_path / "sensors.csv"
+    problem = HardeningProblem()
+    run_time_loop(problem, time=6000, dt=600, sensor_sinks=[CsvSensorSink(sensor_file)])
+
+    # restart from a checkpoint at 3600 s, the rows after it are computed and written again
+    sink = CsvSensorSink(sensor_file, append=True, restart_time=3600)
+    assert len(read_sensor_csv(sensor_file)) == 6
+    for t in np.arange(7, 13) * 600.0:
+        problem.solve(t)
+        sink(problem, t)
+
+    time = read_sensor_csv(sensor_file).time.values.quantity.magnitude
+    assert len(np.unique(time)) == len(time)
+    assert time == pytest.approx(np.arange(1, 13) * 600)
+
+    # same rows as the data in memory
+    data = read_sensor_csv(sensor_file, output_times=[1200, 7200])
+    assert data.time.values.quantity.magnitude == pytest.approx([1200, 7200])
+    assert data.temperature.values.quantity.magnitude == pytest.approx(
+        sensor_dataframe(problem, output_times=[1200, 7200]).temperature.values.quantity.magnitude
+    )
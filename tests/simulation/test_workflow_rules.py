@@ -0,0 +1,33 @@
+import json
+import shutil
+from pathlib import Path
+
+import fenics_concrete  # the hydration and FE rules require FEniCS
+import pytest
+
+from lebedigital.demonstrator_scripts.workflow_evaluator import WorkflowEvaluator
+from lebedigital.demonstrator_scripts.workflow_rules import RULES, rule_inputs, rule_output, run_rule
+
+WORKFLOW_PATH = Path(__file__).parents[2] / "usecases" / "optimization_paper" / "optimization_workflow"
+
+
+def test_fem_rules(tmp_path):
+    # a short simulation, the full workflow with the hydration and FE model
+    shutil.copytree(WORKFLOW_PATH / "Inputs", tmp_path / "Inputs")
+    (tmp_path / "Results").mkdir()
+    with open(tmp_path / "Inputs" / "fem_control.json") as f:
+        fem_control = json.load(f)
+    fem_control["full_time"] = {"value": 2, "unit": "h"}
+    with open(tmp_path / "Inputs" / "fem_control.json", "w") as f:
+        json.dump(fem_control, f)
+
+    for rule in RULES:
+        run_rule(rule, [tmp_path / node for node in rule_inputs(rule)], tmp_path / rule_output(rule))
+    assert (tmp_path / "Results" / "demonstrator_beam.xdmf").exists()
+
+    nodes = WorkflowEvaluator(WORKFLOW_PATH).evaluate(
+        {"Inputs/fem_control.json": {"full_time": 2}}, tmp_path / "evaluator"
+    )
+    with open(tmp_path / "Results" / "kpi_from_fem.json") as f:
+        for key, value in json.load(f).items():
+            assert nodes["Results/kpi_from_fem.json"][key].to(value["unit"]).magnitude == pytest.approx(value["value"])
@@ -0,0 +1,160 @@
+import threading
+
+import pytest
+
+from lebedigital.demonstrator_scripts.approximate_tensile_strength import approximate_tensile_strength
+from lebedigital.demonstrator_scripts.beam_design import check_beam_design
+from lebedigital.demonstrator_scripts.computation_volume_content import computation_volume_content
+from lebedigital.memoization import active_cache, canonical_key, memoization, memoized
+from lebedigital.profiling import profiling
+from lebedigital.unit_registry import ureg
+
+calls = []
+
+
+@memoized("geometry")
+def geometry(width, height, scale=1.0):
+    calls.append((width, height))
+    return {"area": width * height * scale, "sides": [width, height]}
+
+
+def test_canonical_key():
+    assert canonical_key(1 * ureg("m")) == canonical_key(1000 * ureg("mm"))
+    assert canonical_key(0.1 + 0.2) == canonical_key(0.3)
+    assert canonical_key(1 * ureg("m")) != canonical_key(1 * ureg("s"))
+    assert canonical_key({"a": 1, "b": 2.0}) == canonical_key({"b": 2.0, "a": 1})
+    with pytest.raises(TypeError):
+        canonical_key(object())
+
+
+def test_memoization_disabled():
+    calls.clear()
+    assert active_cache() is None
+    geometry(1 * ureg("m"), 2 * ureg("m"))
+    geometry(1 * ureg("m"), 2 * ureg("m"))
+    assert len(calls) == 2
+
+
+def test_memoization():
+    calls.clear()
+    with memoization(maxsize=2) as cache, profiling(enabled=True) as profile:
+        first = geometry(1 * ureg("m"), 2 * ureg("m"))
+        # same physical input, positional and keyword arguments
+        second = geometry(1000 * ureg("mm"), height=2 * ureg("m"), scale=1.0)
+        assert len(calls) == 1
+        assert second["area"] == first["area"]
+
+        # results are copies, changing them does not change the cache
+        second["sides"].append(0)
+        assert len(geometry(1 * ureg("m"), 2 * ureg("m"))["sides"]) == 2
+
+        # least recently used entries are dropped
+        geometry(2 * ureg("m"), 2 * ureg("m"))
+        geometry(3 * ureg("m"), 2 * ureg("m"))
+        geometry(1 * ureg("m"), 2 * ureg("m"))
+        assert len(calls) == 4
+        assert len(cache.entries) == 2
+
+    assert active_cache() is None
+    assert profile.counters["geometry.cache_hit"] == 2
+    assert profile.counters["geometry.cache_miss"] == 4
+
+
+def test_memoization_on_disk(tmp_path):
+    calls.clear()
+    with memoization(cache_dir=tmp_path):
+        first = geometry(1 * ureg("m"), 2 * ureg("m"))
+    # a new cache, e.g. in the next process, reads the stored result
+    with memoization(cache_dir=tmp_path) as cache:
+        second = geometry(1 * ureg("m"), 2 * ureg("m"))
+    assert len(calls) == 1
+    assert cache.hits == 1
+    assert second["area"] == first["area"]
+    assert second["area"].units == ureg("m^2").units
+    # only the results are stored, no temporary files
+    assert all(path.suffix == ".pkl" for path in tmp_path.iterdir())
+
+
+def test_memoization_corrupt_file(tmp_path):
+    calls.clear()
+    with memoization(cache_dir=tmp_path):
+        geometry(1 * ureg("m"), 2 * ureg("m"))
+    # e.g. a file truncated by a crash or a pickle of another version, treated as a miss and written again
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"\x80\x04")
+    with memoization(cache_dir=tmp_path) as cache:
+        assert geometry(1 * ureg("m"), 2 * ureg("m"))["area"] == 2 * ureg("m^2")
+    assert cache.misses == 1
+    assert len(calls) == 2
+    with memoization(cache_dir=tmp_path) as cache:
+        geometry(1 * ureg("m"), 2 * ureg("m"))
+    assert cache.hits == 1
+
+
+def test_memoized_demonstrator_functions():
+    with memoization() as cache:
+        assert approximate_tensile_strength(30 * ureg("MPa")) == approximate_tensile_strength(30e6 * ureg("Pa"))
+        design = check_beam_design(
+            span=6750 * ureg("mm"),
+            width=200 * ureg("mm"),
+            height=600 * ureg("mm"),
+            point_load=100 * ureg("kN"),
+            distributed_load=0 * ureg("N/mm"),
+            compr_str_concrete=35 * ureg("N/mm^2"),
+            yield_str_steel=500 * ureg("N/mm^2"),
+            steel_dia_bu=10 * ureg("mm"),
+            cover_min=2.5 * ureg("cm"),
+        )
+        positional = check_beam_design(
+            6750 * ureg("mm"),
+            200 * ureg("mm"),
+            600 * ureg("mm"),
+            100 * ureg("kN"),
+            0 * ureg("N/mm"),
+            35 * ureg("N/mm^2"),
+            500 * ureg("N/mm^2"),
+            10 * ureg("mm"),
+            25 * ureg("mm"),
+        )
+        assert positional == design
+    assert cache.hits == 2
+
+
+def test_memoization_thread():
+    # the cache is only active in the thread that enabled it
+    active = []
+    with memoization():
+        thread = threading.Thread(target=lambda: active.append(active_cache()))
+        thread.start()
+        thread.join()
+        assert active_cache() is not None
+    assert active == [None]
+
+
+def test_memoized_input_not_modified():
+    mix = {
+        "density_cem": 3.1 * ureg("g/cm^3"),
+        "density_sub": 2850 * ureg("kg/m^3"),
+        "density_water": 998 * ureg("kg/m^3"),
+        "density_aggregates": 2.7 * ureg("kg/dm^3"),
+        "wb_mass_ratio": 0.35 * ureg("dimensionless"),
+        "sc_mass_fraction": 0.2 * ureg("dimensionless"),
+        "aggregates_volume_fraction": 0.7 * ureg("dimensionless"),
+    }
+    with memoization() as cache:
+        first = computation_volume_content(mix)
+        second = computation_volume_content(mix)
+    assert cache.hits == 1
+    assert first == second
+    assert "plasticizer_volume_content" not in mix
+    assert str(mix["density_cem"].units) == "gram / centimeter ** 3"
+
+
+def test_memoization_continued_cache():
+    calls.clear()
+    with memoization() as cache:
+        geometry(1 * ureg("m"), 2 * ureg("m"))
+    # e.g. the next evaluation of a workflow evaluator
+    with memoization(cache=cache):
+        geometry(1 * ureg("m"), 2 * ureg("m"))
+    assert len(calls) == 1
@@ -0,0 +1,58 @@
+import json
+import logging
+
+from lebedigital.profiling import active_profile, count, profiled, profiling, timed, timer
+
+
+@timed("square")
+def square(x):
+    count("square.calls")
+    return x**2
+
+
+@profiled("run")
+def run(x, profile_path=None):
+    with timer("phase"):
+        return square(x)
+
+
+def test_profiling_disabled():
+    # without an active profile the timers and counters do nothing
+    assert active_profile() is None
+    with timer("phase"):
+        assert square(2) == 4
+    assert active_profile() is None
+
+
+def test_profiling(tmp_path):
+    with profiling(enabled=True, name="test") as profile:
+        for x in range(3):
+            square(x)
+
+    assert active_profile() is None
+    assert profile.timers["square"]["calls"] == 3
+    assert profile.counters["square.calls"] == 3
+    assert "square" in profile.summary()
+
+
+def test_profiled(tmp_path, capsys, caplog):
+    profile_path = tmp_path / "profile.json"
+    with caplog.at_level(logging.INFO, logger="lebedigital.profiling"):
+        assert run(3, profile_path=profile_path) == 9
+
+    # the summary is logged, nothing is printed
+    assert capsys.readouterr().out == ""
+    assert "square" in caplog.text
+
+    with open(profile_path) as f:
+        profile = json.load(f)
+    assert profile["name"] == "run"
+    assert set(profile["timers"]) == {"run", "phase", "square"}
+    assert profile["timers"]["phase"]["total"] <= profile["timers"]["run"]["total"] <= profile["total_time"]
+    assert profile["counters"] == {"square.calls": 1}
+
+    # nested runs record into the outer profile
+    with profiling(enabled=True) as profile:
+        run(3, profile_path=tmp_path / "nested.json")
+    assert not (tmp_path / "nested.json").exists()
+    assert profile.timers["run"]["calls"] == 1
@@ -0,0 +1,46 @@
+import pint
+import pytest
+
+from lebedigital.unit_registry import ureg
+from lebedigital.unit_schema import UnitSchema, magnitude
+
+
+def test_unit_schema():
+    schema = UnitSchema({"length": "m", "T_0": "degree_Celsius", "E": "N/m^2", "nu": ""})
+    parameters = {
+        "length": 250 * ureg("cm"),
+        "T_0": ureg.Quantity(300, ureg.kelvin),
+        "E": 30 * ureg("GPa"),
+        "nu": 0.2 * ureg(""),
+        "mesh_density": 4 * ureg(""),  # not in the schema, the unit is only removed
+        "log_level": "WARNING",
+    }
+
+    magnitudes = schema.to_magnitudes(parameters)
+
+    assert magnitudes["length"] == pytest.approx(2.5)
+    assert magnitudes["T_0"] == pytest.approx(26.85)
+    assert magnitudes["E"] == pytest.approx(30e9)
+    assert magnitudes["nu"] == pytest.approx(0.2)
+    assert magnitudes["mesh_density"] == 4
+    assert magnitudes["log_level"] == "WARNING"
+
+    # the input is not modified
+    assert parameters["length"].units == ureg("cm").units
+    assert parameters["T_0"].magnitude == 300
+
+
+def test_unit_schema_errors():
+    schema = UnitSchema({"length": "m", "width": "m"})
+    with pytest.raises(KeyError):
+        schema.to_magnitudes({"length": 1 * ureg("m")})
+    with pytest.raises(pint.DimensionalityError):
+        schema.to_magnitudes({"length": 1 * ureg("m"), "width": 1 * ureg("s")})
+
+
+def test_magnitude():
+    assert magnitude(2 * ureg("hours"), "s") == pytest.approx(7200)
+    assert magnitude(ureg.Quantity(68, ureg.degF), "degree_Celsius") == pytest.approx(20)
+    # the schemas can be combined
+    schema = UnitSchema({"length": "m"}) + {"width": "mm"}
+    assert schema.units == {"length": "m", "width": "mm"}
@@ -5,6 +5,8 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from lebedigital.demonstrator_scripts.workflow_evaluator import evaluate_samples, get_evaluator
+
 
 def update_json(file_path: Path, key: str, value):
     # Read the JSON file
@@ -27,7 +29,26 @@ def load_json(path: Path) -> dict:
     return data
 
 
-def get_kpis(input: dict, path: Path) -> dict:
+def get_kpis(input: dict, path: Path, working_dir: Path = None, evaluator=None) -> dict:
+    """
+    Runs the workflow in-process and returns the KPIs for objective and constraints for a given value of the design
+    variables, see `workflow_evaluator.WorkflowEvaluator`. The inputs on disk are not changed.
+    Args:
+        input: dict with the design variables and the aggregate ratio and slag ratio
+        path: Path to the workflow directory
+        working_dir: Path for the results of this evaluation, defaults to the Results directory of the workflow
+        evaluator: optional WorkflowEvaluator, defaults to the one of the workflow in this process (the inputs are
+            read at the first call only)
+    Returns:
+        kpis : dict with all the KPIs
+
+    """
+    working_dir = Path(path) / "Results" if working_dir is None else working_dir
+    evaluator = get_evaluator(path) if evaluator is None else evaluator
+    return evaluator.get_kpis(input["height"], input["slag_ratio"], working_dir)
+
+
+def get_kpis_snakemake(input: dict, path: Path) -> dict:
     """
     Runs the snakemake workflow and the returns the KPIs for objective and constraints for a given value of the design
     variables.
@@ -79,35 +100,24 @@ if __name__ == "__main__":
     height_list = [1200]
     slag_ratio_list = [0.5]
 
-    df = pd.DataFrame()
-
-    for i, height in enumerate(height_list):
-        for j, slag_ratio in enumerate(slag_ratio_list):
-            # remove all files from the directory output_path
-            for file in os.listdir(output_path):
-                os.remove(output_path / file)
-
-            total = len(height_list) * len(slag_ratio_list)
-            current = i * len(slag_ratio_list) + j + 1
-            print("___________________________________________________________")
-            print(f" {current}/{total}     RUN WORKFLOW WITH {height} {slag_ratio}")
-            print("___________________________________________________________")
-            inputs = {"height": height, "slag_ratio": slag_ratio}
-            results = get_kpis(inputs, path_to_workflow)
-
-            new_row = {
-                "height": inputs["height"],
-                "slag_ratio": inputs["slag_ratio"],
-                "gwp": results["gwp_beam"]["value"],
-                "constraint_beam_design": results["constraint_beam_design"]["value"],
-                "constraint_temperature": results["constraint_temperature"]["value"],
-                "constraint_time": results["constraint_time"]["value"],
+    # all samples are evaluated concurrently, each in its own directory output_path/sample_<i>
+    samples = [(height, slag_ratio) for height in height_list for slag_ratio in slag_ratio_list]
+    print(f"RUN WORKFLOW FOR {len(samples)} SAMPLES")
+    results = evaluate_samples(path_to_workflow, samples, output_path, cache_dir=output_path / "cache")
+
+    rows = []
+    for (height, slag_ratio), kpis in zip(samples, results):
+        rows.append(
+            {
+                "height": height,
+                "slag_ratio": slag_ratio,
+                "gwp": kpis["gwp_beam"]["value"],
+                "constraint_beam_design": kpis["constraint_beam_design"]["value"],
+                "constraint_temperature": kpis["constraint_temperature"]["value"],
+                "constraint_time": kpis["constraint_time"]["value"],
             }
-
-            # build new pandas dataframe from dictionary
-            new_df = pd.DataFrame(new_row, index=[0])
-            # add new row to existing dataframe
-            df = pd.concat([df, new_df], ignore_index=True)
+        )
+    df = pd.DataFrame(rows)
 
     # df.to_csv(f"kpis_{inputs['agg_ratio']}_{inputs['slag_ratio']}.csv",index=False)
     df.to_csv(f"kpis.csv", index=False)
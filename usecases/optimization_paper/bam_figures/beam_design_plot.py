@@ -1,7 +1,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-from lebedigital.demonstrator_scripts.beam_design import check_beam_design
+from lebedigital.demonstrator_scripts.beam_design import check_beam_design_vectorized
 from lebedigital.unit_registry import ureg
 
 
@@ -27,7 +27,7 @@ def simple_setup(input_parameter, height, fc, load):
         dictionary containing the output parameters
     """
 
-    out = check_beam_design(
+    out = check_beam_design_vectorized(
         span=input_parameter["beamExSpan"] * ureg(input_parameter["beamExSpanUnit"]),
         width=input_parameter["beamExWidth"] * ureg(input_parameter["beamExWidthUnit"]),
         height=height,
@@ -70,31 +70,19 @@ def beam_design_plot(input_parameter, n, fig_path: str = "beam_design_plot.pdf",
         order_list = [1 if item == "fc" else item for item in order_list]
         order_list = [2 if item == "load" else item for item in order_list]
 
-        crosssections = np.zeros(shape=(len(x_list), len(y_list)))
-        fc_errors = np.zeros(shape=(len(x_list), len(y_list)))
-        A_errors = np.zeros(shape=(len(x_list), len(y_list)))
-        constraint = np.zeros(shape=(len(x_list), len(y_list)))
-
+        # all combinations in one call, x along the first and y along the second axis
         values = [0, 0, 0]
         values[order_list[2]] = constant
-        max_admissable_area = 0.0
-        for i, x in enumerate(x_list):
-            values[order_list[0]] = x
-            for j, y in enumerate(y_list):
-                values[order_list[1]] = y
-
-                out = simple_setup(input_parameter, *values)
-                crosssection = out["crosssection"]
-                crosssection.ito(crosssection_unit)
-                crosssection = crosssection.magnitude
-                crosssections[i][j] = crosssection
-                fc_errors[i][j] = out["constraint_min_fc"]
-                A_errors[i][j] = out["constraint_max_steel_area"]
-                constraint[i][j] = out["constraint_beam_design"]
-
-                if constraint[i][j] <= 0:
-                    if max_admissable_area < crosssections[i][j]:
-                        max_admissable_area = crosssections[i][j]
+        values[order_list[0]] = x_list[:, np.newaxis]
+        values[order_list[1]] = y_list[np.newaxis, :]
+
+        out = simple_setup(input_parameter, *values)
+        crosssections = out["crosssection"].to(crosssection_unit).magnitude
+        fc_errors = out["constraint_min_fc"].magnitude
+        A_errors = out["constraint_max_steel_area"].magnitude
+        constraint = out["constraint_beam_design"].magnitude
+
+        max_admissable_area = np.max(crosssections[constraint <= 0], initial=0.0)
 
         return crosssections, fc_errors, A_errors, constraint, max_admissable_area
 
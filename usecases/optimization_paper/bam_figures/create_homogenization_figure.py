@@ -4,7 +4,7 @@ import pint
 import pytest
 from pint.testsuite.helpers import assert_quantity_almost_equal as assert_approx
 
-from lebedigital.simulation.concrete_homogenization import concrete_homogenization
+from lebedigital.simulation.mori_tanaka import vectorized_homogenization
 from lebedigital.unit_registry import ureg
 
 
@@ -50,28 +50,15 @@ def create_homogenization_figure(parameter_with_units: dict, fig_path: str = "ho
     aggregates_vol_frac_list = np.arange(0, 1 + step_size, step_size)
     assert aggregates_vol_frac_list.max() <= 1.0
 
-    E_list = []
-    nu_list = []
-    fc_list = []
-    kappa_list = []
-    Q_list = []
+    # all volume fractions in one call
+    parameters["aggregates_vol_frac"] = aggregates_vol_frac_list * ureg("dimensionless")
+    results = vectorized_homogenization(parameters)
 
-    for value in aggregates_vol_frac_list:
-        parameters["aggregates_vol_frac"] = value * ureg("dimensionless")
-
-        results = concrete_homogenization(parameters)
-
-        E_list.append(results["E"].magnitude)
-        nu_list.append(results["nu"].magnitude)
-        fc_list.append(results["fc"].magnitude)
-        kappa_list.append(results["kappa"].magnitude)
-        Q_list.append(results["Q"].magnitude)
-
-    E_list = E_list * results["E"].units
-    nu_list = nu_list * results["nu"].units
-    fc_list = fc_list * results["fc"].units
-    kappa_list = kappa_list * results["kappa"].units
-    Q_list = Q_list * results["Q"].units
+    E_list = results["E"]
+    nu_list = results["nu"]
+    fc_list = results["fc"]
+    kappa_list = results["kappa"]
+    Q_list = results["Q"]
 
     # #ureg.setup_matplotlib(enable=False)
     # ureg2 = pint.UnitRegistry(auto_reduce_dimensions=True)